@@ -0,0 +1,55 @@
+"""Add reservation interval indexes
+
+Revision ID: 3a51c2e8d9b4
+Revises: f0704b043916
+Create Date: 2026-10-18 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3a51c2e8d9b4'
+down_revision: Union[str, None] = 'f0704b043916'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_reservation_meetingroom_id_from_reserve_to_reserve',
+        'reservation',
+        ['meetingroom_id', 'from_reserve', 'to_reserve'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_reservation_meetingroom_id_to_reserve',
+        'reservation',
+        ['meetingroom_id', 'to_reserve'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_reservation_from_reserve_to_reserve',
+        'reservation',
+        ['from_reserve', 'to_reserve'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_reservation_user_id', 'reservation', ['user_id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reservation_user_id', table_name='reservation')
+    op.drop_index(
+        'ix_reservation_from_reserve_to_reserve', table_name='reservation'
+    )
+    op.drop_index(
+        'ix_reservation_meetingroom_id_to_reserve', table_name='reservation'
+    )
+    op.drop_index(
+        'ix_reservation_meetingroom_id_from_reserve_to_reserve',
+        table_name='reservation'
+    )
@@ -0,0 +1,46 @@
+"""Make reservation intervals half-open
+
+Revision ID: 5f3b8e1d2a47
+Revises: e4b9a7d2c615
+Create Date: 2026-10-18 21:12:44.318207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f3b8e1d2a47'
+down_revision: Union[str, None] = 'e4b9a7d2c615'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def replace_constraint(bounds: str) -> None:
+    op.execute(
+        'ALTER TABLE reservation '
+        'DROP CONSTRAINT ex_reservation_meetingroom_id_interval'
+    )
+    op.execute(
+        'ALTER TABLE reservation '
+        'ADD CONSTRAINT ex_reservation_meetingroom_id_interval '
+        'EXCLUDE USING gist ('
+        'meetingroom_id WITH =, '
+        f"tsrange(from_reserve, to_reserve, '{bounds}') WITH &&"
+        ')'
+    )
+
+
+def upgrade() -> None:
+    # Бронирования встык не пересекаются: так же считают проверки
+    # конфликтов и свободные слоты, которые возвращает API.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    replace_constraint('[)')
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    replace_constraint('[]')
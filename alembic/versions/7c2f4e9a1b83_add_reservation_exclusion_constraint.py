@@ -0,0 +1,42 @@
+"""Add reservation exclusion constraint
+
+Revision ID: 7c2f4e9a1b83
+Revises: 3a51c2e8d9b4
+Create Date: 2026-10-18 11:40:07.524911
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2f4e9a1b83'
+down_revision: Union[str, None] = '3a51c2e8d9b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Ограничения исключения есть только в PostgreSQL; на других СУБД
+    # записи по одной комнате упорядочивает CRUDReservation.lock_rooms.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute('CREATE EXTENSION IF NOT EXISTS btree_gist')
+    op.execute(
+        'ALTER TABLE reservation '
+        'ADD CONSTRAINT ex_reservation_meetingroom_id_interval '
+        'EXCLUDE USING gist ('
+        'meetingroom_id WITH =, '
+        "tsrange(from_reserve, to_reserve, '[]') WITH &&"
+        ')'
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute(
+        'ALTER TABLE reservation '
+        'DROP CONSTRAINT ex_reservation_meetingroom_id_interval'
+    )
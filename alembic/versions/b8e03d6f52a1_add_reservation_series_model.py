@@ -0,0 +1,50 @@
+"""Add ReservationSeries model
+
+Revision ID: b8e03d6f52a1
+Revises: 7c2f4e9a1b83
+Create Date: 2026-10-18 14:22:53.810462
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e03d6f52a1'
+down_revision: Union[str, None] = '7c2f4e9a1b83'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'reservationseries',
+        sa.Column('from_reserve', sa.DateTime(), nullable=True),
+        sa.Column('to_reserve', sa.DateTime(), nullable=True),
+        sa.Column('frequency', sa.String(length=10), nullable=True),
+        sa.Column('interval', sa.Integer(), nullable=True),
+        sa.Column('count', sa.Integer(), nullable=True),
+        sa.Column('until', sa.DateTime(), nullable=True),
+        sa.Column('last_to_reserve', sa.DateTime(), nullable=True),
+        sa.Column('meetingroom_id', sa.Integer(), nullable=True),
+        sa.Column('user_id', sa.Integer(), nullable=True),
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['meetingroom_id'], ['meetingroom.id'], ),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_reservationseries_room_interval',
+        'reservationseries',
+        ['meetingroom_id', 'from_reserve', 'last_to_reserve'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'ix_reservationseries_room_interval', table_name='reservationseries'
+    )
+    op.drop_table('reservationseries')
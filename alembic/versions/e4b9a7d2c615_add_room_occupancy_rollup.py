@@ -0,0 +1,96 @@
+"""Add room occupancy rollup
+
+Revision ID: e4b9a7d2c615
+Revises: b8e03d6f52a1
+Create Date: 2026-10-18 18:05:37.204518
+
+"""
+from datetime import timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b9a7d2c615'
+down_revision: Union[str, None] = 'b8e03d6f52a1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CHUNK_SIZE = 10_000
+
+
+def upgrade() -> None:
+    occupancy_table = op.create_table(
+        'roomoccupancy',
+        sa.Column('meetingroom_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('hour', sa.Integer(), nullable=False),
+        sa.Column('seconds', sa.Float(), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['meetingroom_id'], ['meetingroom.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_roomoccupancy_meetingroom_id_day_hour',
+        'roomoccupancy',
+        ['meetingroom_id', 'day', 'hour'],
+        unique=True,
+    )
+    op.create_index(
+        'ix_roomoccupancy_day', 'roomoccupancy', ['day'], unique=False
+    )
+
+    # Заполнение по существующим бронированиям. Бронирование разбивается
+    # по часам суток и учитывается в количестве в часе своего начала.
+    reservation = sa.table(
+        'reservation',
+        sa.column('meetingroom_id', sa.Integer()),
+        sa.column('from_reserve', sa.DateTime()),
+        sa.column('to_reserve', sa.DateTime()),
+    )
+    occupancy = {}
+    reservations = op.get_bind().execute(
+        sa.select(
+            reservation.c.meetingroom_id,
+            reservation.c.from_reserve,
+            reservation.c.to_reserve,
+        ).where(reservation.c.meetingroom_id.is_not(None))
+    )
+    for meetingroom_id, from_reserve, to_reserve in reservations:
+        count = 1
+        hour_start = from_reserve.replace(minute=0, second=0, microsecond=0)
+        while hour_start < to_reserve:
+            hour_end = hour_start + timedelta(hours=1)
+            key = (meetingroom_id, hour_start.date(), hour_start.hour)
+            totals = occupancy.setdefault(key, [0.0, 0])
+            totals[0] += (
+                min(to_reserve, hour_end) - max(from_reserve, hour_start)
+            ).total_seconds()
+            totals[1] += count
+            count = 0
+            hour_start = hour_end
+    rows = [
+        {
+            'meetingroom_id': meetingroom_id,
+            'day': day,
+            'hour': hour,
+            'seconds': seconds,
+            'count': count,
+        }
+        for (meetingroom_id, day, hour), (seconds, count)
+        in occupancy.items()
+    ]
+    for start in range(0, len(rows), CHUNK_SIZE):
+        op.bulk_insert(occupancy_table, rows[start:start + CHUNK_SIZE])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_roomoccupancy_day', table_name='roomoccupancy')
+    op.drop_index(
+        'ix_roomoccupancy_meetingroom_id_day_hour',
+        table_name='roomoccupancy',
+    )
+    op.drop_table('roomoccupancy')
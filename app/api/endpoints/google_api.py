@@ -1,19 +1,12 @@
+import asyncio
 from datetime import datetime
 
-from aiogoogle import Aiogoogle
-from fastapi import APIRouter, Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, HTTPException
 
-from app.core.db import get_async_session
-from app.core.google_client import get_service
+from app.api.validators import check_report_job_exists, check_time_window
 from app.core.user import current_superuser
-
-from app.crud.reservation import reservation_crud
-from app.services.google_api import (
-    spreadsheets_create,
-    set_user_permissions,
-    spreadsheets_update_value
-)
+from app.schemas.report import ReportJobDB
+from app.services.report_jobs import report_workers
 
 
 router = APIRouter()
@@ -21,22 +14,36 @@ router = APIRouter()
 
 @router.post(
     '/',
-    response_model=list[dict[str, int]],
+    response_model=ReportJobDB,
+    status_code=202,
     dependencies=[Depends(current_superuser)],
 )
 async def get_report(
         from_reserve: datetime,
         to_reserve: datetime,
-        session: AsyncSession = Depends(get_async_session),
-        wrapper_services: Aiogoogle = Depends(get_service)
 ):
+    """
+    Только для суперюзеров.
+
+    Ставит построение отчета в очередь и сразу возвращает задачу.
+    Состояние задачи и идентификатор таблицы доступны по GET /google/{id}.
+    """
+    check_time_window(from_reserve, to_reserve)
+    try:
+        job = await report_workers.submit(from_reserve, to_reserve)
+    except asyncio.QueueFull:
+        raise HTTPException(
+            status_code=503,
+            detail='Очередь отчетов переполнена, повторите позже!'
+        )
+    return job
+
+
+@router.get(
+    '/{job_id}',
+    response_model=ReportJobDB,
+    dependencies=[Depends(current_superuser)],
+)
+async def get_report_job(job_id: str):
     """Только для суперюзеров."""
-    reservations = await reservation_crud.get_count_res_at_the_same_time(
-        from_reserve, to_reserve, session
-    )
-    spreadsheetid = await spreadsheets_create(wrapper_services)
-    await set_user_permissions(spreadsheetid, wrapper_services)
-    await spreadsheets_update_value(spreadsheetid,
-                                    reservations,
-                                    wrapper_services)
-    return reservations
+    return await check_report_job_exists(job_id)
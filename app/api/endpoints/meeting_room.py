@@ -1,15 +1,34 @@
-from fastapi import APIRouter, Depends
+import asyncio
+from datetime import datetime, timedelta
+
+from fastapi import (
+    APIRouter, Depends, Header, Query, Response, WebSocket,
+    WebSocketDisconnect, status
+)
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.db import get_async_session
+from app.core.config import settings
+from app.core.db import (
+    AsyncSessionLocal, get_async_session, get_read_session
+)
+from app.api.responses import meeting_room_list, room_reservation_list
 from app.crud.meeting_room import meeting_room_crud
 from app.crud.reservation import reservation_crud
+from app.crud.reservation_series import reservation_series_crud
 from app.schemas.meeting_room import (
-    MeetingRoomCreate, MeetingRoomDB, MeetingRoomUpdate
+    MeetingRoomCreate, MeetingRoomDB, MeetingRoomUpdate, RoomFreeSlots
+)
+from app.schemas.reservation import RoomReservationDB
+from app.api.validators import (
+    check_cursor, check_meeting_room_exists, check_meeting_room_found,
+    check_meeting_room_id_exists, check_name_duplicate, check_time_window
+)
+from app.services.events import room_events
+from app.services.free_slots import get_free_slots
+from app.services.versions import (
+    MEETING_ROOMS, change_versions, room_reservations_key
 )
-from app.schemas.reservation import ReservationDB
-from app.api.validators import check_meeting_room_exists, check_name_duplicate
 from app.core.user import current_superuser
 
 
@@ -22,13 +41,61 @@ router = APIRouter()
     response_model_exclude_none=True,
 )
 async def get_all_meeting_rooms(
+    limit: int = Query(settings.page_size, ge=1, le=settings.max_page_size),
+    cursor: str | None = None,
+    if_none_match: str | None = Header(None),
     session: AsyncSession = Depends(get_async_session),
 ):
     """
-    Получает список всех переговорных комнат.
+    Получает список переговорных комнат постранично.
+
+    Курсор следующей страницы возвращается в заголовке X-Next-Cursor.
+    Если список не менялся с ETag из If-None-Match, возвращается 304.
+    """
+    etag = change_versions.get_fresh_etag(MEETING_ROOMS, if_none_match)
+    if etag is not None:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag}
+        )
+    version = change_versions.get(MEETING_ROOMS)
+    all_rooms = await meeting_room_crud.get_multi(
+        session,
+        limit=limit,
+        after=check_cursor(meeting_room_crud, cursor),
+    )
+    headers = {'ETag': change_versions.make_etag(
+        version, datetime.now() + timedelta(seconds=settings.etag_max_age)
+    )}
+    next_cursor = meeting_room_crud.get_next_cursor(all_rooms, limit)
+    if next_cursor is not None:
+        headers['X-Next-Cursor'] = next_cursor
+    return meeting_room_list.response(all_rooms, headers, exclude_none=True)
+
+
+@router.get('/free_slots', response_model=list[RoomFreeSlots])
+async def get_free_slots_for_all_rooms(
+    from_reserve: datetime,
+    to_reserve: datetime,
+    min_duration: int = Query(30, ge=1, description='Минуты'),
+    session: AsyncSession = Depends(get_read_session),
+):
+    """
+    Получает свободные интервалы всех переговорных комнат в периоде.
+
+    Возвращаются интервалы не короче min_duration минут.
     """
-    all_rooms = await meeting_room_crud.get_multi(session)
-    return all_rooms
+    check_time_window(from_reserve, to_reserve)
+    room_ids = await meeting_room_crud.get_room_ids(session)
+    intervals = await reservation_crud.get_intervals_in_window(
+        from_reserve, to_reserve, session
+    )
+    return get_free_slots(
+        room_ids,
+        intervals,
+        from_reserve,
+        to_reserve,
+        timedelta(minutes=min_duration),
+    )
 
 
 @router.post(
@@ -61,17 +128,13 @@ async def partially_update_meeting_room(
 ):
     """Только для суперюзеров."""
 
-    meeting_room = await check_meeting_room_exists(
-        meeting_room_id, session
-    )
-
     if obj_in.name is not None:
         await check_name_duplicate(obj_in.name, session)
 
-    meeting_room = await meeting_room_crud.update(
-        meeting_room, obj_in, session
+    meeting_room = await meeting_room_crud.update_by_id(
+        meeting_room_id, obj_in, session
     )
-    return meeting_room
+    return check_meeting_room_found(meeting_room)
 
 
 @router.delete(
@@ -95,20 +158,106 @@ async def remove_meeting_room(
 
 @router.get(
     '/{meeting_room_id}/reservations',
-    response_model=list[ReservationDB],
+    response_model=list[RoomReservationDB],
     response_model_exclude={'user_id'},
 )
 async def get_reservations_for_room(
     meeting_room_id: int,
-    session: AsyncSession = Depends(get_async_session)
+    if_none_match: str | None = Header(None),
+    session: AsyncSession = Depends(get_read_session)
 ):
     """
-    Получает все бронирования для определенной переговорной комнаты.
+    Получает будущие бронирования определенной переговорной комнаты,
+    включая вхождения повторяющихся бронирований.
+
+    Если бронирования комнаты не менялись с ETag из If-None-Match,
+    возвращается 304 без запросов к базе данных. ETag действует до
+    окончания ближайшего бронирования или появления в списке нового
+    вхождения серии. Пока изменения могут не дойти до реплики, ETag
+    действует не дольше read_your_writes_seconds после изменения.
     """
-    await check_meeting_room_exists(
+    key = room_reservations_key(meeting_room_id)
+    etag = change_versions.get_fresh_etag(key, if_none_match)
+    if etag is not None:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag}
+        )
+    version = change_versions.get(key)
+    now = datetime.now()
+    await check_meeting_room_id_exists(
         meeting_room_id, session
     )
     reservations = await reservation_crud.get_future_reservations_for_room(
         meeting_room_id, session
     )
-    return reservations
+    horizon = timedelta(days=settings.recurrence_horizon_days)
+    next_occurrence = await reservation_series_crud.get_next_occurrence_start(
+        meeting_room_id, now + horizon, session
+    )
+    expires_at = [
+        now + timedelta(seconds=settings.etag_max_age),
+        *(reservation.to_reserve for reservation in reservations),
+    ]
+    if next_occurrence is not None:
+        expires_at.append(next_occurrence - horizon)
+    changed_at = change_versions.get_changed_at(key)
+    if settings.database_read_url is not None and changed_at is not None:
+        settled_at = changed_at + timedelta(
+            seconds=settings.read_your_writes_seconds
+        )
+        if settled_at > now:
+            expires_at.append(settled_at)
+    return room_reservation_list.response(reservations, {
+        'ETag': change_versions.make_etag(version, min(expires_at))
+    })
+
+
+@router.websocket('/{meeting_room_id}/reservations/ws')
+async def room_reservations_feed(
+    websocket: WebSocket,
+    meeting_room_id: int,
+):
+    """
+    Лента изменений бронирований переговорной комнаты.
+
+    Вместо периодического опроса списка бронирований клиент получает
+    его один раз и затем применяет события ленты в формате RoomEvent.
+    Если клиент не успевает читать события, соединение закрывается с
+    кодом 1013, после чего клиенту нужно заново получить список.
+    """
+    # Сессия открывается только на проверку комнаты, чтобы открытое
+    # соединение ленты не удерживало соединение с базой данных.
+    async with AsyncSessionLocal() as session:
+        room = await meeting_room_crud.get_cached(meeting_room_id, session)
+    if room is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    async with room_events.subscribe(meeting_room_id) as subscription:
+        await websocket.accept()
+
+        async def wait_disconnect() -> None:
+            try:
+                while True:
+                    await websocket.receive_text()
+            except WebSocketDisconnect:
+                pass
+            finally:
+                subscription.close()
+
+        receiver = asyncio.create_task(wait_disconnect())
+        try:
+            async for message in subscription:
+                await websocket.send_text(message)
+        except WebSocketDisconnect:
+            return
+        finally:
+            disconnected = receiver.done()
+            receiver.cancel()
+        if disconnected:
+            return
+        await websocket.close(
+            code=(
+                status.WS_1013_TRY_AGAIN_LATER if subscription.overflowed
+                else status.WS_1001_GOING_AWAY
+            )
+        )
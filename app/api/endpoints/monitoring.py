@@ -0,0 +1,45 @@
+from fastapi import APIRouter, Depends
+
+from app.core.cache import caches
+from app.core.db import engine, get_pool_statistics, read_engine
+from app.core.user import current_superuser
+
+
+router = APIRouter()
+
+
+@router.get(
+    '/db_pool',
+    response_model=dict[str, int | str],
+    dependencies=[Depends(current_superuser)],
+)
+async def get_db_pool_statistics():
+    """Только для суперюзеров."""
+    return get_pool_statistics(engine)
+
+
+@router.get(
+    '/db_read_pool',
+    response_model=dict[str, int | str],
+    dependencies=[Depends(current_superuser)],
+)
+async def get_db_read_pool_statistics():
+    """
+    Только для суперюзеров.
+
+    Совпадает с /db_pool, если реплика для чтения не задана.
+    """
+    return get_pool_statistics(read_engine)
+
+
+@router.get(
+    '/cache',
+    response_model=dict[str, dict[str, int | str]],
+    dependencies=[Depends(current_superuser)],
+)
+async def get_cache_statistics():
+    """Только для суперюзеров."""
+    return {
+        namespace: cache.get_statistics()
+        for namespace, cache in caches.items()
+    }
@@ -1,17 +1,43 @@
-from fastapi import APIRouter, Depends
+from datetime import datetime
+from typing import Annotated
+
+from fastapi import APIRouter, Body, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.db import get_async_session
+from app.core.config import settings
+from app.core.metrics import reservation_conflicts
+from app.core.db import (
+    get_async_session, get_read_session, get_read_sessionmaker
+)
+from app.api.responses import own_reservation_list, reservation_list
+from app.crud.meeting_room import meeting_room_crud
 from app.crud.reservation import reservation_crud
+from app.crud.reservation_series import reservation_series_crud
 from app.api.validators import (
-    check_meeting_room_exists,
-    check_reservation_before_edit,
+    check_cursor,
+    check_meeting_room_id_exists,
+    check_reservation_found,
     check_reservation_intersections,
+    check_reservation_update_intersections,
+    check_series_intersections,
+    check_series_removed,
+    check_time_window,
 )
 from app.schemas.reservation import (
-    ReservationCreate, ReservationDB, ReservationUpdate
+    BatchItemStatus, ExportFormat, ReservationBatchResult, ReservationCreate,
+    ReservationDB, ReservationUpdate
 )
+from app.schemas.event import RoomEventType
+from app.schemas.report import RoomStatistics
+from app.schemas.reservation_series import (
+    ReservationSeriesCreate, ReservationSeriesDB
+)
+from app.services.batch import find_batch_conflicts
+from app.services.events import build_room_event, room_events
+from app.services.export import MEDIA_TYPES, export_reservations
+from app.services.statistics import get_room_statistics
 from app.core.user import current_superuser, current_user
 from app.models import User
 
@@ -25,12 +51,87 @@ router = APIRouter()
     dependencies=[Depends(current_superuser)],
 )
 async def get_all_reservations(
-    session: AsyncSession = Depends(get_async_session)
+    limit: int = Query(settings.page_size, ge=1, le=settings.max_page_size),
+    cursor: str | None = None,
+    meetingroom_id: int | None = None,
+    user_id: int | None = None,
+    from_reserve: datetime | None = None,
+    to_reserve: datetime | None = None,
+    session: AsyncSession = Depends(get_read_session)
+):
+    """
+    Только для суперюзеров.
+
+    Бронирования выдаются постранично в порядке времени начала. Курсор
+    следующей страницы возвращается в заголовке X-Next-Cursor.
+    """
+
+    reservations = await reservation_crud.get_multi(
+        session,
+        limit=limit,
+        after=check_cursor(reservation_crud, cursor),
+        meetingroom_id=meetingroom_id,
+        user_id=user_id,
+        from_reserve=from_reserve,
+        to_reserve=to_reserve,
+        fields=reservation_list.fields,
+    )
+    headers = {}
+    next_cursor = reservation_crud.get_next_cursor(reservations, limit)
+    if next_cursor is not None:
+        headers['X-Next-Cursor'] = next_cursor
+    return reservation_list.response(reservations, headers)
+
+
+@router.get(
+    '/export',
+    response_class=StreamingResponse,
+    dependencies=[Depends(current_superuser)],
+)
+async def export_all_reservations(
+    request: Request,
+    export_format: ExportFormat = Query(ExportFormat.ndjson, alias='format'),
 ):
-    """Только для суперюзеров."""
+    """
+    Только для суперюзеров.
+
+    Потоково выгружает все бронирования в NDJSON или CSV.
+    """
+    return StreamingResponse(
+        export_reservations(
+            export_format,
+            get_read_sessionmaker(request.headers.get('authorization')),
+        ),
+        media_type=MEDIA_TYPES[export_format],
+        headers={
+            'Content-Disposition':
+                f'attachment; filename=reservations.{export_format.value}'
+        },
+    )
+
+
+@router.get(
+    '/statistics',
+    response_model=list[RoomStatistics],
+    dependencies=[Depends(current_superuser)],
+)
+async def get_reservation_statistics(
+    from_reserve: datetime,
+    to_reserve: datetime,
+    session: AsyncSession = Depends(get_read_session),
+):
+    """
+    Только для суперюзеров.
 
-    reservations = await reservation_crud.get_multi(session)
-    return reservations
+    Получает по каждой комнате число бронирований, забронированные часы,
+    загрузку и забронированные часы по часам суток. Бронирования
+    учитываются в части, попадающей в период.
+    """
+    check_time_window(from_reserve, to_reserve)
+    rows = await reservation_crud.get_period_occupancy(
+        from_reserve, to_reserve, session
+    )
+    return get_room_statistics(rows, from_reserve, to_reserve)
 
 
 @router.post('/', response_model=ReservationDB)
@@ -41,15 +142,142 @@ async def create_reservation(
 ):
     """
     Создает новое бронирование.
+
+    Проверка пересечений и запись выполняются атомарно в транзакции,
+    сериализованной по переговорной комнате.
     """
-    await check_meeting_room_exists(reservation.meetingroom_id, session)
-    await check_reservation_intersections(
-        **reservation.model_dump(), session=session
+    await check_meeting_room_id_exists(reservation.meetingroom_id, session)
+    async with reservation_crud.lock_rooms(
+        [reservation.meetingroom_id], session
+    ):
+        await check_reservation_intersections(
+            **reservation.model_dump(), session=session
+        )
+        new_reservation = await reservation_crud.create(
+            reservation, session, user
+        )
+    await room_events.publish(build_room_event(
+        RoomEventType.reservation_created, new_reservation, ReservationDB
+    ))
+    return new_reservation
+
+
+@router.post('/batch', response_model=list[ReservationBatchResult])
+async def create_reservations_batch(
+    reservations: Annotated[
+        list[ReservationCreate], Body(max_length=settings.max_batch_size)
+    ],
+    session: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_user),
+):
+    """
+    Создает пакет бронирований.
+
+    Пакет проверяется на пересечения с существующими бронированиями и
+    внутри себя, принятые бронирования создаются одним пакетным INSERT.
+    Для каждого бронирования возвращается результат создания.
+    """
+    results = [None] * len(reservations)
+    room_ids = await meeting_room_crud.get_existing_ids(
+        {reservation.meetingroom_id for reservation in reservations}, session
     )
-    new_reservation = await reservation_crud.create(
-        reservation, session, user
+    candidates = []
+    for index, reservation in enumerate(reservations):
+        if reservation.meetingroom_id in room_ids:
+            candidates.append((index, reservation))
+        else:
+            results[index] = ReservationBatchResult(
+                index=index,
+                status=BatchItemStatus.room_not_found,
+                detail='Переговорка не найдена!',
+            )
+    if not candidates:
+        return results
+    async with reservation_crud.lock_rooms(room_ids, session):
+        intervals = await reservation_crud.get_intervals_for_rooms(
+            room_ids,
+            min(reservation.from_reserve for _, reservation in candidates),
+            max(reservation.to_reserve for _, reservation in candidates),
+            session,
+        )
+        conflicts = find_batch_conflicts(
+            [reservation for _, reservation in candidates], intervals
+        )
+        accepted = []
+        for (index, reservation), intersections in zip(candidates, conflicts):
+            if intersections:
+                results[index] = ReservationBatchResult(
+                    index=index,
+                    status=BatchItemStatus.conflict,
+                    detail=str(intersections),
+                )
+            else:
+                accepted.append((index, reservation))
+        if len(accepted) < len(candidates):
+            reservation_conflicts.labels('batch').inc(
+                len(candidates) - len(accepted)
+            )
+        reservation_ids = await reservation_crud.create_many(
+            [reservation for _, reservation in accepted], session, user
+        )
+    for (index, reservation), reservation_id in zip(
+        accepted, reservation_ids
+    ):
+        results[index] = ReservationBatchResult(
+            index=index, status=BatchItemStatus.created, id=reservation_id
+        )
+        await room_events.publish(build_room_event(
+            RoomEventType.reservation_created,
+            ReservationDB(
+                id=reservation_id, user_id=user.id, **reservation.model_dump()
+            ),
+            ReservationDB,
+        ))
+    return results
+
+
+@router.post('/series', response_model=ReservationSeriesDB)
+async def create_reservation_series(
+    series: ReservationSeriesCreate,
+    session: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_user),
+):
+    """
+    Создает повторяющееся бронирование.
+
+    Серия хранится одним правилом, вхождения вычисляются при проверке
+    пересечений и выводе списков.
+    """
+    await check_meeting_room_id_exists(series.meetingroom_id, session)
+    async with reservation_crud.lock_rooms([series.meetingroom_id], session):
+        await check_series_intersections(
+            reservation_series_crud.build(series, user), session
+        )
+        new_series = await reservation_series_crud.create(
+            series, session, user
+        )
+    await room_events.publish(build_room_event(
+        RoomEventType.series_created, new_series, ReservationSeriesDB
+    ))
+    return new_series
+
+
+@router.delete('/series/{series_id}', response_model=ReservationSeriesDB)
+async def delete_reservation_series(
+    series_id: int,
+    session: AsyncSession = Depends(get_async_session),
+    user: User = Depends(current_user)
+):
+    """Для суперюзеров или создателей серии."""
+
+    series = await reservation_series_crud.remove_by_id(
+        series_id, session, *reservation_series_crud.get_owner_filters(user)
     )
-    return new_reservation
+    series = await check_series_removed(series, series_id, session, user)
+    await room_events.publish(build_room_event(
+        RoomEventType.series_deleted, series, ReservationSeriesDB
+    ))
+    return series
 
 
 @router.patch('/{reservation_id}', response_model=ReservationDB)
@@ -61,20 +289,31 @@ async def update_reservation(
 ):
     """Для суперюзеров или создателей объекта бронирования."""
 
-    reservation = await check_reservation_before_edit(
-        reservation_id, session, user
-    )
-    await check_reservation_intersections(
-        **obj_in.model_dump(),
-        reservation_id=reservation_id,
-        meetingroom_id=reservation.meetingroom_id,
-        session=session
-    )
-    reservation = await reservation_crud.update(
-        db_obj=reservation,
-        obj_in=obj_in,
-        session=session
-    )
+    async with reservation_crud.lock_reservation(
+        reservation_id,
+        session,
+        *reservation_crud.get_owner_filters(user),
+        columns=reservation_crud.get_intersection_flags(
+            obj_in.from_reserve, obj_in.to_reserve
+        ),
+    ) as row:
+        reservation = await check_reservation_found(
+            None if row is None else row.Reservation,
+            reservation_id,
+            session,
+            user,
+        )
+        await check_reservation_update_intersections(
+            row, obj_in.from_reserve, obj_in.to_reserve, session
+        )
+        reservation = await reservation_crud.update(
+            db_obj=reservation,
+            obj_in=obj_in,
+            session=session
+        )
+    await room_events.publish(build_room_event(
+        RoomEventType.reservation_updated, reservation, ReservationDB
+    ))
     return reservation
 
 
@@ -86,12 +325,15 @@ async def delete_reservation(
 ):
     """Для суперюзеров или создателей объекта бронирования."""
 
-    reservation = await check_reservation_before_edit(
-        reservation_id, session, user
+    reservation = await reservation_crud.remove_by_id(
+        reservation_id, session, *reservation_crud.get_owner_filters(user)
     )
-    reservation = await reservation_crud.remove(
-        reservation, session
+    reservation = await check_reservation_found(
+        reservation, reservation_id, session, user
     )
+    await room_events.publish(build_room_event(
+        RoomEventType.reservation_deleted, reservation, ReservationDB
+    ))
     return reservation
 
 
@@ -100,12 +342,12 @@ async def delete_reservation(
     response_model=list[ReservationDB],
     response_model_exclude={'user_id'},)
 async def get_my_reservations(
-    session: AsyncSession = Depends(get_async_session),
+    session: AsyncSession = Depends(get_read_session),
         user: User = Depends(current_user)
 ):
     """Получает список всех бронирований для текущего пользователя."""
 
     reservations = await reservation_crud.get_by_user(
-        session, user
+        session, user, fields=own_reservation_list.fields
     )
-    return reservations
+    return own_reservation_list.response(reservations)
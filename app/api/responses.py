@@ -0,0 +1,92 @@
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from fastapi import Response
+from pydantic import TypeAdapter
+from sqlalchemy import Row
+
+from app.schemas.meeting_room import MeetingRoomRow
+from app.schemas.reservation import (
+    OwnReservationRow, ReservationRow, RoomReservationRow
+)
+
+
+class ListSerializer:
+    """
+    Сериализатор списков строк в JSON без валидации Pydantic.
+
+    Схема сериализации строится один раз по TypedDict. Строки
+    передаются в сериализатор словарями полей без создания моделей и
+    без jsonable_encoder, JSON собирается pydantic-core.
+
+    Attributes:
+        fields (tuple[str, ...]): Поля строки в порядке вывода.
+        adapter (TypeAdapter): Сериализатор списка строк.
+    """
+
+    def __init__(self, row_type: type):
+        self.fields = tuple(row_type.__annotations__)
+        self.adapter = TypeAdapter(list[row_type])
+
+    def dump_json(
+            self,
+            rows: Iterable[Any],
+            exclude_none: bool = False,
+    ) -> bytes:
+        """
+        Сериализует строки в JSON.
+
+        Args:
+            rows (Iterable[Any]): Строки запроса, словари или объекты с
+                                  атрибутами полей. Отсутствующие
+                                  атрибуты выводятся как null.
+            exclude_none (bool, default = False): Не выводить поля со
+                                                  значением None.
+
+        Returns:
+            bytes: JSON-массив.
+        """
+        return self.adapter.dump_json(
+            [
+                row if isinstance(row, Mapping)
+                else row._asdict() if (
+                    isinstance(row, Row) and row._fields == self.fields
+                )
+                else {
+                    field: getattr(row, field, None) for field in self.fields
+                }
+                for row in rows
+            ],
+            exclude_none=exclude_none,
+        )
+
+    def response(
+            self,
+            rows: Iterable[Any],
+            headers: Mapping[str, str] | None = None,
+            exclude_none: bool = False,
+    ) -> Response:
+        """
+        Собирает JSON-ответ из строк.
+
+        Args:
+            rows (Iterable[Any]): Строки для сериализации.
+            headers (Mapping[str, str] or None, default = None): Заголовки
+                                                                 ответа.
+            exclude_none (bool, default = False): Не выводить поля со
+                                                  значением None.
+
+        Returns:
+            Response: Ответ с типом application/json.
+        """
+        return Response(
+            self.dump_json(rows, exclude_none),
+            media_type='application/json',
+            headers=headers,
+        )
+
+
+meeting_room_list = ListSerializer(MeetingRoomRow)
+reservation_list = ListSerializer(ReservationRow)
+own_reservation_list = ListSerializer(OwnReservationRow)
+room_reservation_list = ListSerializer(RoomReservationRow)
@@ -1,7 +1,8 @@
 from fastapi import APIRouter
 
 from app.api.endpoints import (
-    meeting_room_router, reservation_router, user_router, google_api_router
+    meeting_room_router, reservation_router, user_router, google_api_router,
+    monitoring_router
 )
 
 
@@ -16,3 +17,6 @@ main_router.include_router(user_router)
 main_router.include_router(
     google_api_router, prefix='/google', tags=['Google']
 )
+main_router.include_router(
+    monitoring_router, prefix='/monitoring', tags=['Monitoring']
+)
@@ -1,9 +1,19 @@
+from datetime import datetime
+from typing import Any
+
 from fastapi import HTTPException
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.metrics import reservation_conflicts
+from app.crud.base import CRUDBase
 from app.crud.meeting_room import meeting_room_crud
 from app.crud.reservation import reservation_crud
-from app.models import MeetingRoom, Reservation, User
+from app.crud.reservation_series import reservation_series_crud
+from app.models import MeetingRoom, Reservation, ReservationSeries, User
+from app.services.recurrence import find_series_conflicts
+from app.services.report_jobs import ReportJob, report_workers
+from app.services.interval_index import reservation_index
 
 
 async def check_name_duplicate(
@@ -54,26 +64,300 @@ async def check_meeting_room_exists(
     return meeting_room
 
 
+def check_meeting_room_found(
+        meeting_room: MeetingRoom | None,
+) -> MeetingRoom:
+    """
+    Проверяет, что запись переговорной комнаты затронула строку.
+
+    Parameters:
+        meeting_room (MeetingRoom or None): Результат записи по
+                                            идентификатору.
+
+    Returns:
+        MeetingRoom: Переговорная комната.
+
+    Raises:
+        HTTPException: Если переговорная комната не найдена.
+    """
+    if meeting_room is None:
+        raise HTTPException(
+            status_code=404,
+            detail='Переговорка не найдена!'
+        )
+    return meeting_room
+
+
+async def check_meeting_room_id_exists(
+        meeting_room_id: int,
+        session: AsyncSession,
+) -> None:
+    """
+    Проверяет существование переговорной комнаты через кеш комнат.
+
+    Используется там, где нужен только факт существования комнаты, а не
+    объект сессии для изменения.
+
+    Parameters:
+        meeting_room_id (int): Идентификатор переговорной комнаты.
+        session (AsyncSession): Сессия базы данных.
+
+    Raises:
+        HTTPException: Если переговорная комната не найдена.
+    """
+    meeting_room = await meeting_room_crud.get_cached(
+        meeting_room_id, session
+    )
+    if meeting_room is None:
+        raise HTTPException(
+            status_code=404,
+            detail='Переговорка не найдена!'
+        )
+
+
 async def check_reservation_intersections(**kwargs) -> None:
     """
     Проверяет пересечения бронирования с другими бронированиями.
 
+    Вызывается внутри транзакции записи, и ответ всегда дает база
+    данных, включая вхождения повторяющихся бронирований в проверяемом
+    периоде. Индекс интервалов служит только предварительным фильтром:
+    его записи устаревают, когда бронирования меняют другие процессы,
+    поэтому найденные в нём пересечения, не подтвержденные базой
+    данных, удаляются из индекса.
+
     Parameters:
         **kwargs: Параметры бронирования для проверки пересечений.
 
     Raises:
         HTTPException: Если есть пересечения с другими бронированиями.
     """
-    reservations = await reservation_crud.get_reservations_at_the_same_time(
-        **kwargs
+    candidates = []
+    if reservation_index.ready:
+        candidates = reservation_index.get_reservations_at_the_same_time(
+            from_reserve=kwargs['from_reserve'],
+            to_reserve=kwargs['to_reserve'],
+            meetingroom_id=kwargs['meetingroom_id'],
+            reservation_id=kwargs.get('reservation_id'),
+        )
+    reservations = (
+        await reservation_crud.get_reservations_at_the_same_time(**kwargs)
     )
+    confirmed = {reservation.id for reservation in reservations}
+    for candidate in candidates:
+        if candidate.id not in confirmed:
+            reservation_index.discard(candidate)
+    if not reservations:
+        reservations = (
+            await reservation_series_crud.get_occurrences_at_the_same_time(
+                from_reserve=kwargs['from_reserve'],
+                to_reserve=kwargs['to_reserve'],
+                meetingroom_ids=[kwargs['meetingroom_id']],
+                session=kwargs['session'],
+            )
+        )
+    if reservations:
+        reservation_conflicts.labels('reservation').inc()
+        raise HTTPException(
+            status_code=422,
+            detail=str(reservations)
+        )
+
+
+async def check_reservation_update_intersections(
+        row: Row,
+        from_reserve: datetime,
+        to_reserve: datetime,
+        session: AsyncSession,
+) -> None:
+    """
+    Проверяет пересечения нового интервала изменяемого бронирования по
+    признакам, прочитанным вместе с ним в `lock_reservation`.
+
+    Пересекающиеся бронирования и вхождения серий читаются отдельным
+    запросом только для ответа с ошибкой или если в периоде действует
+    серия комнаты.
+
+    Parameters:
+        row (Row): Строка с бронированием и признаками из
+                   `CRUDReservation.get_intersection_flags`.
+        from_reserve (datetime): Новое время начала бронирования.
+        to_reserve (datetime): Новое время окончания бронирования.
+        session (AsyncSession): Сессия базы данных.
+
+    Raises:
+        HTTPException: Если есть пересечения с другими бронированиями.
+    """
+    reservations = None
+    if row.intersects:
+        reservations = (
+            await reservation_crud.get_reservations_at_the_same_time(
+                from_reserve=from_reserve,
+                to_reserve=to_reserve,
+                meetingroom_id=row.Reservation.meetingroom_id,
+                reservation_id=row.Reservation.id,
+                session=session,
+            )
+        )
+    elif row.series_in_window:
+        reservations = (
+            await reservation_series_crud.get_occurrences_at_the_same_time(
+                from_reserve=from_reserve,
+                to_reserve=to_reserve,
+                meetingroom_ids=[row.Reservation.meetingroom_id],
+                session=session,
+            )
+        )
     if reservations:
+        reservation_conflicts.labels('reservation').inc()
         raise HTTPException(
             status_code=422,
             detail=str(reservations)
         )
 
 
+async def check_series_intersections(
+        series: ReservationSeries,
+        session: AsyncSession,
+) -> None:
+    """
+    Проверяет пересечения вхождений серии с бронированиями и вхождениями
+    других серий комнаты.
+
+    Parameters:
+        series (ReservationSeries): Проверяемая серия.
+        session (AsyncSession): Сессия базы данных.
+
+    Raises:
+        HTTPException: Если есть пересечения.
+    """
+    reservations = await reservation_crud.get_reservations_at_the_same_time(
+        from_reserve=series.from_reserve,
+        to_reserve=series.last_to_reserve,
+        meetingroom_id=series.meetingroom_id,
+        session=session,
+    )
+    other_series = await reservation_series_crud.get_series_in_window(
+        from_reserve=series.from_reserve,
+        to_reserve=series.last_to_reserve,
+        meetingroom_ids=[series.meetingroom_id],
+        series_id=series.id,
+        session=session,
+    )
+    conflicts = find_series_conflicts(series, reservations, other_series)
+    if conflicts:
+        reservation_conflicts.labels('series').inc()
+        raise HTTPException(
+            status_code=422,
+            detail=str(conflicts)
+        )
+
+
+async def check_series_before_edit(
+        series_id: int,
+        session: AsyncSession,
+        user: User,
+) -> ReservationSeries:
+    """
+    Проверяет возможность удаления повторяющегося бронирования.
+
+    Parameters:
+        series_id (int): Идентификатор серии.
+        session (AsyncSession): Сессия базы данных.
+        user (User): Текущий пользователь.
+
+    Returns:
+        ReservationSeries: Найденная серия.
+
+    Raises:
+        HTTPException: Если серия не найдена или пользователь не имеет
+        прав на удаление.
+    """
+    series = await reservation_series_crud.get(series_id, session)
+    if not series:
+        raise HTTPException(status_code=404, detail='Серия не найдена!')
+    if series.user_id != user.id and not user.is_superuser:
+        raise HTTPException(
+            status_code=403,
+            detail='Невозможно удалить чужую серию!'
+        )
+    return series
+
+
+async def check_series_removed(
+        series: ReservationSeries | None,
+        series_id: int,
+        session: AsyncSession,
+        user: User,
+) -> ReservationSeries:
+    """
+    Проверяет результат удаления серии с условием на владельца.
+
+    Причина отказа выясняется отдельным запросом только тогда, когда
+    серия не была удалена.
+
+    Parameters:
+        series (ReservationSeries or None): Удаленная серия.
+        series_id (int): Идентификатор серии.
+        session (AsyncSession): Сессия базы данных.
+        user (User): Текущий пользователь.
+
+    Returns:
+        ReservationSeries: Удаленная серия.
+
+    Raises:
+        HTTPException: Если серия не найдена или пользователь не имеет
+        прав на удаление.
+    """
+    if series is None:
+        await check_series_before_edit(series_id, session, user)
+        raise HTTPException(status_code=404, detail='Серия не найдена!')
+    return series
+
+
+def check_time_window(
+        from_reserve: datetime,
+        to_reserve: datetime,
+) -> None:
+    """
+    Проверяет, что начало периода раньше его окончания.
+
+    Parameters:
+        from_reserve (datetime): Начало периода.
+        to_reserve (datetime): Конец периода.
+
+    Raises:
+        HTTPException: Если начало периода не раньше окончания.
+    """
+    if from_reserve >= to_reserve:
+        raise HTTPException(
+            status_code=422,
+            detail='Начало периода должно быть раньше его окончания!'
+        )
+
+
+async def check_report_job_exists(job_id: str) -> ReportJob:
+    """
+    Проверяет существование задачи построения отчета.
+
+    Parameters:
+        job_id (str): Идентификатор задачи.
+
+    Returns:
+        ReportJob: Найденная задача.
+
+    Raises:
+        HTTPException: Если задача не найдена.
+    """
+    job = await report_workers.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=404,
+            detail='Задача не найдена!'
+        )
+    return job
+
+
 async def check_reservation_before_edit(
         reservation_id: int,
         session: AsyncSession,
@@ -106,3 +390,61 @@ async def check_reservation_before_edit(
         )
 
     return reservation
+
+
+async def check_reservation_found(
+        reservation: Reservation | None,
+        reservation_id: int,
+        session: AsyncSession,
+        user: User,
+) -> Reservation:
+    """
+    Проверяет результат выборки или удаления бронирования с условием на
+    владельца.
+
+    Причина отказа выясняется отдельным запросом только тогда, когда
+    бронирование не было найдено.
+
+    Parameters:
+        reservation (Reservation or None): Найденное или удаленное
+                                           бронирование.
+        reservation_id (int): Идентификатор бронирования.
+        session (AsyncSession): Сессия базы данных.
+        user (User): Текущий пользователь.
+
+    Returns:
+        Reservation: Бронирование.
+
+    Raises:
+        HTTPException: Если бронирование не найдено или пользователь не
+        имеет прав на редактирование или удаление.
+    """
+    if reservation is None:
+        await check_reservation_before_edit(reservation_id, session, user)
+        raise HTTPException(status_code=404, detail='Бронь не найдена!')
+    return reservation
+
+
+def check_cursor(
+        crud: CRUDBase,
+        cursor: str | None,
+) -> list[Any] | None:
+    """
+    Проверяет и декодирует курсор пагинации.
+
+    Parameters:
+        crud (CRUDBase): CRUD-объект, выдавший курсор.
+        cursor (str or None): Курсор из запроса.
+
+    Returns:
+        list[Any] or None: Ключ последнего объекта предыдущей страницы.
+
+    Raises:
+        HTTPException: Если курсор поврежден.
+    """
+    if cursor is None:
+        return None
+    try:
+        return crud.decode_cursor(cursor)
+    except ValueError as error:
+        raise HTTPException(status_code=422, detail=str(error))
@@ -0,0 +1,40 @@
+"""
+Служебные команды приложения.
+
+Пример:
+    python -m app.cli rebuild-occupancy
+"""
+import argparse
+import asyncio
+
+from app.core.db import AsyncSessionLocal
+from app.crud.room_occupancy import room_occupancy_crud
+
+
+async def rebuild_occupancy(chunk_size: int) -> None:
+    """
+    Пересчитывает предрассчитанную занятость комнат по бронированиям.
+
+    Args:
+        chunk_size (int): Количество бронирований, читаемых за раз.
+    """
+    async with AsyncSessionLocal() as session:
+        rows = await room_occupancy_crud.rebuild(session, chunk_size)
+    print(f'Занятость пересчитана, строк: {rows}')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog='python -m app.cli')
+    commands = parser.add_subparsers(dest='command', required=True)
+    rebuild = commands.add_parser(
+        'rebuild-occupancy',
+        help='пересчитать таблицу занятости комнат по бронированиям',
+    )
+    rebuild.add_argument('--chunk-size', type=int, default=10_000)
+    args = parser.parse_args()
+    if args.command == 'rebuild-occupancy':
+        asyncio.run(rebuild_occupancy(args.chunk_size))
+
+
+if __name__ == '__main__':
+    main()
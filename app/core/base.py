@@ -1,3 +1,5 @@
 """Импорты класса Base и всех моделей для Alembic."""
 from app.core.db import Base  # noqa
-from app.models import MeetingRoom, Reservation, User  # noqa
+from app.models import (  # noqa
+    MeetingRoom, Reservation, ReservationSeries, RoomOccupancy, User
+)
@@ -0,0 +1,175 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from time import monotonic
+from typing import Any
+
+
+class CacheBackend(ABC):
+    """
+    Хранилище кеша.
+
+    Значения должны сериализоваться в JSON, чтобы реализацию в памяти
+    можно было заменить общим для всех воркеров хранилищем (например,
+    Redis) без изменения вызывающего кода.
+    """
+
+    @abstractmethod
+    async def get(self, key: str, default: Any = None) -> Any:
+        """
+        Получает значение по ключу.
+
+        Args:
+            key (str): Ключ.
+            default (Any, default = None): Значение при отсутствии ключа.
+
+        Returns:
+            Any: Сохраненное значение или default.
+        """
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        """
+        Сохраняет значение по ключу.
+
+        Args:
+            key (str): Ключ.
+            value (Any): Значение.
+            ttl (float): Время жизни значения в секундах.
+        """
+
+    @abstractmethod
+    async def clear(self, prefix: str) -> None:
+        """
+        Удаляет все значения, ключи которых начинаются с префикса.
+
+        Args:
+            prefix (str): Префикс ключей.
+        """
+
+
+class InMemoryCache(CacheBackend):
+    """
+    Хранилище кеша в памяти процесса с вытеснением по TTL и LRU.
+
+    Attributes:
+        maxsize (int): Максимальное число хранимых значений.
+        items (OrderedDict[str, tuple[float, Any]]): Время истечения и
+                      значение по ключу в порядке последнего обращения.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.items: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    async def get(self, key: str, default: Any = None) -> Any:
+        item = self.items.get(key)
+        if item is None:
+            return default
+        expires, value = item
+        if expires <= monotonic():
+            del self.items[key]
+            return default
+        self.items.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        self.items[key] = (monotonic() + ttl, value)
+        self.items.move_to_end(key)
+        while len(self.items) > self.maxsize:
+            self.items.popitem(last=False)
+
+    async def clear(self, prefix: str) -> None:
+        for key in [key for key in self.items if key.startswith(prefix)]:
+            del self.items[key]
+
+
+_MISSING = object()
+
+
+class Cache:
+    """
+    Кеш со сквозным чтением для одного пространства имен.
+
+    Хранилище можно заменить присваиванием атрибута `backend`, например
+    при старте приложения с несколькими воркерами. Счетчики попаданий и
+    промахов ведутся в процессе.
+
+    Attributes:
+        namespace (str): Пространство имен, префикс всех ключей.
+        backend (CacheBackend): Хранилище значений.
+        ttl (float): Время жизни значений в секундах, 0 — кеш выключен.
+        hits (int): Количество попаданий.
+        misses (int): Количество промахов.
+        invalidations (int): Количество сбросов пространства имен.
+    """
+
+    def __init__(self, namespace: str, backend: CacheBackend, ttl: float):
+        self.namespace = namespace
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        caches[namespace] = self
+
+    async def get_or_load(
+            self,
+            key: str,
+            loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Получает значение из кеша или загружает и сохраняет его.
+
+        Значение, загрузка которого пересеклась со сбросом кеша, не
+        сохраняется, чтобы не вернуть в кеш устаревшие данные.
+
+        Args:
+            key (str): Ключ внутри пространства имен.
+            loader (Callable[[], Awaitable[Any]]): Загрузчик значения.
+
+        Returns:
+            Any: Значение.
+        """
+        if self.ttl <= 0:
+            return await loader()
+        full_key = f'{self.namespace}:{key}'
+        value = await self.backend.get(full_key, _MISSING)
+        if value is not _MISSING:
+            self.hits += 1
+            return value
+        self.misses += 1
+        invalidations = self.invalidations
+        value = await loader()
+        if invalidations == self.invalidations:
+            await self.backend.set(full_key, value, self.ttl)
+        return value
+
+    async def invalidate(self, key_prefix: str = '') -> None:
+        """
+        Сбрасывает значения пространства имен.
+
+        Args:
+            key_prefix (str, default = ''): Префикс сбрасываемых ключей,
+                                            по умолчанию сбрасываются все.
+        """
+        self.invalidations += 1
+        await self.backend.clear(f'{self.namespace}:{key_prefix}')
+
+    def get_statistics(self) -> dict[str, int | str]:
+        """
+        Получает счетчики кеша.
+
+        Returns:
+            dict[str, int | str]: Тип хранилища, число попаданий, промахов
+                                  и сбросов.
+        """
+        return {
+            'backend': type(self.backend).__name__,
+            'hits': self.hits,
+            'misses': self.misses,
+            'invalidations': self.invalidations,
+        }
+
+
+caches: dict[str, Cache] = {}
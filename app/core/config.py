@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import EmailStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -10,19 +12,144 @@ class Settings(BaseSettings):
         app_title (str): Название приложения.
         app_description (str): Описание приложения.
         database_url (str): URL базы данных.
+        database_read_url (str or None, default = None): URL реплики базы
+                    данных для маршрутов только для чтения, None — все
+                    запросы идут в основную базу.
+        read_your_writes_seconds (float, default = 5): Сколько секунд после
+                    записи клиент читает с основной базы, а не с реплики.
+                    Должно превышать задержку репликации.
         secret (str): Секретный ключ приложения.
         first_superuser_email (EmailStr or None, default = None): Email первого
                                                             суперпользователя.
         first_superuser_password (str or None, default = None): Пароль первого
                                                             суперпользователя.
+        reservation_index_enabled (bool, default = False): Строить ли при
+                        старте процессный индекс интервалов бронирований.
+                        Подходит для развертывания с одним воркером.
+        db_pool_size (int, default = 5): Число постоянных соединений в пуле.
+        db_max_overflow (int, default = 10): Число соединений сверх
+                                             db_pool_size при пиковой нагрузке.
+        db_pool_timeout (float, default = 30): Время ожидания свободного
+                                               соединения в секундах.
+        db_pool_recycle (int, default = -1): Время жизни соединения в
+                                секундах, -1 — соединения не пересоздаются.
+        db_pool_pre_ping (bool, default = False): Проверять ли соединение
+                                                  перед выдачей из пула.
+        sqlite_journal_mode (str or None, default = 'WAL'): Режим журнала
+                                                  SQLite (PRAGMA journal_mode).
+        sqlite_synchronous (str or None, default = 'NORMAL'): Режим
+                                    синхронизации SQLite (PRAGMA synchronous).
+        sqlite_busy_timeout (int or None, default = 5000): Время ожидания
+                       снятия блокировки SQLite в миллисекундах.
+        page_size (int, default = 100): Размер страницы списков по
+                                        умолчанию.
+        max_page_size (int, default = 1000): Максимальный размер страницы.
+        export_chunk_size (int, default = 1000): Количество строк в порции
+                                                 потоковой выгрузки.
+        max_batch_size (int, default = 5000): Максимальное число бронирований
+                                              в пакетном запросе.
+        recurrence_horizon_days (int, default = 365): На сколько дней вперед
+                    показываются вхождения серий в списке бронирований.
+        cache_ttl (float, default = 60): Время жизни значений кеша
+                           переговорных комнат в секундах, 0 — кеш выключен.
+        cache_maxsize (int, default = 1024): Максимальное число значений в
+                                             кеше в памяти процесса.
+        user_cache_ttl (float, default = 0): Время жизни кеша пользователей,
+                    найденных по JWT, в секундах, 0 — кеш выключен.
+        user_trust_token_claims (bool, default = False): Доверять ли
+                    подписанным в JWT признакам пользователя в течение
+                    user_cache_ttl после выдачи токена без обращения к
+                    базе данных.
+        password_hasher (str, default = 'argon2'): Алгоритм хеширования
+                    новых паролей: 'argon2' или 'bcrypt'. Пароли, сохраненные
+                    другим алгоритмом или с другими параметрами,
+                    перехешируются при входе.
+        argon2_time_cost (int, default = 3): Число итераций Argon2.
+        argon2_memory_cost (int, default = 65536): Память Argon2 в КиБ.
+        argon2_parallelism (int, default = 4): Число потоков Argon2.
+        bcrypt_rounds (int, default = 12): Стоимость bcrypt.
+        password_hash_workers (int, default = 4): Размер пула потоков для
+                    хеширования паролей, 0 — хеширование в цикле событий.
+        google_discovery_url (str or None, default = None): Шаблон URL
+                    описаний Google API с полями {api} и {api_version},
+                    например для локального тестового сервера. None —
+                    Google Discovery Service.
+        report_workers (int, default = 2): Число фоновых воркеров,
+                    одновременно строящих отчеты.
+        report_queue_size (int, default = 100): Максимальное число задач
+                    построения отчетов в очереди.
+        report_max_retries (int, default = 3): Число повторов запроса к
+                    Google API после временной ошибки.
+        report_retry_backoff (float, default = 1): Задержка перед первым
+                    повтором в секундах, удваивается с каждым повтором.
+        report_job_ttl (int, default = 3600): Время хранения завершенных
+                    задач построения отчетов в секундах.
+        sheets_max_payload_bytes (int, default = 1000000): Максимальный
+                    размер строк отчета в одном запросе записи в таблицу.
+        sheets_write_concurrency (int, default = 1): Число одновременных
+                    запросов записи в таблицу, 1 — последовательная запись.
+        etag_max_age (int, default = 60): Максимальный срок действия ETag
+                    списков в секундах.
+        room_event_queue_size (int, default = 100): Число неотправленных
+                    событий комнаты на подписчика, при переполнении
+                    подписка закрывается.
+        server_timing_enabled (bool, default = True): Добавлять ли в ответы
+                    заголовок Server-Timing со временем запросов к базе
+                    данных и общим временем обработки.
+        slow_query_seconds (float or None, default = 0.5): Время запроса к
+                    базе данных в секундах, начиная с которого запрос
+                    пишется в лог, None — лог выключен.
+        n_plus_one_threshold (int or None, default = None): Сколько раз
+                    запрос с одним текстом должен выполниться при обработке
+                    одного HTTP-запроса, чтобы в лог попало предупреждение
+                    о проблеме N+1, None — проверка выключена.
         model_config (SettingsConfigDict): Конфигурация модели.
     """
     app_title: str = 'Бронирование переговорок'
     app_description: str
     database_url: str
+    database_read_url: str | None = None
+    read_your_writes_seconds: float = 5
     secret: str = 'secret'
     first_superuser_email: EmailStr | None = None
     first_superuser_password: str | None = None
+    reservation_index_enabled: bool = False
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30
+    db_pool_recycle: int = -1
+    db_pool_pre_ping: bool = False
+    sqlite_journal_mode: str | None = 'WAL'
+    sqlite_synchronous: str | None = 'NORMAL'
+    sqlite_busy_timeout: int | None = 5000
+    page_size: int = 100
+    max_page_size: int = 1000
+    export_chunk_size: int = 1000
+    max_batch_size: int = 5000
+    recurrence_horizon_days: int = 365
+    cache_ttl: float = 60
+    cache_maxsize: int = 1024
+    user_cache_ttl: float = 0
+    user_trust_token_claims: bool = False
+    password_hasher: Literal['argon2', 'bcrypt'] = 'argon2'
+    argon2_time_cost: int = 3
+    argon2_memory_cost: int = 65536
+    argon2_parallelism: int = 4
+    bcrypt_rounds: int = 12
+    password_hash_workers: int = 4
+    google_discovery_url: str | None = None
+    report_workers: int = 2
+    report_queue_size: int = 100
+    report_max_retries: int = 3
+    report_retry_backoff: float = 1
+    report_job_ttl: int = 3600
+    sheets_max_payload_bytes: int = 1_000_000
+    sheets_write_concurrency: int = 1
+    etag_max_age: int = 60
+    room_event_queue_size: int = 100
+    server_timing_enabled: bool = True
+    slow_query_seconds: float | None = 0.5
+    n_plus_one_threshold: int | None = None
     type: str | None = None
     project_id: str | None = None
     private_key_id: str | None = None
@@ -1,9 +1,17 @@
-from sqlalchemy import Integer
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+import time
+
+from fastapi import Request
+from sqlalchemy import Integer, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import (AsyncEngine, async_sessionmaker,
+                                    create_async_engine)
 from sqlalchemy.orm import (DeclarativeBase, declared_attr, Mapped,
                             mapped_column)
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.config import settings
+from app.core.profiling import instrument_engine
 
 
 class Base(DeclarativeBase):
@@ -23,9 +31,268 @@ class Base(DeclarativeBase):
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
 
 
-engine = create_async_engine(settings.database_url)
+class PoolStatistics:
+    """
+    Счетчики событий пула соединений.
+
+    Attributes:
+        connects (int): Количество открытых соединений с базой данных.
+        checkouts (int): Количество выдач соединений из пула.
+        checkins (int): Количество возвратов соединений в пул.
+        max_checked_out (int): Максимальное число одновременно выданных
+                               соединений.
+    """
+
+    def __init__(self):
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.checked_out = 0
+        self.max_checked_out = 0
+
+    def on_connect(self, dbapi_connection, connection_record) -> None:
+        self.connects += 1
+
+    def on_checkout(
+            self, dbapi_connection, connection_record, connection_proxy
+    ) -> None:
+        self.checkouts += 1
+        self.checked_out += 1
+        self.max_checked_out = max(self.max_checked_out, self.checked_out)
+
+    def on_checkin(self, dbapi_connection, connection_record) -> None:
+        self.checkins += 1
+        self.checked_out -= 1
+
+
+pool_statistics: dict[Engine, PoolStatistics] = {}
+
+
+def get_engine_options(database_url: str) -> dict:
+    """
+    Собирает параметры пула соединений для create_async_engine.
+
+    Файловая база SQLite по умолчанию работает без пула, поэтому для неё
+    пул включается явно. Для SQLite в памяти используется единственное
+    соединение и параметры размера пула не применяются.
+
+    Args:
+        database_url (str): URL базы данных.
+
+    Returns:
+        dict: Именованные аргументы для create_async_engine.
+    """
+    url = make_url(database_url)
+    options = {'pool_pre_ping': settings.db_pool_pre_ping}
+    if url.get_backend_name() == 'sqlite':
+        if url.database in (None, '', ':memory:'):
+            return options
+        options['poolclass'] = AsyncAdaptedQueuePool
+    options.update(
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+    )
+    return options
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """
+    Применяет PRAGMA из настроек к новому соединению SQLite.
+    """
+    cursor = dbapi_connection.cursor()
+    if settings.sqlite_journal_mode is not None:
+        cursor.execute(f'PRAGMA journal_mode={settings.sqlite_journal_mode}')
+    if settings.sqlite_synchronous is not None:
+        cursor.execute(f'PRAGMA synchronous={settings.sqlite_synchronous}')
+    if settings.sqlite_busy_timeout is not None:
+        cursor.execute(f'PRAGMA busy_timeout={settings.sqlite_busy_timeout}')
+    cursor.close()
+
+
+def make_engine(database_url: str) -> AsyncEngine:
+    """
+    Создает асинхронный движок с параметрами пула из настроек и замером
+    времени запросов.
+
+    Args:
+        database_url (str): URL базы данных.
+
+    Returns:
+        AsyncEngine: Асинхронный движок SQLAlchemy.
+    """
+    async_engine = create_async_engine(
+        database_url, **get_engine_options(database_url)
+    )
+    sync_engine = async_engine.sync_engine
+    if sync_engine.dialect.name == 'sqlite':
+        event.listen(sync_engine, 'connect', set_sqlite_pragmas)
+    statistics = PoolStatistics()
+    event.listen(sync_engine, 'connect', statistics.on_connect)
+    event.listen(sync_engine, 'checkout', statistics.on_checkout)
+    event.listen(sync_engine, 'checkin', statistics.on_checkin)
+    pool_statistics[sync_engine] = statistics
+    instrument_engine(sync_engine)
+    return async_engine
+
+
+def get_pool_statistics(async_engine: AsyncEngine) -> dict[str, int | str]:
+    """
+    Получает состояние пула соединений движка.
+
+    Args:
+        async_engine (AsyncEngine): Асинхронный движок SQLAlchemy.
+
+    Returns:
+        dict[str, int | str]: Тип пула, размер, число выданных, свободных
+                              и сверхлимитных соединений и счетчики событий.
+    """
+    pool = async_engine.pool
+    statistics = pool_statistics[async_engine.sync_engine]
+    result = {
+        'pool': type(pool).__name__,
+        'connects': statistics.connects,
+        'checkouts': statistics.checkouts,
+        'checkins': statistics.checkins,
+        'max_checked_out': statistics.max_checked_out,
+    }
+    if isinstance(pool, QueuePool):
+        result.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+        )
+    return result
+
+
+class ReadRouting:
+    """
+    Выбор базы данных для запросов чтения.
+
+    Если задана реплика, маршруты только для чтения получают сессию
+    реплики. Чтобы клиент видел свои изменения несмотря на задержку
+    репликации, после записи он read_your_writes_seconds секунд читает с
+    основной базы. Клиент определяется по заголовку Authorization, а
+    запись отмечает ReadYourWritesMiddleware. После записи данных,
+    которые кешируются в памяти процесса, с основной базы читают все
+    клиенты, чтобы кеш не заполнился устаревшими данными реплики.
+
+    Отметки хранятся в памяти процесса, поэтому при нескольких процессах
+    клиенту нужна привязка к процессу на балансировщике.
+
+    Attributes:
+        seconds (float): Время чтения с основной базы после записи.
+        pinned_until (dict[str, float]): Время окончания чтения с основной
+                                         базы по клиентам.
+        all_pinned_until (float): Время окончания чтения с основной базы
+                                  для всех клиентов.
+    """
 
-AsyncSessionLocal = async_sessionmaker(engine)
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.pinned_until: dict[str, float] = {}
+        self.all_pinned_until = 0.0
+
+    def pin(self, client: str) -> None:
+        """
+        Направляет чтение клиента в основную базу после записи.
+
+        Args:
+            client (str): Значение заголовка Authorization клиента.
+        """
+        now = time.monotonic()
+        if len(self.pinned_until) >= 1024:
+            self.pinned_until = {
+                key: until for key, until in self.pinned_until.items()
+                if until > now
+            }
+        self.pinned_until[client] = now + self.seconds
+
+    def pin_all(self) -> None:
+        """
+        Направляет чтение всех клиентов в основную базу после записи.
+        """
+        self.all_pinned_until = time.monotonic() + self.seconds
+
+    def is_pinned(self, client: str | None) -> bool:
+        """
+        Проверяет, должен ли клиент читать с основной базы.
+
+        Args:
+            client (str or None): Значение заголовка Authorization.
+
+        Returns:
+            bool: True, если клиент или все клиенты недавно писали.
+        """
+        now = time.monotonic()
+        if now < self.all_pinned_until:
+            return True
+        return client is not None and now < self.pinned_until.get(client, 0)
+
+
+def get_authorization(scope: Scope) -> str | None:
+    """
+    Получает заголовок Authorization запроса из ASGI scope.
+
+    Args:
+        scope (Scope): ASGI scope HTTP-запроса.
+
+    Returns:
+        str or None: Значение заголовка или None, если его нет.
+    """
+    for name, value in scope['headers']:
+        if name == b'authorization':
+            return value.decode('latin-1')
+    return None
+
+
+class ReadYourWritesMiddleware:
+    """
+    ASGI middleware, отмечающее клиентов после успешных запросов записи.
+
+    Клиент отмечается при начале ответа, то есть после фиксации
+    транзакции и до того, как клиент сможет отправить следующий запрос.
+    """
+
+    SAFE_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(
+            self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope['type'] != 'http' or scope['method'] in self.SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_pin(message: Message) -> None:
+            if (message['type'] == 'http.response.start'
+                    and message['status'] < 400):
+                client = get_authorization(scope)
+                if client is not None:
+                    read_routing.pin(client)
+            await send(message)
+
+        await self.app(scope, receive, send_with_pin)
+
+
+engine = make_engine(settings.database_url)
+
+read_engine = (
+    engine if settings.database_read_url is None
+    else make_engine(settings.database_read_url)
+)
+
+read_routing = ReadRouting(settings.read_your_writes_seconds)
+
+AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False)
+
+AsyncReadSessionLocal = async_sessionmaker(
+    read_engine, expire_on_commit=False
+)
 
 
 async def get_async_session():
@@ -37,3 +304,37 @@ async def get_async_session():
     """
     async with AsyncSessionLocal() as async_session:
         yield async_session
+
+
+def get_read_sessionmaker(client: str | None) -> async_sessionmaker:
+    """
+    Выбирает фабрику сессий для чтения.
+
+    Args:
+        client (str or None): Значение заголовка Authorization клиента.
+
+    Returns:
+        async_sessionmaker: Фабрика сессий реплики или основной базы,
+                            если клиент недавно выполнял запись.
+    """
+    if read_routing.is_pinned(client):
+        return AsyncSessionLocal
+    return AsyncReadSessionLocal
+
+
+async def get_read_session(request: Request):
+    """
+    Создает асинхронную сессию для маршрутов только для чтения.
+
+    Args:
+        request (Request): Текущий запрос.
+
+    Returns:
+        AsyncSession: Асинхронная сессия SQLAlchemy реплики или основной
+                      базы.
+    """
+    session_maker = get_read_sessionmaker(
+        request.headers.get('authorization')
+    )
+    async with session_maker() as async_session:
+        yield async_session
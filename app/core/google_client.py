@@ -1,5 +1,11 @@
+import asyncio
+from typing import Any
+
 from aiogoogle import Aiogoogle
 from aiogoogle.auth.creds import ServiceAccountCreds
+from aiogoogle.models import Request, Response
+from aiogoogle.resource import GoogleAPI
+from aiogoogle.sessions.aiohttp_session import AiohttpSession
 
 from app.core.config import settings
 
@@ -9,26 +15,131 @@ SCOPES = [
     'https://www.googleapis.com/auth/drive'
 ]
 
-INFO = {
-    'type': settings.type,
-    'project_id': settings.project_id,
-    'private_key_id': settings.private_key_id,
-    'private_key': settings.private_key.replace('\\n', '\n'),
-    'client_email': settings.client_email,
-    'client_id': settings.client_id,
-    'auth_uri': settings.auth_uri,
-    'token_uri': settings.token_uri,
-    'auth_provider_x509_cert_url': settings.auth_provider_x509_cert_url,
-    'client_x509_cert_url': settings.client_x509_cert_url,
-    'universe_domain': settings.universe_domain
-}
 
-cred = ServiceAccountCreds(scopes=SCOPES, **INFO)
+def get_service_account_creds() -> ServiceAccountCreds:
+    """
+    Собирает учетные данные сервисного аккаунта из настроек.
 
+    Returns:
+        ServiceAccountCreds: Учетные данные сервисного аккаунта.
+    """
+    info = {
+        'type': settings.type,
+        'project_id': settings.project_id,
+        'private_key_id': settings.private_key_id,
+        'private_key': (settings.private_key or '').replace('\\n', '\n'),
+        'client_email': settings.client_email,
+        'client_id': settings.client_id,
+        'auth_uri': settings.auth_uri,
+        'token_uri': settings.token_uri,
+        'auth_provider_x509_cert_url': settings.auth_provider_x509_cert_url,
+        'client_x509_cert_url': settings.client_x509_cert_url,
+        'universe_domain': settings.universe_domain
+    }
+    return ServiceAccountCreds(scopes=SCOPES, **info)
 
-async def get_service():
+
+class GoogleClient:
     """
-    Функция авторизации для Google API
+    Клиент Google API на всё время жизни приложения.
+
+    Держит одну HTTP-сессию и один экземпляр Aiogoogle, поэтому токен
+    сервисного аккаунта запрашивается заново только после истечения.
+    Описания API загружаются один раз и кешируются. Повторяет интерфейс
+    Aiogoogle, используемый сервисами: discover и as_service_account.
+
+    Attributes:
+        aiogoogle (Aiogoogle or None): Экземпляр Aiogoogle.
+        session (AiohttpSession or None): Общая HTTP-сессия.
+        services (dict[tuple[str, str], GoogleAPI]): Описания API по
+                                                     названию и версии.
     """
-    async with Aiogoogle(service_account_creds=cred) as aiogoogle:
-        yield aiogoogle
+
+    def __init__(self):
+        self.aiogoogle: Aiogoogle | None = None
+        self.session: AiohttpSession | None = None
+        self.services: dict[tuple[str, str], GoogleAPI] = {}
+        self.discovery_lock = asyncio.Lock()
+        self.token_lock = asyncio.Lock()
+
+    async def start(self) -> None:
+        """
+        Открывает HTTP-сессию. Вызывается при старте приложения.
+        """
+        self.aiogoogle = Aiogoogle(
+            service_account_creds=get_service_account_creds()
+        )
+        self.session = AiohttpSession()
+
+    async def close(self) -> None:
+        """
+        Закрывает HTTP-сессию. Вызывается при остановке приложения.
+        """
+        if self.session is not None:
+            await self.session.close()
+        self.session = None
+        self.aiogoogle = None
+        self.services = {}
+
+    def _bind_session(self) -> Aiogoogle:
+        if self.aiogoogle is None:
+            raise RuntimeError('Клиент Google API не запущен')
+        self.aiogoogle.session_context.set(self.session)
+        return self.aiogoogle
+
+    async def discover(self, api_name: str, api_version: str) -> GoogleAPI:
+        """
+        Получает описание API, загружая его при первом обращении.
+
+        Если задан google_discovery_url, описание загружается по нему,
+        например с локального тестового сервера.
+
+        Args:
+            api_name (str): Название API, например 'sheets'.
+            api_version (str): Версия API, например 'v4'.
+
+        Returns:
+            GoogleAPI: Описание API для построения запросов.
+        """
+        key = (api_name, api_version)
+        if key in self.services:
+            return self.services[key]
+        async with self.discovery_lock:
+            if key not in self.services:
+                aiogoogle = self._bind_session()
+                if settings.google_discovery_url is None:
+                    service = await aiogoogle.discover(api_name, api_version)
+                else:
+                    request = aiogoogle.discovery_service.apis.getRest(
+                        api=api_name, version=api_version, validate=False
+                    )
+                    request.url = settings.google_discovery_url.format(
+                        api=api_name, api_version=api_version
+                    )
+                    service = GoogleAPI(await aiogoogle.as_anon(request))
+                self.services[key] = service
+        return self.services[key]
+
+    async def as_service_account(
+            self, *requests: Request, **kwargs: Any
+    ) -> Response:
+        """
+        Отправляет запросы от имени сервисного аккаунта.
+
+        Одновременные запросы с истекшим токеном получают новый токен
+        одним обращением к token_uri.
+
+        Args:
+            *requests (Request): Запросы, построенные по описанию API.
+            **kwargs: Параметры Aiogoogle.as_service_account.
+
+        Returns:
+            Response: Ответ Google API.
+        """
+        aiogoogle = self._bind_session()
+        async with self.token_lock:
+            await aiogoogle.service_account_manager.refresh()
+        return await aiogoogle.as_service_account(*requests, **kwargs)
+
+
+google_client = GoogleClient()
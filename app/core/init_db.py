@@ -7,6 +7,7 @@ from app.core.config import settings
 from app.core.db import get_async_session
 from app.core.user import get_user_db, get_user_manager
 from app.schemas.user import UserCreate
+from app.services.interval_index import reservation_index
 
 
 get_async_session_context = contextlib.asynccontextmanager(get_async_session)
@@ -56,3 +57,13 @@ async def create_first_superuser():
             password=settings.first_superuser_password,
             is_superuser=True,
         )
+
+
+async def build_reservation_index():
+    """
+    Строит процессный индекс интервалов бронирований, если он включен
+    в настройках.
+    """
+    if settings.reservation_index_enabled:
+        async with get_async_session_context() as session:
+            await reservation_index.build(session)
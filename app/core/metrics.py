@@ -0,0 +1,364 @@
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Hashable, Sequence
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+UNMATCHED_ROUTE = 'unmatched'
+
+
+def escape_label_value(value: Hashable) -> str:
+    return (
+        str(value).replace('\\', r'\\').replace('\n', r'\n')
+        .replace('"', r'\"')
+    )
+
+
+def format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric(ABC):
+    """
+    Метрика с набором меток.
+
+    Значения меток передаются позиционно в порядке labelnames, поэтому
+    на запрос не создаются словари меток. Строковое представление
+    значений строится только при выдаче метрик.
+
+    Attributes:
+        name (str): Имя метрики.
+        documentation (str): Описание метрики.
+        labelnames (tuple[str, ...]): Имена меток.
+        children (dict[tuple, object]): Значения по набору меток.
+    """
+
+    type = ''
+
+    def __init__(
+            self,
+            name: str,
+            documentation: str,
+            labelnames: Sequence[str] = (),
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.children: dict[tuple, object] = {}
+
+    @abstractmethod
+    def _new_child(self) -> object:
+        """
+        Создает значение метрики для нового набора меток.
+        """
+
+    def labels(self, *values: Hashable) -> object:
+        """
+        Получает значение метрики для набора меток.
+
+        Args:
+            *values (Hashable): Значения меток в порядке labelnames.
+
+        Returns:
+            object: Значение метрики.
+        """
+        child = self.children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(
+                    f'{self.name}: ожидается {len(self.labelnames)} меток'
+                )
+            child = self.children[values] = self._new_child()
+        return child
+
+    def _format_labels(
+            self,
+            values: tuple,
+            extra: tuple[tuple[str, str], ...] = (),
+    ) -> str:
+        pairs = [
+            f'{name}="{escape_label_value(value)}"'
+            for name, value in zip(self.labelnames, values)
+        ]
+        pairs.extend(f'{name}="{value}"' for name, value in extra)
+        return '{' + ','.join(pairs) + '}' if pairs else ''
+
+    @abstractmethod
+    def _render_samples(self) -> list[str]:
+        """
+        Формирует строки значений метрики без HELP и TYPE.
+        """
+
+    def render(self) -> list[str]:
+        """
+        Формирует строки метрики в текстовом формате Prometheus.
+
+        Returns:
+            list[str]: Строки HELP, TYPE и значения.
+        """
+        return [
+            f'# HELP {self.name} {self.documentation}',
+            f'# TYPE {self.name} {self.type}',
+            *self._render_samples(),
+        ]
+
+
+class CounterValue:
+    """
+    Значение счетчика для одного набора меток.
+    """
+
+    __slots__ = ('value',)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: float = 1) -> None:
+        self.value += amount
+
+
+class Counter(Metric):
+    """
+    Монотонно растущий счетчик.
+    """
+
+    type = 'counter'
+
+    def _new_child(self) -> CounterValue:
+        return CounterValue()
+
+    def inc(self, amount: float = 1) -> None:
+        """
+        Увеличивает счетчик без меток.
+
+        Args:
+            amount (float, default = 1): Величина увеличения.
+        """
+        self.labels().inc(amount)
+
+    def _render_samples(self) -> list[str]:
+        return [
+            f'{self.name}{self._format_labels(values)} '
+            f'{format_value(child.value)}'
+            for values, child in self.children.items()
+        ]
+
+
+class HistogramValue:
+    """
+    Значение гистограммы для одного набора меток.
+
+    Счетчики корзин выделяются при создании и хранятся без накопления:
+    наблюдение увеличивает одну корзину, накопленные значения считаются
+    при выдаче метрик.
+
+    Attributes:
+        bounds (tuple[float, ...]): Верхние границы корзин.
+        counts (list[int]): Количество наблюдений в каждой корзине,
+                            последняя — выше всех границ.
+        sum (float): Сумма наблюдений.
+    """
+
+    __slots__ = ('bounds', 'counts', 'sum')
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+
+class Histogram(Metric):
+    """
+    Гистограмма с фиксированными корзинами.
+
+    Attributes:
+        buckets (tuple[float, ...]): Верхние границы корзин по
+                                     возрастанию.
+    """
+
+    type = 'histogram'
+
+    def __init__(
+            self,
+            name: str,
+            documentation: str,
+            labelnames: Sequence[str] = (),
+            buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> HistogramValue:
+        return HistogramValue(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """
+        Добавляет наблюдение в гистограмму без меток.
+
+        Args:
+            value (float): Наблюдаемое значение.
+        """
+        self.labels().observe(value)
+
+    def _render_samples(self) -> list[str]:
+        lines = []
+        bounds = (*self.buckets, float('inf'))
+        for values, child in self.children.items():
+            total = 0
+            for bound, count in zip(bounds, child.counts):
+                total += count
+                labels = self._format_labels(
+                    values, (('le', format_value(bound)),)
+                )
+                lines.append(f'{self.name}_bucket{labels} {total}')
+            labels = self._format_labels(values)
+            lines.append(f'{self.name}_sum{labels} {repr(child.sum)}')
+            lines.append(f'{self.name}_count{labels} {total}')
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Набор метрик процесса.
+
+    Attributes:
+        metrics (dict[str, Metric]): Метрики по имени.
+    """
+
+    def __init__(self):
+        self.metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        if metric.name in self.metrics:
+            raise ValueError(f'Метрика {metric.name} уже зарегистрирована')
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(
+            self,
+            name: str,
+            documentation: str,
+            labelnames: Sequence[str] = (),
+    ) -> Counter:
+        """
+        Создает и регистрирует счетчик.
+        """
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(
+            self,
+            name: str,
+            documentation: str,
+            labelnames: Sequence[str] = (),
+            buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """
+        Создает и регистрирует гистограмму.
+        """
+        return self.register(
+            Histogram(name, documentation, labelnames, buckets)
+        )
+
+    def render(self) -> str:
+        """
+        Формирует все метрики в текстовом формате Prometheus.
+
+        Returns:
+            str: Текст для ответа на запрос Prometheus.
+        """
+        lines = []
+        for metric in self.metrics.values():
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+registry = MetricsRegistry()
+
+http_requests = registry.counter(
+    'http_requests_total',
+    'Количество HTTP-запросов.',
+    ('method', 'route', 'status'),
+)
+http_request_duration = registry.histogram(
+    'http_request_duration_seconds',
+    'Время обработки HTTP-запросов в секундах.',
+    ('method', 'route'),
+)
+reservations_created = registry.counter(
+    'reservations_created_total',
+    'Количество созданных бронирований.',
+)
+reservation_conflicts = registry.counter(
+    'reservation_conflicts_total',
+    'Количество бронирований и серий, отклоненных из-за пересечений.',
+    ('check',),
+)
+report_jobs = registry.counter(
+    'report_jobs_total',
+    'Количество задач построения отчетов по итоговому состоянию.',
+    ('status',),
+)
+report_job_duration = registry.histogram(
+    'report_job_duration_seconds',
+    'Время построения отчетов в секундах.',
+    buckets=(0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0),
+)
+google_api_retries = registry.counter(
+    'google_api_retries_total',
+    'Количество повторов запросов к Google API после временных ошибок.',
+    ('stage',),
+)
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware, считающее HTTP-запросы и время их обработки.
+
+    Запросы учитываются по шаблону пути маршрута, а не по фактическому
+    пути, чтобы число наборов меток не росло с числом идентификаторов.
+    Запрос, завершившийся исключением до начала ответа, учитывается со
+    статусом 500.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(
+            self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get('route')
+            path = UNMATCHED_ROUTE if route is None else route.path
+            method = scope['method']
+            http_requests.labels(method, path, status).inc()
+            http_request_duration.labels(method, path).observe(
+                time.perf_counter() - started
+            )
@@ -0,0 +1,100 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from fastapi_users.password import PasswordHelper
+from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
+from pwdlib.hashers.bcrypt import BcryptHasher
+
+from app.core.config import settings
+
+
+class AsyncPasswordHelper(PasswordHelper):
+    """
+    Помощник паролей, выполняющий хеширование в ограниченном пуле потоков.
+
+    Argon2 и bcrypt освобождают GIL на время вычисления хеша, поэтому
+    вынос в пул потоков не блокирует цикл событий на время входа и
+    регистрации. Размер пула ограничивает число одновременно вычисляемых
+    хешей, а с ним и потребление памяти Argon2.
+
+    Attributes:
+        executor (ThreadPoolExecutor or None): Пул потоков, None —
+                                хеширование выполняется в цикле событий.
+    """
+
+    def __init__(self, password_hash: PasswordHash, max_workers: int):
+        super().__init__(password_hash)
+        self.executor = None
+        if max_workers > 0:
+            self.executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix='password'
+            )
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self.executor is None:
+            return func(*args)
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, func, *args
+        )
+
+    async def hash_async(self, password: str) -> str:
+        """
+        Хеширует пароль в пуле потоков.
+
+        Args:
+            password (str): Пароль.
+
+        Returns:
+            str: Хеш пароля.
+        """
+        return await self._run(self.hash, password)
+
+    async def verify_and_update_async(
+            self,
+            plain_password: str,
+            hashed_password: str,
+    ) -> tuple[bool, str | None]:
+        """
+        Проверяет пароль в пуле потоков.
+
+        Args:
+            plain_password (str): Пароль.
+            hashed_password (str): Сохраненный хеш пароля.
+
+        Returns:
+            tuple[bool, str or None]: Результат проверки и новый хеш, если
+                сохраненный получен другим алгоритмом или с другими
+                параметрами.
+        """
+        return await self._run(
+            self.verify_and_update, plain_password, hashed_password
+        )
+
+
+def get_password_hash() -> PasswordHash:
+    """
+    Собирает хешеры паролей по настройкам.
+
+    Первым идет хешер из password_hasher, им хешируются новые пароли.
+    Второй нужен, чтобы проверять и перехешировать пароли, сохраненные
+    другим алгоритмом.
+
+    Returns:
+        PasswordHash: Набор хешеров pwdlib.
+    """
+    argon2_hasher = Argon2Hasher(
+        time_cost=settings.argon2_time_cost,
+        memory_cost=settings.argon2_memory_cost,
+        parallelism=settings.argon2_parallelism,
+    )
+    bcrypt_hasher = BcryptHasher(rounds=settings.bcrypt_rounds)
+    if settings.password_hasher == 'bcrypt':
+        return PasswordHash((bcrypt_hasher, argon2_hasher))
+    return PasswordHash((argon2_hasher, bcrypt_hasher))
+
+
+password_helper = AsyncPasswordHelper(
+    get_password_hash(), settings.password_hash_workers
+)
@@ -0,0 +1,165 @@
+import logging
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+class RequestProfile:
+    """
+    Статистика запросов к базе данных за время обработки HTTP-запроса.
+
+    Attributes:
+        method (str): HTTP-метод запроса.
+        path (str): Путь запроса.
+        queries (int): Количество выполненных запросов к базе данных.
+        db_time (float): Суммарное время запросов в секундах.
+        statements (Counter[str]): Число выполнений каждого запроса по
+                                   тексту без значений параметров.
+    """
+
+    def __init__(self, method: str, path: str):
+        self.method = method
+        self.path = path
+        self.queries = 0
+        self.db_time = 0.0
+        self.statements: Counter[str] = Counter()
+
+    def add(self, statement: str, duration: float) -> int:
+        """
+        Учитывает выполненный запрос.
+
+        Args:
+            statement (str): Текст запроса.
+            duration (float): Время выполнения в секундах.
+
+        Returns:
+            int: Сколько раз запрос с этим текстом выполнен за время
+                 обработки HTTP-запроса.
+        """
+        self.queries += 1
+        self.db_time += duration
+        self.statements[statement] += 1
+        return self.statements[statement]
+
+    def get_server_timing(self, total: float) -> str:
+        """
+        Формирует значение заголовка Server-Timing.
+
+        Args:
+            total (float): Время обработки запроса в секундах.
+
+        Returns:
+            str: Время запросов к базе данных и общее время в мс.
+        """
+        return (
+            f'db;dur={self.db_time * 1000:.1f};desc="{self.queries} queries", '
+            f'total;dur={total * 1000:.1f}'
+        )
+
+
+request_profile: ContextVar[RequestProfile | None] = ContextVar(
+    'request_profile', default=None
+)
+
+
+def format_statement(statement: str) -> str:
+    return ' '.join(statement.split())
+
+
+def before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+) -> None:
+    conn.info.setdefault('query_started', []).append(time.perf_counter())
+
+
+def after_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+) -> None:
+    """
+    Учитывает время запроса в профиле текущего HTTP-запроса, пишет в
+    лог медленные запросы и повторяющиеся запросы.
+    """
+    duration = time.perf_counter() - conn.info['query_started'].pop()
+    if (settings.slow_query_seconds is not None
+            and duration >= settings.slow_query_seconds):
+        logger.warning(
+            'Медленный запрос к базе данных (%.1f мс): %s',
+            duration * 1000, format_statement(statement)
+        )
+    profile = request_profile.get()
+    if profile is None:
+        return
+    statement = format_statement(statement)
+    count = profile.add(statement, duration)
+    if count == settings.n_plus_one_threshold:
+        logger.warning(
+            'Возможная проблема N+1: запрос выполнен %s раз при обработке '
+            '%s %s: %s', count, profile.method, profile.path, statement
+        )
+
+
+def handle_error(exception_context) -> None:
+    started = exception_context.connection.info.get('query_started')
+    if started:
+        started.pop()
+
+
+def instrument_engine(sync_engine: Engine) -> None:
+    """
+    Подключает к движку замер времени запросов.
+
+    Args:
+        sync_engine (Engine): Синхронный движок SQLAlchemy.
+    """
+    event.listen(sync_engine, 'before_cursor_execute', before_cursor_execute)
+    event.listen(sync_engine, 'after_cursor_execute', after_cursor_execute)
+    event.listen(sync_engine, 'handle_error', handle_error)
+
+
+class ServerTimingMiddleware:
+    """
+    ASGI middleware, собирающее статистику запросов к базе данных за
+    время обработки HTTP-запроса.
+
+    Если включено server_timing_enabled, в ответ добавляется заголовок
+    Server-Timing со временем запросов к базе данных и общим временем до
+    начала ответа. Запросы, выполненные при потоковой отдаче тела ответа,
+    в заголовок не попадают.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(
+            self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        profile = RequestProfile(scope['method'], scope['path'])
+        started = time.perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            if (message['type'] == 'http.response.start'
+                    and settings.server_timing_enabled):
+                MutableHeaders(scope=message).append(
+                    'Server-Timing',
+                    profile.get_server_timing(time.perf_counter() - started),
+                )
+            await send(message)
+
+        token = request_profile.set(profile)
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            request_profile.reset(token)
@@ -1,15 +1,26 @@
+import hashlib
+from time import time
+from typing import Any
+
+import jwt
 from fastapi import Depends, Request
+from fastapi.security import OAuth2PasswordRequestForm
 from fastapi_users import (
-    BaseUserManager, FastAPIUsers, IntegerIDMixin, InvalidPasswordException
+    BaseUserManager, FastAPIUsers, IntegerIDMixin, InvalidPasswordException,
+    exceptions
 )
 from fastapi_users.authentication import (
     AuthenticationBackend, BearerTransport, JWTStrategy
 )
+from fastapi_users.jwt import decode_jwt, generate_jwt
 from fastapi_users_db_sqlalchemy import SQLAlchemyUserDatabase
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
+from app.core.cache import Cache, InMemoryCache
 from app.core.config import settings
 from app.core.db import get_async_session
+from app.core.password import AsyncPasswordHelper, password_helper
 from app.models.user import User
 from app.schemas.user import UserCreate
 
@@ -30,6 +41,114 @@ async def get_user_db(session: AsyncSession = Depends(get_async_session)):
 
 bearer_transport = BearerTransport(tokenUrl='auth/jwt/login')
 
+USER_CLAIMS = ('email', 'is_active', 'is_superuser', 'is_verified')
+
+user_cache = Cache(
+    'user', InMemoryCache(settings.cache_maxsize), settings.user_cache_ttl
+)
+
+
+class CachedJWTStrategy(JWTStrategy):
+    """
+    Стратегия JWT с кешем пользователей, найденных по токену.
+
+    Пользователь, загруженный из базы данных, кешируется по идентификатору
+    и токену и при следующих запросах присоединяется к сессии запроса без
+    SELECT. Кеш сбрасывается менеджером пользователей при изменении или
+    удалении пользователя; изменения, сделанные другим воркером с кешем в
+    памяти, видны не позже истечения TTL.
+
+    В режиме доверия подписанным признакам токен содержит email и флаги
+    пользователя, и в течение TTL после выдачи токена пользователь
+    собирается из них без обращения к кешу и базе данных.
+
+    Attributes:
+        cache (Cache): Кеш пользователей.
+        trust_claims (bool): Доверять ли признакам пользователя из токена.
+    """
+
+    def __init__(self, *args, cache: Cache, trust_claims: bool, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache = cache
+        self.trust_claims = trust_claims
+
+    async def write_token(self, user: User) -> str:
+        if not self.trust_claims:
+            return await super().write_token(user)
+        data = {
+            'sub': str(user.id),
+            'aud': self.token_audience,
+            'iat': int(time()),
+            **{claim: getattr(user, claim) for claim in USER_CLAIMS},
+        }
+        return generate_jwt(
+            data, self.encode_key, self.lifetime_seconds,
+            algorithm=self.algorithm
+        )
+
+    async def read_token(
+            self,
+            token: str | None,
+            user_manager: BaseUserManager[User, int],
+    ) -> User | None:
+        if token is None or self.cache.ttl <= 0:
+            return await super().read_token(token, user_manager)
+        try:
+            data = decode_jwt(
+                token, self.decode_key, self.token_audience,
+                algorithms=[self.algorithm]
+            )
+            user_id = user_manager.parse_id(data.get('sub'))
+        except (jwt.PyJWTError, exceptions.InvalidID):
+            return None
+        if self.trust_claims and self._claims_are_fresh(data):
+            snapshot = {'id': user_id}
+            snapshot.update((claim, data[claim]) for claim in USER_CLAIMS)
+        else:
+            loaded = []
+
+            async def load():
+                try:
+                    user = await user_manager.get(user_id)
+                except exceptions.UserNotExists:
+                    return None
+                loaded.append(user)
+                return get_user_snapshot(user)
+
+            token_digest = hashlib.sha256(token.encode()).hexdigest()
+            snapshot = await self.cache.get_or_load(
+                f'{user_id}:{token_digest}', load
+            )
+            if loaded:
+                return loaded[0]
+        if snapshot is None:
+            return None
+        user = User(**snapshot)
+        make_transient_to_detached(user)
+        return await user_manager.user_db.session.merge(user, load=False)
+
+    def _claims_are_fresh(self, data: dict[str, Any]) -> bool:
+        return (
+            all(claim in data for claim in USER_CLAIMS)
+            and time() - data.get('iat', 0) <= self.cache.ttl
+        )
+
+
+def get_user_snapshot(user: User) -> dict[str, Any]:
+    """
+    Получает значения колонок пользователя для кеша.
+
+    Args:
+        user (User): Пользователь.
+
+    Returns:
+        dict[str, Any]: Значения колонок по именам.
+    """
+    return {
+        column.key: getattr(user, column.key)
+        for column in User.__table__.columns
+    }
+
 
 def get_jwt_strategy() -> JWTStrategy:
     """
@@ -38,7 +157,12 @@ def get_jwt_strategy() -> JWTStrategy:
     Returns:
         JWTStrategy: Стратегия JWT.
     """
-    return JWTStrategy(secret=settings.secret, lifetime_seconds=3600)
+    return CachedJWTStrategy(
+        secret=settings.secret,
+        lifetime_seconds=3600,
+        cache=user_cache,
+        trust_claims=settings.user_trust_token_claims,
+    )
 
 
 auth_backend = AuthenticationBackend(
@@ -64,8 +188,102 @@ class UserManager(IntegerIDMixin, BaseUserManager[User, int]):
 
         on_after_register(user: User, request: Request or None):
             Вызывается после регистрации пользователя.
+
+        on_after_update, on_after_verify, on_after_delete:
+            Сбрасывают кеш пользователей, найденных по JWT.
+
+    Хеширование и проверка паролей при входе, регистрации и изменении
+    пароля выполняются в пуле потоков помощника паролей.
     """
 
+    password_helper: AsyncPasswordHelper
+
+    async def authenticate(
+            self, credentials: OAuth2PasswordRequestForm
+    ) -> User | None:
+        """
+        Проверяет email и пароль пользователя.
+
+        Хеш пароля, полученный устаревшим алгоритмом или с прежними
+        параметрами, заменяется новым.
+
+        Args:
+            credentials (OAuth2PasswordRequestForm): Email и пароль.
+
+        Returns:
+            User or None: Пользователь или None, если проверка не пройдена.
+        """
+        try:
+            user = await self.get_by_email(credentials.username)
+        except exceptions.UserNotExists:
+            await self.password_helper.hash_async(credentials.password)
+            return None
+        verified, updated_password_hash = (
+            await self.password_helper.verify_and_update_async(
+                credentials.password, user.hashed_password
+            )
+        )
+        if not verified:
+            return None
+        if updated_password_hash is not None:
+            await self.user_db.update(
+                user, {'hashed_password': updated_password_hash}
+            )
+        return user
+
+    async def create(
+            self,
+            user_create: UserCreate,
+            safe: bool = False,
+            request: Request | None = None,
+    ) -> User:
+        """
+        Создает пользователя.
+
+        Args:
+            user_create (UserCreate): Данные создания пользователя.
+            safe (bool, default = False): Игнорировать ли is_superuser и
+                                          is_verified из данных создания.
+            request (Request or None): Запрос. Defaults to None.
+
+        Returns:
+            User: Созданный пользователь.
+
+        Raises:
+            UserAlreadyExists: Если пользователь с таким email уже есть.
+        """
+        await self.validate_password(user_create.password, user_create)
+        existing_user = await self.user_db.get_by_email(user_create.email)
+        if existing_user is not None:
+            raise exceptions.UserAlreadyExists()
+        user_dict = (
+            user_create.create_update_dict()
+            if safe
+            else user_create.create_update_dict_superuser()
+        )
+        password = user_dict.pop('password')
+        user_dict['hashed_password'] = await self.password_helper.hash_async(
+            password
+        )
+        created_user = await self.user_db.create(user_dict)
+        await self.on_after_register(created_user, request)
+        return created_user
+
+    async def _update(self, user: User, update_dict: dict[str, Any]) -> User:
+        password = update_dict.get('password')
+        if password is None:
+            return await super()._update(user, update_dict)
+        await self.validate_password(password, user)
+        update_dict = {
+            field: value
+            for field, value in update_dict.items()
+            if field != 'password'
+        }
+        update_dict['hashed_password'] = await self.password_helper.hash_async(
+            password
+        )
+        return await super()._update(user, update_dict)
+
     async def validate_password(
         self,
         password: str,
@@ -103,6 +321,46 @@ class UserManager(IntegerIDMixin, BaseUserManager[User, int]):
         """
         print(f'Пользователь {user.email} зарегистрирован.')
 
+    async def on_after_update(
+            self,
+            user: User,
+            update_dict: dict[str, Any],
+            request: Request | None = None,
+    ):
+        """
+        Вызывается после изменения пользователя.
+
+        Args:
+            user (User): Измененный пользователь.
+            update_dict (dict[str, Any]): Измененные поля.
+            request (Request or None): Запрос. Defaults to None.
+        """
+        await user_cache.invalidate(f'{user.id}:')
+
+    async def on_after_verify(
+            self, user: User, request: Request | None = None
+    ):
+        """
+        Вызывается после подтверждения пользователя.
+
+        Args:
+            user (User): Подтвержденный пользователь.
+            request (Request or None): Запрос. Defaults to None.
+        """
+        await user_cache.invalidate(f'{user.id}:')
+
+    async def on_after_delete(
+            self, user: User, request: Request | None = None
+    ):
+        """
+        Вызывается после удаления пользователя.
+
+        Args:
+            user (User): Удаленный пользователь.
+            request (Request or None): Запрос. Defaults to None.
+        """
+        await user_cache.invalidate(f'{user.id}:')
+
 
 async def get_user_manager(user_db=Depends(get_user_db)):
     """
@@ -114,7 +372,7 @@ async def get_user_manager(user_db=Depends(get_user_db)):
     Returns:
         UserManager: Менеджер пользователей.
     """
-    yield UserManager(user_db)
+    yield UserManager(user_db, password_helper)
 
 
 fastapi_users = FastAPIUsers[User, int](
@@ -1,9 +1,15 @@
-from typing import Generic, Type, TypeVar
+import base64
+import json
+from collections.abc import Iterable, Mapping, Sequence
+from datetime import datetime
+from typing import Any, Generic, Type, TypeVar
 
 from fastapi.encoders import jsonable_encoder
 
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import (
+    ColumnElement, Row, delete, insert, select, tuple_, update
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.db import Base
@@ -21,8 +27,12 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
     Attributes:
         model (Type[ModelType]): Модель базы данных.
+        ordering (tuple[str, ...]): Поля модели, задающие порядок выдачи
+                                    списка и ключ курсора пагинации.
     """
 
+    ordering: tuple[str, ...] = ('id',)
+
     def __init__(
         self,
         model: Type[ModelType]
@@ -53,25 +63,154 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
     async def get_multi(
             self,
-            session: AsyncSession
-    ) -> list[ModelType]:
+            session: AsyncSession,
+            *,
+            limit: int | None = None,
+            after: Sequence[Any] | None = None,
+            filters: Iterable[ColumnElement[bool]] = (),
+            fields: Sequence[str] | None = None,
+    ) -> list[ModelType] | list[Row]:
         """
-        Получает список всех объектов модели.
+        Получает страницу объектов модели в порядке полей `ordering`.
 
         Args:
             session (AsyncSession): Асинхронная сессия SQLAlchemy.
+            limit (int or None, default = None): Размер страницы,
+                                                 None — без ограничения.
+            after (Sequence or None, default = None): Значения полей
+                `ordering` последнего объекта предыдущей страницы.
+            filters (Iterable[ColumnElement[bool]], default = ()): Условия
+                                                               отбора.
+            fields (Sequence[str] or None, default = None): Поля модели.
+                        Если заданы, выбираются только они, строками без
+                        создания объектов модели.
 
         Returns:
-            list[ModelType]: Список всех объектов модели.
+            list[ModelType] or list[Row]: Список объектов модели или строк.
+        """
+        columns = [getattr(self.model, name) for name in self.ordering]
+        if fields is None:
+            select_stmt = select(self.model)
+        else:
+            select_stmt = select(
+                *(getattr(self.model, name) for name in fields)
+            )
+        select_stmt = select_stmt.where(*filters).order_by(*columns)
+        if after is not None:
+            select_stmt = select_stmt.where(tuple_(*columns) > tuple_(*after))
+        if limit is not None:
+            select_stmt = select_stmt.limit(limit)
+        db_objs = await session.execute(select_stmt)
+        if fields is None:
+            return db_objs.scalars().all()
+        return db_objs.all()
+
+    def encode_cursor(self, obj: Any) -> str:
+        """
+        Кодирует значения полей `ordering` объекта в курсор пагинации.
+
+        Args:
+            obj (Any): Последний объект страницы, строка или словарь.
+
+        Returns:
+            str: Непрозрачный курсор для следующей страницы.
+        """
+        if not isinstance(obj, Mapping):
+            obj = {name: getattr(obj, name) for name in self.ordering}
+        values = [jsonable_encoder(obj[name]) for name in self.ordering]
+        return base64.urlsafe_b64encode(
+            json.dumps(values).encode()
+        ).decode()
+
+    def decode_cursor(self, cursor: str) -> list[Any]:
+        """
+        Декодирует курсор пагинации в значения полей `ordering`.
+
+        Args:
+            cursor (str): Курсор, полученный от encode_cursor.
+
+        Returns:
+            list[Any]: Значения полей `ordering`.
+
+        Raises:
+            ValueError: Если курсор поврежден.
+        """
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            if len(values) != len(self.ordering):
+                raise ValueError
+            result = []
+            for name, value in zip(self.ordering, values):
+                python_type = getattr(self.model, name).type.python_type
+                if python_type is datetime:
+                    value = datetime.fromisoformat(value)
+                elif not isinstance(value, python_type):
+                    raise ValueError
+                result.append(value)
+        except (TypeError, ValueError) as error:
+            raise ValueError('Некорректный курсор') from error
+        return result
+
+    def get_next_cursor(
+            self,
+            objs: Sequence[Any],
+            limit: int | None,
+    ) -> str | None:
         """
-        db_objs = await session.execute(select(self.model))
-        return db_objs.scalars().all()
+        Получает курсор следующей страницы.
+
+        Args:
+            objs (Sequence[Any]): Объекты текущей страницы.
+            limit (int or None): Размер страницы.
+
+        Returns:
+            str or None: Курсор или None, если страница последняя.
+        """
+        if limit is None or len(objs) < limit:
+            return None
+        return self.encode_cursor(objs[-1])
+
+    def get_column_values(self, obj_in: BaseModel) -> dict[str, Any]:
+        """
+        Выбирает из переданных данных значения колонок модели.
+
+        Args:
+            obj_in (BaseModel): Данные для обновления.
+
+        Returns:
+            dict[str, Any]: Явно переданные значения колонок.
+        """
+        update_data = obj_in.model_dump(exclude_unset=True)
+        return {
+            field: update_data[field]
+            for field in self.model.__mapper__.column_attrs.keys()
+            if field in update_data
+        }
+
+    def get_owner_filters(
+            self,
+            user: User,
+    ) -> tuple[ColumnElement[bool], ...]:
+        """
+        Собирает условия, ограничивающие запись объектами пользователя.
+
+        Args:
+            user (User): Пользователь, выполняющий запись.
+
+        Returns:
+            tuple[ColumnElement[bool], ...]: Условие на владельца или
+                                             пустой кортеж для суперюзера.
+        """
+        if user.is_superuser:
+            return ()
+        return (self.model.user_id == user.id,)
 
     async def create(
             self,
             obj_in: CreateSchemaType,
             session: AsyncSession,
             user: User | None = None,
+            commit: bool = True,
     ) -> ModelType:
         """
         Создает новый объект модели в базе данных.
@@ -80,6 +219,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             obj_in (CreateSchemaType): Данные для создания объекта.
             session (AsyncSession): Асинхронная сессия SQLAlchemy.
             user (User or None, default= None): Пользователь, создающий объект.
+            commit (bool, default = True): Зафиксировать транзакцию. Если
+                        False, изменения только отправляются в базу данных.
 
         Returns:
             ModelType: Созданный объект модели.
@@ -87,10 +228,11 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         obj_in_data = obj_in.model_dump()
         if user is not None:
             obj_in_data['user_id'] = user.id
-        db_obj = self.model(**obj_in_data)
-        session.add(db_obj)
-        await session.commit()
-        await session.refresh(db_obj)
+        db_obj = await session.scalar(
+            insert(self.model).values(**obj_in_data).returning(self.model)
+        )
+        if commit:
+            await session.commit()
         return db_obj
 
     async def update(
@@ -98,6 +240,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             db_obj: ModelType,
             obj_in: UpdateSchemaType,
             session: AsyncSession,
+            commit: bool = True,
     ) -> ModelType:
         """
         Обновляет существующий объект модели в базе данных.
@@ -106,25 +249,67 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             db_obj (ModelType): Существующий объект модели.
             obj_in (UpdateSchemaType): Новые данные для обновления.
             session (AsyncSession): Асинхронная сессия SQLAlchemy.
+            commit (bool, default = True): Зафиксировать транзакцию. Если
+                        False, изменения только отправляются в базу данных.
 
         Returns:
             ModelType: Обновленный объект модели.
         """
-        obj_data = jsonable_encoder(db_obj)
-        update_data = obj_in.model_dump(exclude_unset=True)
-
-        for field in obj_data:
-            if field in update_data:
-                setattr(db_obj, field, update_data[field])
+        for field, value in self.get_column_values(obj_in).items():
+            setattr(db_obj, field, value)
         session.add(db_obj)
+        if not commit:
+            await session.flush()
+            return db_obj
         await session.commit()
-        await session.refresh(db_obj)
+        return db_obj
+
+    async def update_by_id(
+            self,
+            obj_id: int,
+            obj_in: UpdateSchemaType,
+            session: AsyncSession,
+            *where: ColumnElement[bool],
+            commit: bool = True,
+    ) -> ModelType | None:
+        """
+        Обновляет объект по идентификатору одним запросом
+        `UPDATE ... RETURNING` без предварительного чтения.
+
+        Args:
+            obj_id (int): Идентификатор объекта.
+            obj_in (UpdateSchemaType): Новые данные для обновления.
+            session (AsyncSession): Асинхронная сессия SQLAlchemy.
+            *where (ColumnElement[bool]): Дополнительные условия, например
+                                          проверка владельца.
+            commit (bool, default = True): Зафиксировать транзакцию.
+
+        Returns:
+            ModelType or None: Обновленный объект или None, если объект
+                               не найден или не подходит под условия.
+        """
+        values = self.get_column_values(obj_in)
+        if not values:
+            db_obj = await session.scalar(
+                select(self.model).where(self.model.id == obj_id, *where)
+            )
+        else:
+            db_obj = await session.scalar(
+                update(self.model).where(
+                    self.model.id == obj_id, *where
+                ).values(**values).returning(self.model).execution_options(
+                    populate_existing=True
+                )
+            )
+        if commit and db_obj is not None:
+            await session.commit()
         return db_obj
 
     async def remove(
             self,
             db_obj: ModelType,
             session: AsyncSession,
+            commit: bool = True,
     ) -> ModelType:
         """
         Удаляет объект модели из базы данных.
@@ -132,10 +317,49 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Args:
             db_obj (ModelType): Объект модели для удаления.
             session (AsyncSession): Асинхронная сессия SQLAlchemy.
+            commit (bool, default = True): Зафиксировать транзакцию. Если
+                        False, изменения только отправляются в базу данных.
 
         Returns:
             ModelType: Удаленный объект модели.
         """
         await session.delete(db_obj)
+        if not commit:
+            await session.flush()
+            return db_obj
         await session.commit()
         return db_obj
+
+    async def remove_by_id(
+            self,
+            obj_id: int,
+            session: AsyncSession,
+            *where: ColumnElement[bool],
+            commit: bool = True,
+    ) -> ModelType | None:
+        """
+        Удаляет объект по идентификатору одним запросом
+        `DELETE ... RETURNING` без предварительного чтения.
+
+        Каскады ORM при этом не выполняются, поэтому метод подходит для
+        моделей, от которых не зависят другие строки.
+
+        Args:
+            obj_id (int): Идентификатор объекта.
+            session (AsyncSession): Асинхронная сессия SQLAlchemy.
+            *where (ColumnElement[bool]): Дополнительные условия, например
+                                          проверка владельца.
+            commit (bool, default = True): Зафиксировать транзакцию.
+
+        Returns:
+            ModelType or None: Удаленный объект или None, если объект
+                               не найден или не подходит под условия.
+        """
+        db_obj = await session.scalar(
+            delete(self.model).where(
+                self.model.id == obj_id, *where
+            ).returning(self.model)
+        )
+        if commit and db_obj is not None:
+            await session.commit()
+        return db_obj
@@ -1,9 +1,23 @@
-from sqlalchemy import select
+import json
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import ColumnElement, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import Cache, InMemoryCache
+from app.core.config import settings
+from app.core.db import read_routing
 from app.crud.base import CRUDBase
-from app.models.meeting_room import MeetingRoom
-from app.schemas.meeting_room import MeetingRoomCreate, MeetingRoomUpdate
+from app.models import MeetingRoom, User
+from app.schemas.meeting_room import (
+    MeetingRoomCreate, MeetingRoomDB, MeetingRoomUpdate
+)
+from app.services.interval_index import reservation_index
+from app.services.versions import (
+    MEETING_ROOMS, change_versions, room_reservations_key
+)
 
 
 class CRUDMeetingRoom(CRUDBase[
@@ -13,15 +27,99 @@ class CRUDMeetingRoom(CRUDBase[
 ]):
     """
     Класс для операций CRUD с моделью MeetingRoom.
+
+    Комнаты меняются редко, а читаются при каждом бронировании, поэтому
+    поиск по идентификатору и названию, список идентификаторов и страницы
+    списка комнат читаются через кеш. Любая запись сбрасывает кеш целиком,
+    увеличивает версию списка комнат и на время задержки репликации
+    направляет чтение в основную базу, чтобы кеш не заполнился данными
+    реплики.
+
+    Attributes:
+        cache (Cache): Кеш чтения комнат.
     """
 
+    def __init__(self, model: type[MeetingRoom], cache: Cache):
+        super().__init__(model)
+        self.cache = cache
+
+    async def get_cached(
+            self,
+            room_id: int,
+            session: AsyncSession,
+    ) -> MeetingRoomDB | None:
+        """
+        Получает комнату по идентификатору через кеш.
+
+        Args:
+            room_id (int): Идентификатор комнаты.
+            session (AsyncSession): Асинхронная сессия SQLAlchemy.
+
+        Returns:
+            MeetingRoomDB or None: Данные комнаты или None, если комната
+                                   не найдена.
+        """
+        async def load():
+            room = await self.get(room_id, session)
+            return None if room is None else jsonable_encoder(
+                MeetingRoomDB.model_validate(room)
+            )
+
+        room = await self.cache.get_or_load(f'id:{room_id}', load)
+        return None if room is None else MeetingRoomDB(**room)
+
+    async def get_multi(
+            self,
+            session: AsyncSession,
+            *,
+            limit: int | None = None,
+            after: Sequence[Any] | None = None,
+            filters: Iterable[ColumnElement[bool]] = (),
+    ) -> list[dict[str, Any]]:
+        """
+        Получает страницу комнат через кеш.
+
+        Комнаты выбираются строками без создания объектов модели и
+        возвращаются словарями в формате MeetingRoomDB, готовыми к
+        сериализации. Страницы с дополнительными условиями отбора не
+        кешируются.
+
+        Args:
+            session (AsyncSession): Асинхронная сессия SQLAlchemy.
+            limit (int or None, default = None): Размер страницы,
+                                                 None — без ограничения.
+            after (Sequence or None, default = None): Значения полей
+                `ordering` последней комнаты предыдущей страницы.
+            filters (Iterable[ColumnElement[bool]], default = ()): Условия
+                                                               отбора.
+
+        Returns:
+            list[dict[str, Any]]: Данные комнат.
+        """
+        async def load():
+            rooms = await super(CRUDMeetingRoom, self).get_multi(
+                session,
+                limit=limit,
+                after=after,
+                filters=filters,
+                fields=tuple(MeetingRoomDB.model_fields),
+            )
+            return [room._asdict() for room in rooms]
+
+        filters = tuple(filters)
+        if filters:
+            return await load()
+        return await self.cache.get_or_load(
+            f'list:{limit}:{json.dumps(after)}', load
+        )
+
     async def get_room_id_by_name(
             self,
             room_name: str,
             session: AsyncSession,
     ) -> int | None:
         """
-        Получает идентификатор комнаты по ее названию.
+        Получает идентификатор комнаты по ее названию через кеш.
 
         Args:
             room_name (str): Название комнаты.
@@ -31,13 +129,126 @@ class CRUDMeetingRoom(CRUDBase[
             int or None: Идентификатор найденной комнаты или None,
                          если комната не найдена.
         """
-        db_room_id = await session.execute(
-            select(MeetingRoom.id).where(
-                MeetingRoom.name == room_name
+        async def load():
+            db_room_id = await session.execute(
+                select(MeetingRoom.id).where(
+                    MeetingRoom.name == room_name
+                )
             )
+            return db_room_id.scalars().first()
+
+        return await self.cache.get_or_load(
+            f'name:{json.dumps(room_name)}', load
         )
-        db_room_id = db_room_id.scalars().first()
-        return db_room_id
 
+    async def get_room_ids(
+            self,
+            session: AsyncSession,
+    ) -> list[int]:
+        """
+        Получает идентификаторы всех комнат по возрастанию через кеш.
 
-meeting_room_crud = CRUDMeetingRoom(MeetingRoom)
+        Args:
+            session (AsyncSession): Асинхронная сессия SQLAlchemy.
+
+        Returns:
+            list[int]: Идентификаторы комнат.
+        """
+        async def load():
+            room_ids = await session.execute(
+                select(MeetingRoom.id).order_by(MeetingRoom.id)
+            )
+            return room_ids.scalars().all()
+
+        return await self.cache.get_or_load('ids', load)
+
+    async def get_existing_ids(
+            self,
+            room_ids: Iterable[int],
+            session: AsyncSession,
+    ) -> set[int]:
+        """
+        Получает идентификаторы существующих комнат из указанных.
+
+        Args:
+            room_ids (Iterable[int]): Идентификаторы для проверки.
+            session (AsyncSession): Асинхронная сессия SQLAlchemy.
+
+        Returns:
+            set[int]: Идентификаторы найденных комнат.
+        """
+        return set(room_ids) & set(await self.get_room_ids(session))
+
+    async def create(
+            self,
+            obj_in: MeetingRoomCreate,
+            session: AsyncSession,
+            user: User | None = None,
+    ) -> MeetingRoom:
+        """
+        Создает комнату и сбрасывает кеш.
+        """
+        db_obj = await super().create(obj_in, session, user)
+        await self.cache.invalidate()
+        read_routing.pin_all()
+        change_versions.bump(MEETING_ROOMS)
+        return db_obj
+
+    async def update(
+            self,
+            db_obj: MeetingRoom,
+            obj_in: MeetingRoomUpdate,
+            session: AsyncSession,
+    ) -> MeetingRoom:
+        """
+        Обновляет комнату и сбрасывает кеш.
+        """
+        db_obj = await super().update(db_obj, obj_in, session)
+        await self.cache.invalidate()
+        read_routing.pin_all()
+        change_versions.bump(MEETING_ROOMS)
+        return db_obj
+
+    async def update_by_id(
+            self,
+            obj_id: int,
+            obj_in: MeetingRoomUpdate,
+            session: AsyncSession,
+    ) -> MeetingRoom | None:
+        """
+        Обновляет комнату одним запросом и сбрасывает кеш.
+        """
+        db_obj = await super().update_by_id(obj_id, obj_in, session)
+        if db_obj is not None:
+            await self.cache.invalidate()
+            read_routing.pin_all()
+            change_versions.bump(MEETING_ROOMS)
+        return db_obj
+
+    async def remove(
+            self,
+            db_obj: MeetingRoom,
+            session: AsyncSession,
+    ) -> MeetingRoom:
+        """
+        Удаляет комнату, сбрасывает кеш и исключает ее бронирования из
+        индекса интервалов.
+        """
+        db_obj = await super().remove(db_obj, session)
+        reservation_index.discard_room(db_obj.id)
+        await self.cache.invalidate()
+        read_routing.pin_all()
+        change_versions.bump(
+            MEETING_ROOMS, room_reservations_key(db_obj.id)
+        )
+        return db_obj
+
+
+meeting_room_crud = CRUDMeetingRoom(
+    MeetingRoom,
+    Cache(
+        'meeting_room',
+        InMemoryCache(settings.cache_maxsize),
+        settings.cache_ttl,
+    ),
+)
@@ -1,11 +1,32 @@
-from datetime import datetime
+import asyncio
+from collections.abc import AsyncIterator, Iterable, Sequence
+from contextlib import AsyncExitStack, asynccontextmanager
+from datetime import datetime, time, timedelta
+from typing import Any
+from weakref import WeakValueDictionary
 
-from sqlalchemy import select, and_, func
+from sqlalchemy import (
+    ColumnElement, DateTime, Label, Row, and_, case, exists, func, insert,
+    literal, select, text,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
+from app.core.config import settings
+from app.core.metrics import reservations_created
 from app.crud.base import CRUDBase
-from app.models import Reservation, User
+from app.crud.reservation_series import reservation_series_crud
+from app.crud.room_occupancy import room_occupancy_crud
+from app.crud.sql import (
+    add_hour, greatest, hour_of_day, least, seconds_between, trunc_hour
+)
+from app.models import MeetingRoom, Reservation, ReservationSeries, User
 from app.schemas.reservation import ReservationCreate, ReservationUpdate
+from app.services.interval_index import (
+    IndexedReservation, reservation_index
+)
+from app.services.recurrence import Occurrence
+from app.services.versions import change_versions, room_reservations_key
 
 
 class CRUDReservation(CRUDBase[
@@ -15,8 +36,373 @@ class CRUDReservation(CRUDBase[
 ]):
     """
     Класс для операций CRUD с моделью Reservation.
+
+    Операции записи в той же транзакции обновляют предрассчитанную
+    занятость комнат, увеличивают версию бронирований комнаты и
+    поддерживают в актуальном состоянии процессный индекс интервалов,
+    если он был построен при старте приложения.
+
+    Attributes:
+        ordering (tuple[str, ...]): Списки бронирований упорядочены по
+                                    времени начала.
+        room_locks (WeakValueDictionary[int, asyncio.Lock]): Блокировки
+                    переговорных комнат, удерживаемые на время записи.
     """
 
+    ordering = ('from_reserve', 'id')
+
+    def __init__(self, model: type[Reservation]):
+        super().__init__(model)
+        self.room_locks: WeakValueDictionary[int, asyncio.Lock] = (
+            WeakValueDictionary()
+        )
+
+    def _get_room_lock(self, room_id: int) -> asyncio.Lock:
+        lock = self.room_locks.get(room_id)
+        if lock is None:
+            lock = self.room_locks[room_id] = asyncio.Lock()
+        return lock
+
+    @asynccontextmanager
+    async def lock_rooms(
+            self,
+            room_ids: Iterable[int],
+            session: AsyncSession,
+    ) -> AsyncIterator[None]:
+        """
+        Сериализует запись бронирований в указанные комнаты.
+
+        Внутри контекста проверка пересечений и запись выполняются в одной
+        транзакции: в пределах процесса запросы к комнате выстраиваются в
+        очередь на asyncio-блокировке, а между процессами транзакцию
+        защищает база данных. SQLite открывает транзакцию через
+        `BEGIN IMMEDIATE`, остальные СУБД блокируют строки комнат через
+        `SELECT ... FOR UPDATE`. При исключении транзакция откатывается.
+
+        Перед ожиданием блокировки текущая транзакция чтения завершается,
+        чтобы ожидающие запросы не удерживали соединения из пула.
+
+        Args:
+            room_ids (Iterable[int]): Идентификаторы переговорных комнат.
+            session (AsyncSession): Асинхронная сессия SQLAlchemy.
+        """
+        room_ids = sorted(set(room_ids))
+        locks = [self._get_room_lock(room_id) for room_id in room_ids]
+        if session.in_transaction():
+            await session.commit()
+        async with AsyncExitStack() as stack:
+            for lock in locks:
+                await stack.enter_async_context(lock)
+            try:
+                if session.bind.dialect.name == 'sqlite':
+                    await session.execute(text('BEGIN IMMEDIATE'))
+                else:
+                    await session.execute(
+                        select(MeetingRoom.id).where(
+                            MeetingRoom.id.in_(room_ids)
+                        ).with_for_update()
+                    )
+                yield
+            except BaseException:
+                await session.rollback()
+                raise
+
+    @asynccontextmanager
+    async def lock_reservation(
+            self,
+            reservation_id: int,
+            session: AsyncSession,
+            *where: ColumnElement[bool],
+            columns: Sequence[ColumnElement] = (),
+    ) -> AsyncIterator[Row | None]:
+        """
+        Открывает транзакцию записи и читает в ней бронирование.
+
+        Бронирование читается уже под блокировкой, поэтому проверка
+        пересечений и запись видят его текущее состояние. SQLite открывает
+        транзакцию через `BEGIN IMMEDIATE`, остальные СУБД одним запросом
+        блокируют строки бронирования и его комнаты через
+        `SELECT ... FOR UPDATE`, что сериализует запись с `lock_rooms`.
+        Блокировка комнаты в процессе не берется: комната известна только
+        после чтения, а ожидание блокировки внутри открытой транзакции
+        могло бы взаимно заблокироваться с `lock_rooms`. При исключении
+        транзакция откатывается.
+
+        Args:
+            reservation_id (int): Идентификатор бронирования.
+            session (AsyncSession): Асинхронная сессия SQLAlchemy.
+            *where (ColumnElement[bool]): Дополнительные условия, например
+                                          проверка владельца.
+            columns (Sequence[ColumnElement], default = ()): Столбцы,
+                        читаемые тем же запросом, например признаки
+                        пересечений из `get_intersection_flags`.
+
+        Yields:
+            Row or None: Строка (Reservation, *columns) или None, если
+                         бронирование не найдено или не подходит под
+                         условия.
+        """
+        if session.in_transaction():
+            await session.commit()
+        stmt = select(Reservation, *columns).where(
+            Reservation.id == reservation_id, *where
+        ).execution_options(populate_existing=True)
+        try:
+            if session.bind.dialect.name == 'sqlite':
+                await session.execute(text('BEGIN IMMEDIATE'))
+            else:
+                stmt = stmt.join(MeetingRoom).with_for_update()
+            yield (await session.execute(stmt)).first()
+        except BaseException:
+            await session.rollback()
+            raise
+
+    def get_intersection_flags(
+            self,
+            from_reserve: datetime,
+            to_reserve: datetime,
+    ) -> tuple[Label[bool], Label[bool]]:
+        """
+        Строит признаки пересечения нового интервала читаемого бронирования.
+
+        Подзапросы связаны с выбираемой строкой Reservation, поэтому
+        проверка выполняется тем же запросом, что и чтение бронирования в
+        `lock_reservation`.
+
+        Args:
+            from_reserve (datetime): Новое время начала бронирования.
+            to_reserve (datetime): Новое время окончания бронирования.
+
+        Returns:
+            tuple[Label[bool], Label[bool]]: Признак `intersects` —
+                пересечение с другим бронированием комнаты, и признак
+                `series_in_window` — период действия серии комнаты
+                пересекается с интервалом.
+        """
+        other = aliased(Reservation)
+        return (
+            exists().where(
+                other.meetingroom_id == Reservation.meetingroom_id,
+                other.id != Reservation.id,
+                other.from_reserve < to_reserve,
+                other.to_reserve > from_reserve,
+            ).label('intersects'),
+            exists().where(
+                ReservationSeries.meetingroom_id == Reservation.meetingroom_id,
+                ReservationSeries.from_reserve < to_reserve,
+                ReservationSeries.last_to_reserve > from_reserve,
+            ).label('series_in_window'),
+        )
+
+    async def create(
+            self,
+            obj_in: ReservationCreate,
+            session: AsyncSession,
+            user: User | None = None,
+    ) -> Reservation:
+        """
+        Создает бронирование и добавляет его в занятость и индекс
+        интервалов.
+        """
+        db_obj = await super().create(obj_in, session, user, commit=False)
+        await room_occupancy_crud.apply([db_obj], session)
+        await session.commit()
+        reservations_created.inc()
+        change_versions.bump(room_reservations_key(db_obj.meetingroom_id))
+        if reservation_index.ready:
+            reservation_index.add(db_obj)
+        return db_obj
+
+    async def create_many(
+            self,
+            objs_in: Sequence[ReservationCreate],
+            session: AsyncSession,
+            user: User,
+    ) -> list[int]:
+        """
+        Создает бронирования одним пакетным INSERT и одним коммитом.
+
+        Args:
+            objs_in (Sequence[ReservationCreate]): Данные бронирований.
+            session (AsyncSession): Асинхронная сессия SQLAlchemy.
+            user (User): Пользователь, создающий бронирования.
+
+        Returns:
+            list[int]: Идентификаторы созданных бронирований в порядке
+                       входных данных.
+        """
+        if not objs_in:
+            return []
+        rows = [
+            {**obj_in.model_dump(), 'user_id': user.id} for obj_in in objs_in
+        ]
+        reservation_ids = await session.scalars(
+            insert(Reservation).returning(
+                Reservation.id, sort_by_parameter_order=True
+            ),
+            rows,
+        )
+        reservation_ids = reservation_ids.all()
+        await room_occupancy_crud.apply(objs_in, session)
+        await session.commit()
+        reservations_created.inc(len(reservation_ids))
+        change_versions.bump(*{
+            room_reservations_key(row['meetingroom_id']) for row in rows
+        })
+        if reservation_index.ready:
+            for reservation_id, row in zip(reservation_ids, rows):
+                reservation_index.add(
+                    IndexedReservation(id=reservation_id, **{
+                        field: row[field] for field in (
+                            'meetingroom_id', 'from_reserve', 'to_reserve'
+                        )
+                    })
+                )
+        return reservation_ids
+
+    async def update(
+            self,
+            db_obj: Reservation,
+            obj_in: ReservationUpdate,
+            session: AsyncSession,
+    ) -> Reservation:
+        """
+        Обновляет бронирование, занятость и его интервал в индексе.
+
+        Бронирование должно быть прочитано в текущей транзакции записи
+        (`lock_reservation`): прежний интервал берется из значений объекта
+        и заменяется в занятости новым одним запросом.
+        """
+        old = IndexedReservation(
+            id=db_obj.id,
+            meetingroom_id=db_obj.meetingroom_id,
+            from_reserve=db_obj.from_reserve,
+            to_reserve=db_obj.to_reserve,
+        )
+        db_obj = await super().update(db_obj, obj_in, session, commit=False)
+        await room_occupancy_crud.replace([old], [db_obj], session)
+        await session.commit()
+        change_versions.bump(room_reservations_key(db_obj.meetingroom_id))
+        if reservation_index.ready:
+            reservation_index.add(db_obj)
+        return db_obj
+
+    async def remove(
+            self,
+            db_obj: Reservation,
+            session: AsyncSession,
+    ) -> Reservation:
+        """
+        Удаляет бронирование и исключает его из занятости и индекса
+        интервалов.
+        """
+        await room_occupancy_crud.apply([db_obj], session, sign=-1)
+        db_obj = await super().remove(db_obj, session)
+        change_versions.bump(room_reservations_key(db_obj.meetingroom_id))
+        if reservation_index.ready:
+            reservation_index.discard(db_obj)
+        return db_obj
+
+    async def remove_by_id(
+            self,
+            obj_id: int,
+            session: AsyncSession,
+            *where: ColumnElement[bool],
+    ) -> Reservation | None:
+        """
+        Удаляет бронирование одним запросом `DELETE ... RETURNING` и
+        исключает его из занятости и индекса интервалов.
+        """
+        db_obj = await super().remove_by_id(
+            obj_id, session, *where, commit=False
+        )
+        if db_obj is None:
+            return None
+        await room_occupancy_crud.apply([db_obj], session, sign=-1)
+        await session.commit()
+        change_versions.bump(room_reservations_key(db_obj.meetingroom_id))
+        if reservation_index.ready:
+            reservation_index.discard(db_obj)
+        return db_obj
+
+    async def get_multi(
+            self,
+            session: AsyncSession,
+            *,
+            limit: int | None = None,
+            after: Sequence[Any] | None = None,
+            meetingroom_id: int | None = None,
+            user_id: int | None = None,
+            from_reserve: datetime | None = None,
+            to_reserve: datetime | None = None,
+            fields: Sequence[str] | None = None,
+    ) -> list[Reservation] | list[Row]:
+        """
+        Получает страницу бронирований с фильтрами.
+
+        Args:
+            session (AsyncSession): Асинхронная сессия SQLAlchemy.
+            limit (int or None, default = None): Размер страницы.
+            after (Sequence or None, default = None): Ключ последнего
+                            бронирования предыдущей страницы.
+            meetingroom_id (int or None, default = None): Идентификатор
+                                                  переговорной комнаты.
+            user_id (int or None, default = None): Идентификатор
+                                                   пользователя.
+            from_reserve (datetime or None, default = None): Бронирования,
+                                          заканчивающиеся не раньше.
+            to_reserve (datetime or None, default = None): Бронирования,
+                                          начинающиеся не позже.
+            fields (Sequence[str] or None, default = None): Поля для
+                        выборки строками вместо объектов модели.
+
+        Returns:
+            list[Reservation] or list[Row]: Список бронирований.
+        """
+        filters = []
+        if meetingroom_id is not None:
+            filters.append(Reservation.meetingroom_id == meetingroom_id)
+        if user_id is not None:
+            filters.append(Reservation.user_id == user_id)
+        if from_reserve is not None:
+            filters.append(Reservation.to_reserve >= from_reserve)
+        if to_reserve is not None:
+            filters.append(Reservation.from_reserve <= to_reserve)
+        return await super().get_multi(
+            session, limit=limit, after=after, filters=filters, fields=fields
+        )
+
+    async def stream_columns(
+            self,
+            session: AsyncSession,
+            chunk_size: int,
+    ) -> AsyncIterator[Sequence[Row]]:
+        """
+        Потоково читает все бронирования порциями строк.
+
+        Строки выбираются серверным курсором, в памяти одновременно
+        находится не больше одной порции.
+
+        Args:
+            session (AsyncSession): Асинхронная сессия SQLAlchemy.
+            chunk_size (int): Количество строк в порции.
+
+        Yields:
+            Sequence[Row]: Порция строк (id, from_reserve, to_reserve,
+                           meetingroom_id, user_id).
+        """
+        result = await session.stream(
+            select(
+                Reservation.id,
+                Reservation.from_reserve,
+                Reservation.to_reserve,
+                Reservation.meetingroom_id,
+                Reservation.user_id,
+            ).order_by(Reservation.id).execution_options(yield_per=chunk_size)
+        )
+        async for partition in result.partitions():
+            yield partition
+
     async def get_reservations_at_the_same_time(
             self,
             *,
@@ -29,6 +415,10 @@ class CRUDReservation(CRUDBase[
         """
         Получает бронирования, происходящие в указанный период времени.
 
+        Период и бронирования считаются полуинтервалами: бронирование,
+        заканчивающееся в момент начала периода или начинающееся в момент
+        его окончания, не пересекается с ним.
+
         Args:
             from_reserve (datetime): Время начала бронирования.
             to_reserve (datetime): Время окончания бронирования.
@@ -45,8 +435,8 @@ class CRUDReservation(CRUDBase[
         select_stmt = select(Reservation).where(
             Reservation.meetingroom_id == meetingroom_id,
             and_(
-                from_reserve <= Reservation.to_reserve,
-                to_reserve >= Reservation.from_reserve
+                from_reserve < Reservation.to_reserve,
+                to_reserve > Reservation.from_reserve
             )
         )
         if reservation_id is not None:
@@ -57,82 +447,291 @@ class CRUDReservation(CRUDBase[
         reservations = reservations.scalars().all()
         return reservations
 
+    async def get_intervals_in_window(
+            self,
+            from_reserve: datetime,
+            to_reserve: datetime,
+            session: AsyncSession,
+    ) -> list[Row | Occurrence]:
+        """
+        Получает интервалы бронирований и вхождений серий всех комнат,
+        пересекающиеся с периодом, отсортированные по комнате и времени
+        начала.
+
+        Args:
+            from_reserve (datetime): Начало периода.
+            to_reserve (datetime): Конец периода.
+            session (AsyncSession): Асинхронная сессия SQLAlchemy.
+
+        Returns:
+            list[Row | Occurrence]: Интервалы с полями meetingroom_id,
+                                    from_reserve и to_reserve.
+        """
+        intervals = await session.execute(
+            select(
+                Reservation.meetingroom_id,
+                Reservation.from_reserve,
+                Reservation.to_reserve,
+            ).where(
+                Reservation.to_reserve > from_reserve,
+                Reservation.from_reserve < to_reserve,
+            ).order_by(Reservation.meetingroom_id, Reservation.from_reserve)
+        )
+        intervals = intervals.all()
+        occurrences = (
+            await reservation_series_crud.get_occurrences_at_the_same_time(
+                from_reserve=from_reserve,
+                to_reserve=to_reserve,
+                session=session,
+            )
+        )
+        if occurrences:
+            intervals = sorted(
+                [*intervals, *occurrences],
+                key=lambda interval: (
+                    interval.meetingroom_id, interval.from_reserve
+                ),
+            )
+        return intervals
+
+    async def get_intervals_for_rooms(
+            self,
+            room_ids: Iterable[int],
+            from_reserve: datetime,
+            to_reserve: datetime,
+            session: AsyncSession,
+    ) -> list[Row | Occurrence]:
+        """
+        Получает интервалы бронирований и вхождений серий указанных комнат,
+        пересекающиеся с периодом.
+
+        Args:
+            room_ids (Iterable[int]): Идентификаторы переговорных комнат.
+            from_reserve (datetime): Начало периода.
+            to_reserve (datetime): Конец периода.
+            session (AsyncSession): Асинхронная сессия SQLAlchemy.
+
+        Returns:
+            list[Row | Occurrence]: Интервалы с полями meetingroom_id,
+                                    from_reserve и to_reserve.
+        """
+        intervals = await session.execute(
+            select(
+                Reservation.id,
+                Reservation.meetingroom_id,
+                Reservation.from_reserve,
+                Reservation.to_reserve,
+            ).where(
+                Reservation.meetingroom_id.in_(room_ids),
+                Reservation.to_reserve > from_reserve,
+                Reservation.from_reserve < to_reserve,
+            )
+        )
+        return [
+            *intervals.all(),
+            *await reservation_series_crud.get_occurrences_at_the_same_time(
+                from_reserve=from_reserve,
+                to_reserve=to_reserve,
+                meetingroom_ids=room_ids,
+                session=session,
+            ),
+        ]
+
     async def get_future_reservations_for_room(
             self,
             room_id: int,
             session: AsyncSession
-    ) -> list[Reservation]:
+    ) -> list[Row | Occurrence]:
         """
         Получает будущие бронирования для комнаты.
 
+        Бронирования выбираются строками без создания объектов модели.
+        Вхождения повторяющихся бронирований вычисляются на
+        recurrence_horizon_days дней вперед.
+
         Args:
             room_id (int): Идентификатор переговорной комнаты.
             session (AsyncSession): Асинхронная сессия SQLAlchemy.
 
         Returns:
-            list[Reservation]: Список будущих бронирований для указанной
-                               комнаты.
+            list[Row | Occurrence]: Список будущих бронирований для
+                               указанной комнаты по времени начала.
         """
+        now = datetime.now()
         reservations = await session.execute(
-            select(Reservation).where(
+            select(
+                Reservation.from_reserve,
+                Reservation.to_reserve,
+                Reservation.id,
+                Reservation.meetingroom_id,
+            ).where(
                 Reservation.meetingroom_id == room_id,
-                Reservation.to_reserve > datetime.now()
+                Reservation.to_reserve > now
+            ).order_by(Reservation.from_reserve)
+        )
+        reservations = reservations.all()
+        occurrences = (
+            await reservation_series_crud.get_occurrences_at_the_same_time(
+                from_reserve=now,
+                to_reserve=now + timedelta(
+                    days=settings.recurrence_horizon_days
+                ),
+                meetingroom_ids=[room_id],
+                session=session,
             )
         )
-        reservations = reservations.scalars().all()
+        if occurrences:
+            reservations = sorted(
+                [*reservations, *occurrences],
+                key=lambda reservation: reservation.from_reserve,
+            )
         return reservations
 
     async def get_by_user(
             self,
             session: AsyncSession,
             user: User,
-    ) -> list[Reservation]:
+            fields: Sequence[str] | None = None,
+    ) -> list[Reservation] | list[Row]:
         """
         Получает бронирования, сделанные пользователем.
 
         Args:
             session (AsyncSession): Асинхронная сессия SQLAlchemy.
             user (User): Пользователь, чьи бронирования необходимо получить.
+            fields (Sequence[str] or None, default = None): Поля для
+                        выборки строками вместо объектов модели.
 
         Returns:
-            list[Reservation]: Список бронирований, сделанных указанным
-                               пользователем.
+            list[Reservation] or list[Row]: Список бронирований, сделанных
+                               указанным пользователем.
         """
-        reservations = await session.execute(
-            select(Reservation).where(
-                Reservation.user_id == user.id
-            )
+        return await super().get_multi(
+            session,
+            filters=[Reservation.user_id == user.id],
+            fields=fields,
         )
-        reservations = reservations.scalars().all()
-        return reservations
 
-    async def get_count_res_at_the_same_time(
-        self,
-        from_reserve: datetime,
-        to_reserve: datetime,
-        session: AsyncSession,
-    ) -> list[dict[str, int]]:
+    async def get_hourly_occupancy(
+            self,
+            from_reserve: datetime,
+            to_reserve: datetime,
+            session: AsyncSession,
+            count_started_before: bool = True,
+    ) -> list[Row]:
         """
-        Получает id переговорки и кол-во ее бронирований
+        Получает занятость комнат по часам суток в периоде.
+
+        Период разбивается на часы рекурсивным CTE, бронирования
+        обрезаются по границам каждого часа и периода, а результат
+        группируется по комнате и часу суток в одном запросе. Бронирование
+        учитывается в количестве один раз — в часе, где начинается его
+        часть внутри периода.
 
         Args:
-            from_reserve (datetime): Время начала бронирования.
-            to_reserve (datetime): Время окончания бронирования.
+            from_reserve (datetime): Начало периода.
+            to_reserve (datetime): Конец периода.
             session (AsyncSession): Асинхронная сессия SQLAlchemy.
+            count_started_before (bool, default = True): Учитывать в
+                        количестве бронирования, начавшиеся до периода.
 
         Returns:
-            list[{meetingroom_id: id, count: count}]: Список бронирований,
-                                            сделанных указанным пользователем.
+            list[Row]: Строки (meetingroom_id, hour, seconds, count) —
+                       занятые секунды и число бронирований по часам.
         """
-        reservations = await session.execute(
-            select(Reservation.meetingroom_id,
-                   func.count(Reservation.meetingroom_id)).where(
-                Reservation.from_reserve >= from_reserve,
-                Reservation.to_reserve <= to_reserve
-            ).group_by(Reservation.meetingroom_id)
+        window_start = literal(from_reserve, DateTime)
+        window_end = literal(to_reserve, DateTime)
+        hours = select(
+            trunc_hour(window_start).label('hour_start')
+        ).cte('hours', recursive=True)
+        hours = hours.union_all(
+            select(add_hour(hours.c.hour_start)).where(
+                add_hour(hours.c.hour_start) < window_end
+            )
         )
-        reservations = reservations.mappings().all()
-        return reservations
+        hour_end = add_hour(hours.c.hour_start)
+        start = greatest(Reservation.from_reserve, window_start)
+        clipped_start = greatest(start, hours.c.hour_start)
+        clipped_end = least(Reservation.to_reserve, window_end, hour_end)
+        hour = hour_of_day(hours.c.hour_start).label('hour')
+        if count_started_before:
+            counted = start >= hours.c.hour_start
+        else:
+            counted = and_(
+                Reservation.from_reserve >= window_start,
+                Reservation.from_reserve >= hours.c.hour_start,
+            )
+        rows = await session.execute(
+            select(
+                Reservation.meetingroom_id,
+                hour,
+                func.sum(
+                    seconds_between(clipped_start, clipped_end)
+                ).label('seconds'),
+                func.sum(
+                    case((counted, 1), else_=0)
+                ).label('count'),
+            ).join(
+                hours,
+                and_(
+                    Reservation.from_reserve < hour_end,
+                    Reservation.to_reserve > hours.c.hour_start,
+                ),
+            ).where(
+                Reservation.from_reserve < to_reserve,
+                Reservation.to_reserve > from_reserve,
+            ).group_by(Reservation.meetingroom_id, hour).order_by(
+                Reservation.meetingroom_id, hour
+            )
+        )
+        return rows.all()
+
+    async def get_period_occupancy(
+            self,
+            from_reserve: datetime,
+            to_reserve: datetime,
+            session: AsyncSession,
+    ) -> list[Row]:
+        """
+        Получает занятость комнат по часам суток в периоде с опорой на
+        предрассчитанную занятость.
+
+        Полные дни периода читаются из таблицы занятости, неполные дни в
+        начале и конце периода считаются по бронированиям. Первый день
+        периода считается по бронированиям всегда, чтобы в количестве
+        учитывались бронирования, начавшиеся до периода.
+
+        Args:
+            from_reserve (datetime): Начало периода.
+            to_reserve (datetime): Конец периода.
+            session (AsyncSession): Асинхронная сессия SQLAlchemy.
+
+        Returns:
+            list[Row]: Строки (meetingroom_id, hour, seconds, count) в
+                       формате get_hourly_occupancy. Строки одной комнаты
+                       и часа могут повторяться.
+        """
+        first_day = from_reserve.date() + timedelta(days=1)
+        last_day = to_reserve.date()
+        if first_day >= last_day:
+            return await self.get_hourly_occupancy(
+                from_reserve, to_reserve, session
+            )
+        days_start = datetime.combine(first_day, time())
+        days_end = datetime.combine(last_day, time())
+        rows = [
+            *await self.get_hourly_occupancy(
+                from_reserve, days_start, session
+            ),
+            *await room_occupancy_crud.get_hourly_occupancy(
+                first_day, last_day, session
+            ),
+        ]
+        if days_end < to_reserve:
+            rows.extend(await self.get_hourly_occupancy(
+                days_end, to_reserve, session, count_started_before=False
+            ))
+        return rows
 
 
 reservation_crud = CRUDReservation(Reservation)
@@ -0,0 +1,217 @@
+from collections.abc import Iterable
+from datetime import datetime
+
+from sqlalchemy import ColumnElement, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.base import CRUDBase
+from app.models import ReservationSeries, User
+from app.schemas.reservation_series import ReservationSeriesCreate
+from app.services.recurrence import (
+    Occurrence, get_last_to_reserve, get_period, iter_occurrences
+)
+from app.services.versions import change_versions, room_reservations_key
+
+
+class CRUDReservationSeries(CRUDBase[
+    ReservationSeries,
+    ReservationSeriesCreate,
+    ReservationSeriesCreate,
+]):
+    """
+    Класс для операций CRUD с моделью ReservationSeries.
+    """
+
+    def build(
+            self,
+            obj_in: ReservationSeriesCreate,
+            user: User | None = None,
+    ) -> ReservationSeries:
+        """
+        Создает несохраненный объект серии с вычисленным окончанием
+        последнего вхождения.
+
+        Args:
+            obj_in (ReservationSeriesCreate): Данные для создания серии.
+            user (User or None, default= None): Пользователь, создающий серию.
+
+        Returns:
+            ReservationSeries: Объект серии.
+        """
+        obj_in_data = obj_in.model_dump()
+        obj_in_data['frequency'] = obj_in.frequency.value
+        obj_in_data['last_to_reserve'] = get_last_to_reserve(
+            obj_in.from_reserve,
+            obj_in.to_reserve,
+            get_period(obj_in.frequency.value, obj_in.interval),
+            obj_in.count,
+            obj_in.until,
+        )
+        if user is not None:
+            obj_in_data['user_id'] = user.id
+        return ReservationSeries(**obj_in_data)
+
+    async def create(
+            self,
+            obj_in: ReservationSeriesCreate,
+            session: AsyncSession,
+            user: User | None = None,
+    ) -> ReservationSeries:
+        """
+        Создает серию повторяющихся бронирований.
+
+        Args:
+            obj_in (ReservationSeriesCreate): Данные для создания серии.
+            session (AsyncSession): Асинхронная сессия SQLAlchemy.
+            user (User or None, default= None): Пользователь, создающий серию.
+
+        Returns:
+            ReservationSeries: Созданная серия.
+        """
+        db_obj = self.build(obj_in, user)
+        session.add(db_obj)
+        await session.commit()
+        change_versions.bump(room_reservations_key(db_obj.meetingroom_id))
+        return db_obj
+
+    async def remove(
+            self,
+            db_obj: ReservationSeries,
+            session: AsyncSession,
+    ) -> ReservationSeries:
+        """
+        Удаляет серию и увеличивает версию бронирований комнаты.
+        """
+        db_obj = await super().remove(db_obj, session)
+        change_versions.bump(room_reservations_key(db_obj.meetingroom_id))
+        return db_obj
+
+    async def remove_by_id(
+            self,
+            obj_id: int,
+            session: AsyncSession,
+            *where: ColumnElement[bool],
+    ) -> ReservationSeries | None:
+        """
+        Удаляет серию одним запросом `DELETE ... RETURNING` и
+        увеличивает версию бронирований комнаты.
+        """
+        db_obj = await super().remove_by_id(obj_id, session, *where)
+        if db_obj is not None:
+            change_versions.bump(
+                room_reservations_key(db_obj.meetingroom_id)
+            )
+        return db_obj
+
+    async def get_series_in_window(
+            self,
+            *,
+            from_reserve: datetime,
+            to_reserve: datetime,
+            session: AsyncSession,
+            meetingroom_ids: Iterable[int] | None = None,
+            series_id: int | None = None,
+    ) -> list[ReservationSeries]:
+        """
+        Получает серии, период действия которых пересекается с указанным.
+
+        Args:
+            from_reserve (datetime): Начало периода.
+            to_reserve (datetime): Конец периода.
+            session (AsyncSession): Асинхронная сессия SQLAlchemy.
+            meetingroom_ids (Iterable[int] or None, default = None):
+                            Идентификаторы переговорных комнат.
+            series_id (int or None, default = None): Идентификатор серии
+                                             (для исключения при поиске).
+
+        Returns:
+            list[ReservationSeries]: Список серий.
+        """
+        select_stmt = select(ReservationSeries).where(
+            ReservationSeries.from_reserve < to_reserve,
+            ReservationSeries.last_to_reserve > from_reserve,
+        )
+        if meetingroom_ids is not None:
+            select_stmt = select_stmt.where(
+                ReservationSeries.meetingroom_id.in_(meetingroom_ids)
+            )
+        if series_id is not None:
+            select_stmt = select_stmt.where(
+                ReservationSeries.id != series_id
+            )
+        series = await session.execute(select_stmt)
+        return series.scalars().all()
+
+    async def get_occurrences_at_the_same_time(
+            self,
+            *,
+            from_reserve: datetime,
+            to_reserve: datetime,
+            session: AsyncSession,
+            meetingroom_ids: Iterable[int] | None = None,
+    ) -> list[Occurrence]:
+        """
+        Получает вхождения серий, пересекающиеся с указанным периодом.
+
+        Вхождения вычисляются только внутри периода.
+
+        Args:
+            from_reserve (datetime): Начало периода.
+            to_reserve (datetime): Конец периода.
+            session (AsyncSession): Асинхронная сессия SQLAlchemy.
+            meetingroom_ids (Iterable[int] or None, default = None):
+                            Идентификаторы переговорных комнат.
+
+        Returns:
+            list[Occurrence]: Список вхождений по времени начала.
+        """
+        occurrences = []
+        for series in await self.get_series_in_window(
+            from_reserve=from_reserve,
+            to_reserve=to_reserve,
+            meetingroom_ids=meetingroom_ids,
+            session=session,
+        ):
+            occurrences.extend(
+                iter_occurrences(series, from_reserve, to_reserve)
+            )
+        occurrences.sort(key=lambda occurrence: occurrence.from_reserve)
+        return occurrences
+
+    async def get_next_occurrence_start(
+            self,
+            meetingroom_id: int,
+            after: datetime,
+            session: AsyncSession,
+    ) -> datetime | None:
+        """
+        Получает время начала ближайшего вхождения серий комнаты,
+        начинающегося позже указанного времени.
+
+        Args:
+            meetingroom_id (int): Идентификатор переговорной комнаты.
+            after (datetime): Время, после которого ищется вхождение.
+            session (AsyncSession): Асинхронная сессия SQLAlchemy.
+
+        Returns:
+            datetime or None: Время начала или None, если вхождений нет.
+        """
+        series = await session.execute(
+            select(ReservationSeries).where(
+                ReservationSeries.meetingroom_id == meetingroom_id,
+                ReservationSeries.last_to_reserve > after,
+            )
+        )
+        starts = []
+        for item in series.scalars():
+            period = get_period(item.frequency, item.interval)
+            for occurrence in iter_occurrences(
+                item, after, after + period * 2
+            ):
+                if occurrence.from_reserve > after:
+                    starts.append(occurrence.from_reserve)
+                    break
+        return min(starts, default=None)
+
+
+reservation_series_crud = CRUDReservationSeries(ReservationSeries)
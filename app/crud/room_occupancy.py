@@ -0,0 +1,199 @@
+from collections.abc import Iterable
+from datetime import date
+from typing import Any
+
+from sqlalchemy import Row, delete, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Reservation, RoomOccupancy
+from app.services.occupancy import (
+    OccupancyKey, aggregate_occupancy, merge_occupancy
+)
+
+# Остаток секунд после вычитания, меньший микросекунды, считается нулем.
+EMPTY_SECONDS = 1e-7
+
+
+class CRUDRoomOccupancy:
+    """
+    Класс для операций с предрассчитанной занятостью переговорных комнат.
+
+    Изменения применяются в транзакции вызывающего кода и не фиксируются
+    здесь, чтобы занятость менялась атомарно вместе с бронированиями.
+
+    Attributes:
+        model (type[RoomOccupancy]): Модель занятости.
+    """
+
+    def __init__(self, model: type[RoomOccupancy]):
+        self.model = model
+
+    def _insert(self, session: AsyncSession):
+        if session.bind.dialect.name == 'postgresql':
+            return postgresql.insert(self.model)
+        return sqlite.insert(self.model)
+
+    async def _upsert(
+            self,
+            occupancy: dict[OccupancyKey, list[float]],
+            session: AsyncSession,
+    ) -> None:
+        stmt = self._insert(session)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['meetingroom_id', 'day', 'hour'],
+            set_={
+                'seconds': self.model.seconds + stmt.excluded.seconds,
+                'count': self.model.count + stmt.excluded.count,
+            },
+        )
+        await session.execute(stmt, [
+            {
+                'meetingroom_id': meetingroom_id,
+                'day': day,
+                'hour': hour,
+                'seconds': seconds,
+                'count': count,
+            }
+            for (meetingroom_id, day, hour), (seconds, count)
+            in occupancy.items()
+        ])
+
+    async def _delete_empty(
+            self,
+            occupancy: dict[OccupancyKey, list[float]],
+            session: AsyncSession,
+    ) -> None:
+        await session.execute(
+            delete(self.model).where(
+                self.model.meetingroom_id.in_({key[0] for key in occupancy}),
+                self.model.day.in_({key[1] for key in occupancy}),
+                self.model.count <= 0,
+                func.abs(self.model.seconds) < EMPTY_SECONDS,
+            )
+        )
+
+    async def apply(
+            self,
+            intervals: Iterable[Any],
+            session: AsyncSession,
+            sign: int = 1,
+    ) -> None:
+        """
+        Добавляет интервалы бронирований к занятости или вычитает их.
+
+        После вычитания удаляются строки затронутых комнат и дней, в
+        которых не осталось ни секунд, ни бронирований.
+
+        Args:
+            intervals (Iterable[Any]): Интервалы с полями meetingroom_id,
+                                       from_reserve и to_reserve.
+            session (AsyncSession): Асинхронная сессия SQLAlchemy.
+            sign (int, default = 1): 1 для добавления, -1 для вычитания.
+        """
+        occupancy = aggregate_occupancy(intervals, sign)
+        if not occupancy:
+            return
+        await self._upsert(occupancy, session)
+        if sign < 0:
+            await self._delete_empty(occupancy, session)
+
+    async def replace(
+            self,
+            old: Iterable[Any],
+            new: Iterable[Any],
+            session: AsyncSession,
+    ) -> None:
+        """
+        Заменяет в занятости прежние интервалы бронирований новыми.
+
+        Разница применяется одним запросом: часы, занятость которых не
+        изменилась, не обновляются.
+
+        Args:
+            old (Iterable[Any]): Прежние интервалы с полями meetingroom_id,
+                                 from_reserve и to_reserve.
+            new (Iterable[Any]): Новые интервалы.
+            session (AsyncSession): Асинхронная сессия SQLAlchemy.
+        """
+        occupancy = {
+            key: totals
+            for key, totals in merge_occupancy(
+                aggregate_occupancy(old, -1), aggregate_occupancy(new)
+            ).items()
+            if totals[1] or abs(totals[0]) >= EMPTY_SECONDS
+        }
+        if not occupancy:
+            return
+        await self._upsert(occupancy, session)
+        await self._delete_empty(occupancy, session)
+
+    async def rebuild(
+            self,
+            session: AsyncSession,
+            chunk_size: int = 10_000,
+    ) -> int:
+        """
+        Пересчитывает занятость по всем бронированиям и фиксирует
+        транзакцию.
+
+        Args:
+            session (AsyncSession): Асинхронная сессия SQLAlchemy.
+            chunk_size (int, default = 10_000): Количество бронирований,
+                                                читаемых за раз.
+
+        Returns:
+            int: Количество строк занятости.
+        """
+        await session.execute(delete(self.model))
+        result = await session.stream(
+            select(
+                Reservation.meetingroom_id,
+                Reservation.from_reserve,
+                Reservation.to_reserve,
+            ).execution_options(yield_per=chunk_size)
+        )
+        occupancy = {}
+        async for partition in result.partitions():
+            merge_occupancy(occupancy, aggregate_occupancy(partition))
+        if occupancy:
+            await self._upsert(occupancy, session)
+        await session.commit()
+        return len(occupancy)
+
+    async def get_hourly_occupancy(
+            self,
+            from_day: date,
+            to_day: date,
+            session: AsyncSession,
+    ) -> list[Row]:
+        """
+        Получает занятость комнат по часам суток за полные дни.
+
+        Args:
+            from_day (date): Первый день периода.
+            to_day (date): День после последнего дня периода.
+            session (AsyncSession): Асинхронная сессия SQLAlchemy.
+
+        Returns:
+            list[Row]: Строки (meetingroom_id, hour, seconds, count) —
+                       занятые секунды и число бронирований, начавшихся
+                       в эти дни, по часам.
+        """
+        rows = await session.execute(
+            select(
+                self.model.meetingroom_id,
+                self.model.hour,
+                func.sum(self.model.seconds).label('seconds'),
+                func.sum(self.model.count).label('count'),
+            ).where(
+                self.model.day >= from_day,
+                self.model.day < to_day,
+            ).group_by(self.model.meetingroom_id, self.model.hour).order_by(
+                self.model.meetingroom_id, self.model.hour
+            )
+        )
+        return rows.all()
+
+
+room_occupancy_crud = CRUDRoomOccupancy(RoomOccupancy)
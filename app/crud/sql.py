@@ -0,0 +1,141 @@
+from sqlalchemy import DateTime, Float, Integer
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+# Даты в SQLite хранятся строками в формате SQLAlchemy. Выражения ниже
+# возвращают строки того же формата, чтобы их можно было сравнивать со
+# значениями колонок.
+SQLITE_HOUR_FORMAT = '%Y-%m-%d %H:00:00.000000'
+
+
+class greatest(FunctionElement):
+    """
+    Наибольший из аргументов: GREATEST или скалярный max в SQLite.
+    """
+    inherit_cache = True
+    type = DateTime()
+
+
+class least(FunctionElement):
+    """
+    Наименьший из аргументов: LEAST или скалярный min в SQLite.
+    """
+    inherit_cache = True
+    type = DateTime()
+
+
+class seconds_between(FunctionElement):
+    """
+    Число секунд от первого аргумента до второго.
+    """
+    inherit_cache = True
+    type = Float()
+
+
+class hour_of_day(FunctionElement):
+    """
+    Час суток момента времени, от 0 до 23.
+    """
+    inherit_cache = True
+    type = Integer()
+
+
+class trunc_hour(FunctionElement):
+    """
+    Момент времени, округленный вниз до начала часа.
+    """
+    inherit_cache = True
+    type = DateTime()
+
+
+class add_hour(FunctionElement):
+    """
+    Момент времени, увеличенный на один час.
+    """
+    inherit_cache = True
+    type = DateTime()
+
+
+@compiles(greatest)
+def compile_greatest(element, compiler, **kw):
+    return f'greatest({compiler.process(element.clauses, **kw)})'
+
+
+@compiles(greatest, 'sqlite')
+def compile_greatest_sqlite(element, compiler, **kw):
+    return f'max({compiler.process(element.clauses, **kw)})'
+
+
+@compiles(least)
+def compile_least(element, compiler, **kw):
+    return f'least({compiler.process(element.clauses, **kw)})'
+
+
+@compiles(least, 'sqlite')
+def compile_least_sqlite(element, compiler, **kw):
+    return f'min({compiler.process(element.clauses, **kw)})'
+
+
+@compiles(seconds_between)
+def compile_seconds_between(element, compiler, **kw):
+    start, end = element.clauses
+    return (
+        f'EXTRACT(EPOCH FROM ({compiler.process(end, **kw)} - '
+        f'{compiler.process(start, **kw)}))'
+    )
+
+
+@compiles(seconds_between, 'sqlite')
+def compile_seconds_between_sqlite(element, compiler, **kw):
+    start, end = element.clauses
+    return (
+        f'((julianday({compiler.process(end, **kw)}) - '
+        f'julianday({compiler.process(start, **kw)})) * 86400.0)'
+    )
+
+
+@compiles(hour_of_day)
+def compile_hour_of_day(element, compiler, **kw):
+    return (
+        f'CAST(EXTRACT(HOUR FROM {compiler.process(element.clauses, **kw)})'
+        ' AS INTEGER)'
+    )
+
+
+@compiles(hour_of_day, 'sqlite')
+def compile_hour_of_day_sqlite(element, compiler, **kw):
+    return (
+        f"CAST(strftime('%H', {compiler.process(element.clauses, **kw)})"
+        ' AS INTEGER)'
+    )
+
+
+@compiles(trunc_hour)
+def compile_trunc_hour(element, compiler, **kw):
+    return (
+        "date_trunc('hour', "
+        f'CAST({compiler.process(element.clauses, **kw)} AS TIMESTAMP))'
+    )
+
+
+@compiles(trunc_hour, 'sqlite')
+def compile_trunc_hour_sqlite(element, compiler, **kw):
+    return (
+        f"strftime('{SQLITE_HOUR_FORMAT}', "
+        f'{compiler.process(element.clauses, **kw)})'
+    )
+
+
+@compiles(add_hour)
+def compile_add_hour(element, compiler, **kw):
+    return (
+        f"({compiler.process(element.clauses, **kw)} + INTERVAL '1 hour')"
+    )
+
+
+@compiles(add_hour, 'sqlite')
+def compile_add_hour_sqlite(element, compiler, **kw):
+    return (
+        f"strftime('{SQLITE_HOUR_FORMAT}', "
+        f"{compiler.process(element.clauses, **kw)}, '+1 hour')"
+    )
@@ -1,10 +1,17 @@
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 
 from app.core.config import settings
+from app.core.db import ReadYourWritesMiddleware
 from app.api.routers import main_router
-from app.core.init_db import create_first_superuser
+from app.core.google_client import google_client
+from app.core.init_db import build_reservation_index, create_first_superuser
+from app.core.metrics import CONTENT_TYPE, MetricsMiddleware, registry
+from app.core.profiling import ServerTimingMiddleware
+from app.services.events import room_events
+from app.services.report_jobs import report_workers
 
 
 @asynccontextmanager
@@ -12,7 +19,10 @@ async def lifespan(app: FastAPI):
     """
     Асинхронный контекстный менеджер для жизненного цикла приложения.
 
-    Перед стартом приложения создает первого суперпользователя.
+    Перед стартом приложения создает первого суперпользователя, строит
+    индекс интервалов бронирований, открывает клиент Google API,
+    запускает воркеры отчетов и ленту событий комнат, которые
+    останавливаются при остановке.
 
     Parameters:
         app (FastAPI): Экземпляр FastAPI приложения.
@@ -21,7 +31,14 @@ async def lifespan(app: FastAPI):
         None
     """
     await create_first_superuser()
+    await build_reservation_index()
+    await google_client.start()
+    await report_workers.start()
+    await room_events.start()
     yield
+    await room_events.stop()
+    await report_workers.stop()
+    await google_client.close()
 
 
 app = FastAPI(
@@ -30,4 +47,17 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+app.add_middleware(ServerTimingMiddleware)
+if settings.database_read_url is not None:
+    app.add_middleware(ReadYourWritesMiddleware)
+app.add_middleware(MetricsMiddleware)
+
 app.include_router(main_router)
+
+
+@app.get('/metrics', include_in_schema=False)
+async def get_metrics():
+    """
+    Метрики приложения в текстовом формате Prometheus.
+    """
+    return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE)
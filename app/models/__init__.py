@@ -1,3 +1,5 @@
 from .meeting_room import MeetingRoom  # noqa
 from .reservation import Reservation  # noqa
 from .user import User  # noqa
+from .reservation_series import ReservationSeries  # noqa
+from .room_occupancy import RoomOccupancy  # noqa
@@ -8,6 +8,8 @@ from app.core.db import Base
 
 if TYPE_CHECKING:
     from app.models.reservation import Reservation
+    from app.models.reservation_series import ReservationSeries
+    from app.models.room_occupancy import RoomOccupancy
 
 
 class MeetingRoom(Base):
@@ -25,8 +27,15 @@ class MeetingRoom(Base):
         name (Mapped[str]): Название переговорной комнаты.
         description (Mapped[str or None]): Описание переговорной комнаты.
         reservations (relationship): Связь с моделью бронирований.
+        reservation_series (relationship): Связь с моделью повторяющихся
+                                           бронирований.
+        occupancy (relationship): Связь с предрассчитанной занятостью.
     """
     name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
     description: Mapped[str] = mapped_column(Text)
     reservations: Mapped[list['Reservation']] = relationship(
         'Reservation', cascade='delete')
+    reservation_series: Mapped[list['ReservationSeries']] = relationship(
+        'ReservationSeries', cascade='delete')
+    occupancy: Mapped[list['RoomOccupancy']] = relationship(
+        'RoomOccupancy', cascade='delete')
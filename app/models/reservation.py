@@ -1,4 +1,4 @@
-from sqlalchemy import DateTime, ForeignKey, Integer
+from sqlalchemy import DateTime, ForeignKey, Index, Integer
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.db import Base
@@ -22,6 +22,8 @@ class Reservation(Base):
                                       (Один-ко-многим).
         user_id (Mapped[int]): Внешний ключ на пользователя, сделавшего
                                бронирование (Один-ко-многим).
+        __table_args__ (tuple): Составные индексы под запросы поиска
+                                пересечений, будущих бронирований и отчета.
     """
     from_reserve: Mapped[DateTime] = mapped_column(DateTime)
     to_reserve: Mapped[DateTime] = mapped_column(DateTime)
@@ -34,6 +36,22 @@ class Reservation(Base):
         ForeignKey('user.id')
     )
 
+    __table_args__ = (
+        Index(
+            'ix_reservation_meetingroom_id_from_reserve_to_reserve',
+            'meetingroom_id', 'from_reserve', 'to_reserve',
+        ),
+        Index(
+            'ix_reservation_meetingroom_id_to_reserve',
+            'meetingroom_id', 'to_reserve',
+        ),
+        Index(
+            'ix_reservation_from_reserve_to_reserve',
+            'from_reserve', 'to_reserve',
+        ),
+        Index('ix_reservation_user_id', 'user_id'),
+    )
+
     def __repr__(self):
         return (
             f'Уже забронировано с {self.from_reserve} по {self.to_reserve}'
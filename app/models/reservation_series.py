@@ -0,0 +1,58 @@
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.db import Base
+
+
+class ReservationSeries(Base):
+    """
+    Модель повторяющегося бронирования переговорной комнаты.
+
+    Хранит правило повторения, а не отдельные бронирования: вхождения
+    серии вычисляются только в пределах запрошенного периода.
+
+    Inherits:
+        Base: Базовый класс для всех моделей.
+        Attributes:
+            __tablename__ (str): Имя таблицы, устанавливается как имя класса
+                                в нижнем регистре.
+            id (Mapped[int]): Первичный ключ.
+
+    Attributes:
+        from_reserve (Mapped[DateTime]): Время начала первого вхождения.
+        to_reserve (Mapped[DateTime]): Время окончания первого вхождения.
+        frequency (Mapped[str]): Частота повторения (daily или weekly).
+        interval (Mapped[int]): Шаг повторения в единицах частоты.
+        count (Mapped[int or None]): Количество вхождений.
+        until (Mapped[DateTime or None]): Время, позже которого вхождения
+                                          не начинаются.
+        last_to_reserve (Mapped[DateTime]): Время окончания последнего
+                                            вхождения.
+        meetingroom_id (Mapped[int]): Внешний ключ на переговорную комнату
+                                      (Один-ко-многим).
+        user_id (Mapped[int]): Внешний ключ на пользователя, создавшего
+                               серию (Один-ко-многим).
+        __table_args__ (tuple): Индекс для поиска серий комнаты в периоде.
+    """
+    from_reserve: Mapped[DateTime] = mapped_column(DateTime)
+    to_reserve: Mapped[DateTime] = mapped_column(DateTime)
+    frequency: Mapped[str] = mapped_column(String(10))
+    interval: Mapped[int] = mapped_column(Integer, default=1)
+    count: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    until: Mapped[DateTime | None] = mapped_column(DateTime, nullable=True)
+    last_to_reserve: Mapped[DateTime] = mapped_column(DateTime)
+    meetingroom_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey('meetingroom.id')
+    )
+    user_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey('user.id')
+    )
+
+    __table_args__ = (
+        Index(
+            'ix_reservationseries_room_interval',
+            'meetingroom_id', 'from_reserve', 'last_to_reserve',
+        ),
+    )
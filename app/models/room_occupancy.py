@@ -0,0 +1,52 @@
+from datetime import date
+
+from sqlalchemy import Date, Float, ForeignKey, Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.db import Base
+
+
+class RoomOccupancy(Base):
+    """
+    Модель предрассчитанной занятости переговорной комнаты за день.
+
+    Строка хранит занятость комнаты в одном часе одного дня, поэтому
+    отчет за период читает не больше 24 строк на комнату и день,
+    независимо от числа бронирований. Таблица обновляется при каждой
+    записи бронирования и может быть пересчитана командой
+    `python -m app.cli rebuild-occupancy`.
+
+    Inherits:
+        Base: Базовый класс для всех моделей.
+        Attributes:
+            __tablename__ (str): Имя таблицы, устанавливается как имя класса
+                                в нижнем регистре.
+            id (Mapped[int]): Первичный ключ.
+
+    Attributes:
+        meetingroom_id (Mapped[int]): Внешний ключ на переговорную комнату.
+        day (Mapped[date]): День.
+        hour (Mapped[int]): Час суток, от 0 до 23.
+        seconds (Mapped[float]): Забронированные секунды в этом часе.
+        count (Mapped[int]): Количество бронирований, начинающихся в этом
+                             часе.
+        __table_args__ (tuple): Уникальный индекс по комнате, дню и часу.
+    """
+    meetingroom_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey('meetingroom.id'),
+        nullable=False,
+    )
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    hour: Mapped[int] = mapped_column(Integer, nullable=False)
+    seconds: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index(
+            'ix_roomoccupancy_meetingroom_id_day_hour',
+            'meetingroom_id', 'day', 'hour',
+            unique=True,
+        ),
+        Index('ix_roomoccupancy_day', 'day'),
+    )
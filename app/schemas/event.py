@@ -0,0 +1,30 @@
+from enum import Enum
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class RoomEventType(str, Enum):
+    """
+    Тип изменения бронирований переговорной комнаты.
+    """
+    reservation_created = 'reservation_created'
+    reservation_updated = 'reservation_updated'
+    reservation_deleted = 'reservation_deleted'
+    series_created = 'series_created'
+    series_deleted = 'series_deleted'
+
+
+class RoomEvent(BaseModel):
+    """
+    Схема события в ленте изменений бронирований переговорной комнаты.
+
+    Attributes:
+        type (RoomEventType): Тип изменения.
+        meetingroom_id (int): Идентификатор переговорной комнаты.
+        data (dict[str, Any]): Бронирование или серия после изменения,
+                               для удаления — до него, без user_id.
+    """
+    type: RoomEventType
+    meetingroom_id: int
+    data: dict[str, Any]
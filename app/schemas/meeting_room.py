@@ -1,3 +1,6 @@
+from datetime import datetime
+from typing_extensions import TypedDict
+
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
@@ -53,3 +56,38 @@ class MeetingRoomDB(MeetingRoomCreate):
     """
     id: int
     model_config = ConfigDict(from_attributes=True)
+
+
+class MeetingRoomRow(TypedDict):
+    """
+    Переговорная комната в списке, сериализуемая без валидации.
+
+    Поля совпадают с MeetingRoomDB.
+    """
+    name: str
+    description: str | None
+    id: int
+
+
+class FreeSlot(BaseModel):
+    """
+    Схема свободного интервала переговорной комнаты.
+
+    Attributes:
+        from_reserve (datetime): Начало свободного интервала.
+        to_reserve (datetime): Конец свободного интервала.
+    """
+    from_reserve: datetime
+    to_reserve: datetime
+
+
+class RoomFreeSlots(BaseModel):
+    """
+    Схема свободных интервалов переговорной комнаты.
+
+    Attributes:
+        meetingroom_id (int): Идентификатор переговорной комнаты.
+        slots (list[FreeSlot]): Свободные интервалы по возрастанию.
+    """
+    meetingroom_id: int
+    slots: list[FreeSlot]
@@ -0,0 +1,67 @@
+from datetime import datetime
+from enum import Enum
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ReportJobStatus(str, Enum):
+    """
+    Состояние задачи построения отчета.
+    """
+    queued = 'queued'
+    running = 'running'
+    succeeded = 'succeeded'
+    failed = 'failed'
+
+
+class RoomStatistics(BaseModel):
+    """
+    Схема статистики бронирований переговорной комнаты за период.
+
+    Все величины считаются по частям бронирований внутри периода.
+
+    Attributes:
+        meetingroom_id (int): Идентификатор переговорной комнаты.
+        count (int): Количество бронирований, пересекающих период.
+        hours_booked (float): Забронированные часы.
+        utilization (float): Загрузка в процентах от длительности периода.
+        hours_histogram (list[float]): Забронированные часы по часам суток
+                                       с 0 до 23.
+    """
+    meetingroom_id: int
+    count: int
+    hours_booked: float
+    utilization: float
+    hours_histogram: list[float]
+
+
+class ReportJobDB(BaseModel):
+    """
+    Схема задачи построения отчета.
+
+    Attributes:
+        id (str): Идентификатор задачи.
+        status (ReportJobStatus): Состояние задачи.
+        stage (str or None): Выполняемый или последний выполненный этап.
+        attempts (int): Количество повторов после временных ошибок.
+        from_reserve (datetime): Начало периода отчета.
+        to_reserve (datetime): Конец периода отчета.
+        spreadsheet_id (str or None): Идентификатор созданной таблицы.
+        result (list[RoomStatistics] or None): Данные отчета.
+        error (str or None): Текст ошибки, если задача не выполнена.
+        created_at (datetime): Время создания задачи.
+        updated_at (datetime): Время последнего изменения задачи.
+    """
+    id: str
+    status: ReportJobStatus
+    stage: str | None = None
+    attempts: int
+    from_reserve: datetime
+    to_reserve: datetime
+    spreadsheet_id: str | None = None
+    result: list[RoomStatistics] | None = None
+    error: str | None = None
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
@@ -1,4 +1,6 @@
 from datetime import datetime, timedelta
+from enum import Enum
+from typing_extensions import TypedDict
 
 from pydantic import (BaseModel, ConfigDict, Field, model_validator,
                       field_validator)
@@ -95,3 +97,88 @@ class ReservationDB(ReservationBase):
     meetingroom_id: int
     user_id: int | None
     model_config = ConfigDict(from_attributes=True)
+
+
+class RoomReservationDB(ReservationDB):
+    """
+    Схема бронирования или вхождения повторяющегося бронирования в списке
+    бронирований комнаты.
+
+    Inherits:
+        ReservationDB: Схема бронирования в базе данных.
+
+    Attributes:
+        id (int or None): Идентификатор бронирования, None для вхождения
+                          серии.
+        series_id (int or None): Идентификатор серии для вхождения.
+    """
+    id: int | None = None
+    series_id: int | None = None
+
+
+class OwnReservationRow(TypedDict):
+    """
+    Бронирование в списке без создателя, сериализуемое без валидации.
+
+    Поля совпадают с ReservationDB без user_id.
+    """
+    from_reserve: datetime
+    to_reserve: datetime
+    id: int
+    meetingroom_id: int
+
+
+class ReservationRow(OwnReservationRow):
+    """
+    Бронирование в списке, сериализуемое без валидации.
+
+    Поля совпадают с ReservationDB.
+    """
+    user_id: int | None
+
+
+class RoomReservationRow(TypedDict):
+    """
+    Бронирование или вхождение серии в списке бронирований комнаты,
+    сериализуемое без валидации.
+
+    Поля совпадают с RoomReservationDB без user_id.
+    """
+    from_reserve: datetime
+    to_reserve: datetime
+    id: int | None
+    meetingroom_id: int
+    series_id: int | None
+
+
+class ExportFormat(str, Enum):
+    """
+    Формат потоковой выгрузки бронирований.
+    """
+    ndjson = 'ndjson'
+    csv = 'csv'
+
+
+class BatchItemStatus(str, Enum):
+    """
+    Результат создания бронирования из пакета.
+    """
+    created = 'created'
+    conflict = 'conflict'
+    room_not_found = 'room_not_found'
+
+
+class ReservationBatchResult(BaseModel):
+    """
+    Схема результата создания бронирования из пакета.
+
+    Attributes:
+        index (int): Позиция бронирования в пакете.
+        status (BatchItemStatus): Результат создания.
+        id (int or None): Идентификатор созданного бронирования.
+        detail (str or None): Причина отказа.
+    """
+    index: int
+    status: BatchItemStatus
+    id: int | None = None
+    detail: str | None = None
@@ -0,0 +1,101 @@
+from datetime import datetime
+from enum import Enum
+
+from pydantic import ConfigDict, Field, model_validator
+
+from app.schemas.reservation import ReservationBase, ReservationCreate
+from app.services.recurrence import get_last_to_reserve, get_period
+
+
+class Frequency(str, Enum):
+    """
+    Частота повторения бронирования.
+    """
+    daily = 'daily'
+    weekly = 'weekly'
+
+
+class ReservationSeriesCreate(ReservationCreate):
+    """
+    Схема для создания повторяющегося бронирования.
+
+    Inherits:
+        ReservationCreate: Схема для создания нового бронирования, задает
+                           первое вхождение серии.
+
+    Attributes:
+        frequency (Frequency): Частота повторения.
+        interval (int): Шаг повторения в единицах частоты.
+        count (int or None): Количество вхождений.
+        until (datetime or None): Время, позже которого вхождения
+                                  не начинаются.
+    """
+    frequency: Frequency
+    interval: int = Field(1, ge=1)
+    count: int | None = Field(None, ge=1)
+    until: datetime | None = None
+
+    @model_validator(mode='after')
+    def check_series_is_bounded(self):
+        """
+        Валидатор, проверяющий, что серия ограничена, заканчивается в
+        пределах допустимых дат и её вхождения не пересекаются друг с
+        другом.
+        """
+        if self.count is None and self.until is None:
+            raise ValueError(
+                'Укажите количество повторений или дату окончания серии'
+            )
+        if self.until is not None and self.until < self.from_reserve:
+            raise ValueError(
+                'Дата окончания серии не может быть раньше её начала'
+            )
+        try:
+            period = get_period(self.frequency.value, self.interval)
+            get_last_to_reserve(
+                self.from_reserve,
+                self.to_reserve,
+                period,
+                self.count,
+                self.until,
+            )
+        except OverflowError:
+            raise ValueError(
+                'Последнее вхождение серии выходит за допустимый диапазон дат'
+            )
+        if self.to_reserve - self.from_reserve >= period:
+            raise ValueError(
+                'Длительность бронирования должна быть меньше шага серии'
+            )
+        return self
+
+
+class ReservationSeriesDB(ReservationBase):
+    """
+    Схема повторяющегося бронирования в базе данных.
+
+    Inherits:
+        ReservationBase: Базовая схема бронирования.
+
+    Attributes:
+        id (int): Идентификатор серии.
+        frequency (Frequency): Частота повторения.
+        interval (int): Шаг повторения в единицах частоты.
+        count (int or None): Количество вхождений.
+        until (datetime or None): Время, позже которого вхождения
+                                  не начинаются.
+        last_to_reserve (datetime): Время окончания последнего вхождения.
+        meetingroom_id (int): Идентификатор переговорной комнаты.
+        user_id (int): Идентификатор пользователя, создавшего серию.
+        model_config (ConfigDict): Конфигурация схемы для сериализации объектов
+        базы данных, а не только Python-словарь или JSON-объект.
+    """
+    id: int
+    frequency: Frequency
+    interval: int
+    count: int | None
+    until: datetime | None
+    last_to_reserve: datetime
+    meetingroom_id: int
+    user_id: int | None
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,46 @@
+from collections.abc import Sequence
+
+from sqlalchemy import Row
+
+from app.schemas.reservation import ReservationCreate
+from app.services.interval_index import (
+    IndexedReservation, ReservationIntervalIndex
+)
+from app.services.recurrence import Occurrence
+
+
+def find_batch_conflicts(
+        reservations: Sequence[ReservationCreate],
+        intervals: Sequence[Row | Occurrence],
+) -> list[list[IndexedReservation]]:
+    """
+    Функция поиска пересечений пакета бронирований с существующими
+    интервалами и с уже принятыми бронированиями того же пакета.
+
+    Бронирования принимаются в порядке следования в пакете. Для каждого
+    возвращается список пересечений, пустой — если бронь можно создать.
+    """
+    index = ReservationIntervalIndex()
+    for position, interval in enumerate(intervals):
+        index.add(IndexedReservation(
+            id=position,
+            meetingroom_id=interval.meetingroom_id,
+            from_reserve=interval.from_reserve,
+            to_reserve=interval.to_reserve,
+        ))
+    conflicts = []
+    for position, reservation in enumerate(reservations):
+        intersections = index.get_reservations_at_the_same_time(
+            from_reserve=reservation.from_reserve,
+            to_reserve=reservation.to_reserve,
+            meetingroom_id=reservation.meetingroom_id,
+        )
+        if not intersections:
+            index.add(IndexedReservation(
+                id=-position - 1,
+                meetingroom_id=reservation.meetingroom_id,
+                from_reserve=reservation.from_reserve,
+                to_reserve=reservation.to_reserve,
+            ))
+        conflicts.append(intersections)
+    return conflicts
@@ -0,0 +1,254 @@
+import asyncio
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.schemas.event import RoomEvent, RoomEventType
+
+
+class Subscription:
+    """
+    Подписка на канал брокера событий.
+
+    Сообщения читаются асинхронной итерацией, которая завершается после
+    закрытия подписки.
+
+    Attributes:
+        channel (str): Канал подписки.
+        queue (asyncio.Queue[str | None]): Неотправленные сообщения,
+                    None означает закрытие подписки.
+        overflowed (bool): Подписка закрыта из-за переполнения очереди —
+                           подписчик пропустил сообщения.
+    """
+
+    def __init__(self, channel: str, maxsize: int):
+        self.channel = channel
+        self.queue: asyncio.Queue[str | None] = asyncio.Queue(maxsize + 1)
+        self.maxsize = maxsize
+        self.closed = False
+        self.overflowed = False
+
+    def put(self, message: str) -> None:
+        """
+        Добавляет сообщение в очередь подписки без ожидания.
+
+        Подписчик, не успевающий читать сообщения, отключается: ему
+        нужно переподключиться и заново получить список бронирований.
+
+        Args:
+            message (str): Сообщение.
+        """
+        if self.closed:
+            return
+        if self.queue.qsize() >= self.maxsize:
+            self.overflowed = True
+            self.close()
+            return
+        self.queue.put_nowait(message)
+
+    def close(self) -> None:
+        """
+        Закрывает подписку.
+        """
+        if not self.closed:
+            self.closed = True
+            self.queue.put_nowait(None)
+
+    def __aiter__(self) -> 'Subscription':
+        return self
+
+    async def __anext__(self) -> str:
+        message = await self.queue.get()
+        if message is None:
+            raise StopAsyncIteration
+        return message
+
+
+class EventBroker(ABC):
+    """
+    Брокер, рассылающий сообщения подписчикам каналов.
+
+    Сообщения передаются строками, поэтому брокер в памяти можно
+    заменить общим для нескольких процессов брокером с тем же
+    интерфейсом.
+    """
+
+    @abstractmethod
+    async def publish(self, channel: str, message: str) -> None:
+        """
+        Отправляет сообщение всем подписчикам канала.
+
+        Args:
+            channel (str): Канал.
+            message (str): Сообщение.
+        """
+
+    @abstractmethod
+    def subscribe(self, channel: str) -> Subscription:
+        """
+        Подписывается на канал.
+
+        Args:
+            channel (str): Канал.
+
+        Returns:
+            Subscription: Подписка.
+        """
+
+    @abstractmethod
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Закрывает подписку и отписывает ее от канала.
+
+        Args:
+            subscription (Subscription): Подписка.
+        """
+
+    @abstractmethod
+    async def close(self) -> None:
+        """
+        Закрывает все подписки.
+        """
+
+
+class InMemoryEventBroker(EventBroker):
+    """
+    Брокер событий в памяти процесса.
+
+    Attributes:
+        subscriptions (dict[str, set[Subscription]]): Подписки по каналам.
+        queue_size (int): Размер очереди сообщений подписки.
+    """
+
+    def __init__(self, queue_size: int):
+        self.subscriptions: dict[str, set[Subscription]] = {}
+        self.queue_size = queue_size
+
+    async def publish(self, channel: str, message: str) -> None:
+        for subscription in list(self.subscriptions.get(channel, ())):
+            subscription.put(message)
+
+    def subscribe(self, channel: str) -> Subscription:
+        subscription = Subscription(channel, self.queue_size)
+        self.subscriptions.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscription.close()
+        subscriptions = self.subscriptions.get(subscription.channel)
+        if subscriptions is not None:
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self.subscriptions[subscription.channel]
+
+    async def close(self) -> None:
+        for subscriptions in list(self.subscriptions.values()):
+            for subscription in list(subscriptions):
+                self.unsubscribe(subscription)
+
+
+class RoomEventFeed:
+    """
+    Лента изменений бронирований с подпиской по переговорным комнатам.
+
+    Заменяет клиентам периодический опрос списка бронирований комнаты:
+    после подписки клиент получает каждое изменение бронирований и
+    серий этой комнаты.
+
+    Attributes:
+        broker (EventBroker or None): Брокер событий.
+    """
+
+    def __init__(self):
+        self.broker: EventBroker | None = None
+
+    async def start(self, broker: EventBroker | None = None) -> None:
+        """
+        Подключает брокер. Вызывается при старте приложения.
+
+        Args:
+            broker (EventBroker or None, default = None): Брокер событий,
+                                            по умолчанию брокер в памяти.
+        """
+        self.broker = broker or InMemoryEventBroker(
+            settings.room_event_queue_size
+        )
+
+    async def stop(self) -> None:
+        """
+        Закрывает подписки. Вызывается при остановке приложения.
+        """
+        if self.broker is not None:
+            await self.broker.close()
+        self.broker = None
+
+    @staticmethod
+    def _channel(meetingroom_id: int) -> str:
+        return f'meeting_room:{meetingroom_id}'
+
+    async def publish(self, event: RoomEvent) -> None:
+        """
+        Отправляет событие подписчикам комнаты.
+
+        Args:
+            event (RoomEvent): Событие.
+        """
+        if self.broker is not None:
+            await self.broker.publish(
+                self._channel(event.meetingroom_id), event.model_dump_json()
+            )
+
+    @asynccontextmanager
+    async def subscribe(
+            self,
+            meetingroom_id: int,
+    ) -> AsyncIterator[Subscription]:
+        """
+        Подписывается на события комнаты на время контекста.
+
+        Args:
+            meetingroom_id (int): Идентификатор переговорной комнаты.
+
+        Yields:
+            Subscription: Подписка с событиями в формате JSON.
+        """
+        if self.broker is None:
+            raise RuntimeError('Лента событий не запущена')
+        broker = self.broker
+        subscription = broker.subscribe(self._channel(meetingroom_id))
+        try:
+            yield subscription
+        finally:
+            broker.unsubscribe(subscription)
+
+
+def build_room_event(
+        event_type: RoomEventType,
+        obj: Any,
+        schema: type[BaseModel],
+) -> RoomEvent:
+    """
+    Собирает событие об изменении бронирования или серии.
+
+    Args:
+        event_type (RoomEventType): Тип изменения.
+        obj (Any): Бронирование или серия.
+        schema (type[BaseModel]): Схема сериализации объекта.
+
+    Returns:
+        RoomEvent: Событие для комнаты объекта.
+    """
+    return RoomEvent(
+        type=event_type,
+        meetingroom_id=obj.meetingroom_id,
+        data=schema.model_validate(obj).model_dump(
+            mode='json', exclude={'user_id'}
+        ),
+    )
+
+
+room_events = RoomEventFeed()
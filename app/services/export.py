@@ -0,0 +1,63 @@
+import csv
+import io
+import json
+from collections.abc import AsyncIterator
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.config import settings
+from app.core.db import AsyncSessionLocal
+from app.crud.reservation import reservation_crud
+from app.schemas.reservation import ExportFormat
+
+
+EXPORT_FIELDS = (
+    'id', 'from_reserve', 'to_reserve', 'meetingroom_id', 'user_id'
+)
+
+MEDIA_TYPES = {
+    ExportFormat.ndjson: 'application/x-ndjson',
+    ExportFormat.csv: 'text/csv',
+}
+
+
+async def export_reservations(
+        export_format: ExportFormat,
+        session_maker: async_sessionmaker = AsyncSessionLocal,
+) -> AsyncIterator[str]:
+    """
+    Функция потоковой выгрузки всех бронирований в NDJSON или CSV.
+
+    Открывает собственную сессию фабрикой session_maker, так как сессия
+    запроса закрывается до отправки тела потокового ответа.
+    """
+    if export_format is ExportFormat.csv:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_FIELDS)
+        yield buffer.getvalue()
+    async with session_maker() as session:
+        async for rows in reservation_crud.stream_columns(
+            session, settings.export_chunk_size
+        ):
+            if export_format is ExportFormat.csv:
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                writer.writerows(
+                    (row.id, row.from_reserve.isoformat(),
+                     row.to_reserve.isoformat(), row.meetingroom_id,
+                     row.user_id)
+                    for row in rows
+                )
+                yield buffer.getvalue()
+            else:
+                yield ''.join(
+                    json.dumps({
+                        'id': row.id,
+                        'from_reserve': row.from_reserve.isoformat(),
+                        'to_reserve': row.to_reserve.isoformat(),
+                        'meetingroom_id': row.meetingroom_id,
+                        'user_id': row.user_id,
+                    }) + '\n'
+                    for row in rows
+                )
@@ -0,0 +1,43 @@
+from collections.abc import Iterable, Sequence
+from datetime import datetime, timedelta
+
+from sqlalchemy import Row
+
+
+def get_free_slots(
+        room_ids: Iterable[int],
+        intervals: Sequence[Row],
+        from_reserve: datetime,
+        to_reserve: datetime,
+        min_duration: timedelta,
+) -> list[dict]:
+    """
+    Функция поиска свободных интервалов всех комнат за один проход.
+
+    Интервалы бронирований должны быть отсортированы по комнате и времени
+    начала. Границы свободного интервала совпадают с границами соседних
+    бронирований: бронирования, которые только касаются друг друга, не
+    пересекаются, поэтому свободный интервал можно забронировать целиком.
+    """
+    result = []
+    position = 0
+    for room_id in room_ids:
+        while (position < len(intervals)
+               and intervals[position].meetingroom_id < room_id):
+            position += 1
+        slots = []
+        free_from = from_reserve
+        while (position < len(intervals)
+               and intervals[position].meetingroom_id == room_id):
+            interval = intervals[position]
+            if interval.from_reserve - free_from >= min_duration:
+                slots.append({
+                    'from_reserve': free_from,
+                    'to_reserve': interval.from_reserve,
+                })
+            free_from = max(free_from, interval.to_reserve)
+            position += 1
+        if to_reserve - free_from >= min_duration:
+            slots.append({'from_reserve': free_from, 'to_reserve': to_reserve})
+        result.append({'meetingroom_id': room_id, 'slots': slots})
+    return result
@@ -1,14 +1,90 @@
+import asyncio
+import json
 from datetime import datetime
 
-from aiogoogle import Aiogoogle
-
 from app.core.config import settings
+from app.core.google_client import GoogleClient
 
 
 FORMAT = "%Y/%m/%d %H:%M:%S"
 
 
-async def spreadsheets_create(wrapper_services: Aiogoogle) -> str:
+def get_table_values(reservations: list) -> list[list[str]]:
+    """
+    Функция формирования строк отчета
+    """
+    now_date_time = datetime.now().strftime(FORMAT)
+    table_values = [
+        ['Отчет от', now_date_time],
+        ['Занятость переговорок'],
+        ['ID переговорки', 'Кол-во бронирований', 'Часов забронировано',
+         'Загрузка, %'] + [f'{hour:02d}:00' for hour in range(24)]
+    ]
+    for res in reservations:
+        new_row = [
+            str(res['meetingroom_id']),
+            str(res['count']),
+            str(res['hours_booked']),
+            str(res['utilization']),
+        ] + [str(hours) for hours in res['hours_histogram']]
+        table_values.append(new_row)
+    return table_values
+
+
+def column_letter(number: int) -> str:
+    """
+    Функция получения буквенного обозначения столбца по его номеру
+    """
+    letters = ''
+    while number > 0:
+        number, remainder = divmod(number - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+
+def split_values(
+        table_values: list[list[str]],
+        max_payload_bytes: int,
+) -> list[dict]:
+    """
+    Функция разбиения строк на диапазоны ограниченного размера
+    """
+    value_ranges = []
+    chunk = []
+    chunk_size = 0
+    first_row = 1
+    for row in table_values:
+        row_size = len(json.dumps(row, ensure_ascii=False).encode()) + 1
+        if chunk and chunk_size + row_size > max_payload_bytes:
+            value_ranges.append(make_value_range(first_row, chunk))
+            first_row += len(chunk)
+            chunk = []
+            chunk_size = 0
+        chunk.append(row)
+        chunk_size += row_size
+    if chunk:
+        value_ranges.append(make_value_range(first_row, chunk))
+    return value_ranges
+
+
+def make_value_range(first_row: int, rows: list[list[str]]) -> dict:
+    """
+    Функция формирования диапазона значений для записи
+    """
+    last_column = column_letter(max(len(row) for row in rows))
+    last_row = first_row + len(rows) - 1
+    return {
+        'range': f'A{first_row}:{last_column}{last_row}',
+        'majorDimension': 'ROWS',
+        'values': rows
+    }
+
+
+async def spreadsheets_create(
+        wrapper_services: GoogleClient,
+        row_count: int,
+        column_count: int,
+) -> str:
     """
     Функция создания документа с таблицами
     """
@@ -20,8 +96,10 @@ async def spreadsheets_create(wrapper_services: Aiogoogle) -> str:
         'sheets': [{'properties': {'sheetType': 'GRID',
                                    'sheetId': 0,
                                    'title': 'Лист1',
-                                   'gridProperties': {'rowCount': 100,
-                                                      'columnCount': 11}}}]
+                                   'gridProperties': {
+                                       'rowCount': max(row_count, 1),
+                                       'columnCount': max(column_count, 1)
+                                   }}}]
     }
     response = await wrapper_services.as_service_account(
         service.spreadsheets.create(json=spreadsheet_body)
@@ -32,7 +110,7 @@ async def spreadsheets_create(wrapper_services: Aiogoogle) -> str:
 
 async def set_user_permissions(
         spreadsheetid: str,
-        wrapper_services: Aiogoogle
+        wrapper_services: GoogleClient
 ) -> None:
     """
     Функция выдачи прав личному гугл-аккаунту на доступ к документу
@@ -51,32 +129,34 @@ async def set_user_permissions(
 
 async def spreadsheets_update_value(
         spreadsheetid: str,
-        reservations: list,
-        wrapper_services: Aiogoogle
+        table_values: list[list[str]],
+        wrapper_services: GoogleClient
 ) -> None:
     """
     Функция обновления документа
+
+    Строки записываются порциями values.batchUpdate, размер каждой не
+    превышает sheets_max_payload_bytes. Если sheets_write_concurrency
+    больше 1, порции записываются параллельно.
     """
-    now_date_time = datetime.now().strftime(FORMAT)
     service = await wrapper_services.discover('sheets', 'v4')
-    table_values = [
-        ['Отчет от', now_date_time],
-        ['Количество регистраций переговорок'],
-        ['ID переговорки', 'Кол-во бронирований']
-    ]
-    for res in reservations:
-        new_row = [str(res['meetingroom_id']), str(res['count'])]
-        table_values.append(new_row)
+    semaphore = asyncio.Semaphore(settings.sheets_write_concurrency)
 
-    update_body = {
-        'majorDimension': 'ROWS',
-        'values': table_values
-    }
-    await wrapper_services.as_service_account(
-        service.spreadsheets.values.update(
-            spreadsheetId=spreadsheetid,
-            range='A1:E30',
-            valueInputOption='USER_ENTERED',
-            json=update_body
+    async def write(value_range: dict) -> None:
+        async with semaphore:
+            await wrapper_services.as_service_account(
+                service.spreadsheets.values.batchUpdate(
+                    spreadsheetId=spreadsheetid,
+                    json={
+                        'valueInputOption': 'USER_ENTERED',
+                        'data': [value_range]
+                    }
+                )
+            )
+
+    await asyncio.gather(*(
+        write(value_range)
+        for value_range in split_values(
+            table_values, settings.sheets_max_payload_bytes
         )
-    )
+    ))
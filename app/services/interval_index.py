@@ -0,0 +1,188 @@
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Reservation
+
+
+@dataclass(frozen=True)
+class IndexedReservation:
+    """
+    Бронирование в индексе интервалов.
+
+    Attributes:
+        id (int): Идентификатор бронирования.
+        meetingroom_id (int): Идентификатор переговорной комнаты.
+        from_reserve (datetime): Время начала бронирования.
+        to_reserve (datetime): Время окончания бронирования.
+    """
+    id: int
+    meetingroom_id: int
+    from_reserve: datetime
+    to_reserve: datetime
+
+    def __repr__(self):
+        return (
+            f'Уже забронировано с {self.from_reserve} по {self.to_reserve}'
+        )
+
+
+class _RoomIntervals:
+    """
+    Бронирования одной комнаты, отсортированные по времени начала.
+
+    Самое длинное бронирование комнаты ограничивает слева окно поиска:
+    интервал, начавшийся раньше `from_reserve - max_length`, не может
+    пересекаться с запрошенным периодом.
+    """
+
+    def __init__(self):
+        self.starts: list[tuple[datetime, int]] = []
+        self.items: dict[int, IndexedReservation] = {}
+        self.max_length = timedelta(0)
+
+    def add(self, item: IndexedReservation) -> None:
+        insort(self.starts, (item.from_reserve, item.id))
+        self.items[item.id] = item
+        self.max_length = max(
+            self.max_length, item.to_reserve - item.from_reserve
+        )
+
+    def discard(self, reservation_id: int) -> None:
+        item = self.items.pop(reservation_id, None)
+        if item is None:
+            return
+        index = bisect_left(self.starts, (item.from_reserve, item.id))
+        del self.starts[index]
+
+    def overlapping(
+            self,
+            from_reserve: datetime,
+            to_reserve: datetime,
+            reservation_id: int | None,
+    ) -> list[IndexedReservation]:
+        low = bisect_left(self.starts, (from_reserve - self.max_length,))
+        high = bisect_left(self.starts, (to_reserve,))
+        result = []
+        for _, item_id in self.starts[low:high]:
+            item = self.items[item_id]
+            if item.to_reserve > from_reserve and item_id != reservation_id:
+                result.append(item)
+        return result
+
+
+class ReservationIntervalIndex:
+    """
+    Процессный индекс интервалов бронирований по переговорным комнатам.
+
+    Отвечает на запрос пересечений за O(log n + k) без обращения к базе
+    данных. Индекс обновляется только записями этого процесса: изменения
+    других процессов, пересчеты из командной строки и ручной SQL делают
+    его записи устаревшими в обе стороны. Поэтому ответ индекса — только
+    предварительный фильтр, и конфликт всегда подтверждается базой данных
+    в транзакции записи, а неподтвержденные записи удаляются из индекса.
+    """
+
+    def __init__(self):
+        self.rooms: dict[int, _RoomIntervals] = {}
+        self.ready = False
+
+    async def build(self, session: AsyncSession) -> None:
+        """
+        Заполняет индекс всеми бронированиями из базы данных.
+
+        Args:
+            session (AsyncSession): Асинхронная сессия SQLAlchemy.
+        """
+        rows = await session.execute(
+            select(
+                Reservation.id,
+                Reservation.meetingroom_id,
+                Reservation.from_reserve,
+                Reservation.to_reserve,
+            ).order_by(Reservation.from_reserve, Reservation.id)
+        )
+        self.rooms = {}
+        for row in rows:
+            self._room(row.meetingroom_id).add(IndexedReservation(*row))
+        self.ready = True
+
+    def _room(self, meetingroom_id: int) -> _RoomIntervals:
+        room = self.rooms.get(meetingroom_id)
+        if room is None:
+            room = self.rooms[meetingroom_id] = _RoomIntervals()
+        return room
+
+    def add(self, reservation: Reservation) -> None:
+        """
+        Добавляет бронирование в индекс или обновляет его интервал.
+
+        Args:
+            reservation (Reservation): Сохраненное бронирование.
+        """
+        self.discard(reservation)
+        self._room(reservation.meetingroom_id).add(IndexedReservation(
+            id=reservation.id,
+            meetingroom_id=reservation.meetingroom_id,
+            from_reserve=reservation.from_reserve,
+            to_reserve=reservation.to_reserve,
+        ))
+
+    def discard(self, reservation: Reservation) -> None:
+        """
+        Удаляет бронирование из индекса.
+
+        Args:
+            reservation (Reservation): Удаленное бронирование.
+        """
+        room = self.rooms.get(reservation.meetingroom_id)
+        if room is not None:
+            room.discard(reservation.id)
+
+    def discard_room(self, meetingroom_id: int) -> None:
+        """
+        Удаляет из индекса все бронирования комнаты.
+
+        Вызывается при удалении комнаты, бронирования которой удаляются
+        каскадно: иначе они оставались бы в индексе и конфликтовали с
+        бронированиями новой комнаты с тем же идентификатором.
+
+        Args:
+            meetingroom_id (int): Идентификатор удаленной комнаты.
+        """
+        self.rooms.pop(meetingroom_id, None)
+
+    def get_reservations_at_the_same_time(
+            self,
+            *,
+            from_reserve: datetime,
+            to_reserve: datetime,
+            meetingroom_id: int,
+            reservation_id: int | None = None,
+    ) -> list[IndexedReservation]:
+        """
+        Получает бронирования комнаты, пересекающиеся с указанным периодом.
+
+        Соседние бронирования, у которых конец одного совпадает с началом
+        другого, не пересекаются.
+
+        Args:
+            from_reserve (datetime): Время начала бронирования.
+            to_reserve (datetime): Время окончания бронирования.
+            meetingroom_id (int): Идентификатор переговорной комнаты.
+            reservation_id (int or None, default = None): Идентификатор
+                            бронирования (для исключения при поиске).
+
+        Returns:
+            list[IndexedReservation]: Список пересекающихся бронирований.
+        """
+        room = self.rooms.get(meetingroom_id)
+        if room is None:
+            return []
+        return room.overlapping(from_reserve, to_reserve, reservation_id)
+
+
+reservation_index = ReservationIntervalIndex()
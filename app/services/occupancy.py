@@ -0,0 +1,85 @@
+from collections.abc import Iterable, Iterator
+from datetime import date, datetime, timedelta
+from typing import Any
+
+
+OccupancyKey = tuple[int, date, int]
+
+
+def split_by_hour(
+        from_reserve: datetime,
+        to_reserve: datetime,
+) -> Iterator[tuple[date, int, float]]:
+    """
+    Разбивает интервал по часам суток.
+
+    Args:
+        from_reserve (datetime): Начало интервала.
+        to_reserve (datetime): Конец интервала.
+
+    Yields:
+        tuple[date, int, float]: День, час суток и секунды интервала в
+                                 этом часе, начиная с часа начала.
+    """
+    hour_start = from_reserve.replace(minute=0, second=0, microsecond=0)
+    while hour_start < to_reserve:
+        hour_end = hour_start + timedelta(hours=1)
+        seconds = (
+            min(to_reserve, hour_end) - max(from_reserve, hour_start)
+        ).total_seconds()
+        yield hour_start.date(), hour_start.hour, seconds
+        hour_start = hour_end
+
+
+def aggregate_occupancy(
+        intervals: Iterable[Any],
+        sign: int = 1,
+) -> dict[OccupancyKey, list[float]]:
+    """
+    Сводит интервалы бронирований в занятость по комнатам, дням и часам.
+
+    Бронирование учитывается в количестве один раз — в часе своего начала.
+
+    Args:
+        intervals (Iterable[Any]): Интервалы с полями meetingroom_id,
+                                   from_reserve и to_reserve.
+        sign (int, default = 1): 1 для добавления интервалов, -1 для
+                                 вычитания.
+
+    Returns:
+        dict[OccupancyKey, list[float]]: Секунды и количество бронирований
+            по ключу (meetingroom_id, day, hour).
+    """
+    occupancy = {}
+    for interval in intervals:
+        first = True
+        for day, hour, seconds in split_by_hour(
+            interval.from_reserve, interval.to_reserve
+        ):
+            key = (interval.meetingroom_id, day, hour)
+            totals = occupancy.setdefault(key, [0.0, 0])
+            totals[0] += sign * seconds
+            totals[1] += sign * first
+            first = False
+    return occupancy
+
+
+def merge_occupancy(
+        occupancy: dict[OccupancyKey, list[float]],
+        other: dict[OccupancyKey, list[float]],
+) -> dict[OccupancyKey, list[float]]:
+    """
+    Прибавляет занятость other к занятости occupancy.
+
+    Args:
+        occupancy (dict[OccupancyKey, list[float]]): Изменяемая занятость.
+        other (dict[OccupancyKey, list[float]]): Прибавляемая занятость.
+
+    Returns:
+        dict[OccupancyKey, list[float]]: Занятость occupancy.
+    """
+    for key, (seconds, count) in other.items():
+        totals = occupancy.setdefault(key, [0.0, 0])
+        totals[0] += seconds
+        totals[1] += count
+    return occupancy
@@ -0,0 +1,126 @@
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from app.models import ReservationSeries
+
+
+FREQUENCIES = {
+    'daily': timedelta(days=1),
+    'weekly': timedelta(weeks=1),
+}
+
+
+@dataclass(frozen=True)
+class Occurrence:
+    """
+    Вхождение повторяющегося бронирования.
+
+    Attributes:
+        series_id (int): Идентификатор серии.
+        meetingroom_id (int): Идентификатор переговорной комнаты.
+        user_id (int): Идентификатор пользователя, создавшего серию.
+        from_reserve (datetime): Время начала вхождения.
+        to_reserve (datetime): Время окончания вхождения.
+        id (None): Вхождение не хранится в таблице бронирований.
+    """
+    series_id: int | None
+    meetingroom_id: int
+    user_id: int | None
+    from_reserve: datetime
+    to_reserve: datetime
+    id = None
+
+    def __repr__(self):
+        return (
+            f'Уже забронировано с {self.from_reserve} по {self.to_reserve}'
+        )
+
+
+def get_period(frequency: str, interval: int) -> timedelta:
+    """
+    Функция вычисления шага между вхождениями серии.
+    """
+    return FREQUENCIES[frequency] * interval
+
+
+def get_last_to_reserve(
+        from_reserve: datetime,
+        to_reserve: datetime,
+        period: timedelta,
+        count: int | None,
+        until: datetime | None,
+) -> datetime:
+    """
+    Функция вычисления времени окончания последнего вхождения серии.
+    """
+    last = count - 1 if count is not None else None
+    if until is not None:
+        until_last = (until - from_reserve) // period
+        last = until_last if last is None else min(last, until_last)
+    return to_reserve + period * last
+
+
+def iter_occurrences(
+        series: ReservationSeries,
+        from_reserve: datetime,
+        to_reserve: datetime,
+) -> Iterator[Occurrence]:
+    """
+    Функция ленивого перебора вхождений серии, пересекающихся с периодом.
+
+    Первое подходящее вхождение вычисляется арифметически, поэтому
+    стоимость перебора зависит только от числа вхождений в периоде.
+    Вхождения, которые только касаются границ периода, не перебираются.
+    """
+    period = get_period(series.frequency, series.interval)
+    duration = series.to_reserve - series.from_reserve
+    last_from = series.last_to_reserve - duration
+    occurrence_from = series.from_reserve + period * max(
+        0, (from_reserve - series.to_reserve) // period + 1
+    )
+    while occurrence_from <= last_from and occurrence_from < to_reserve:
+        yield Occurrence(
+            series_id=series.id,
+            meetingroom_id=series.meetingroom_id,
+            user_id=series.user_id,
+            from_reserve=occurrence_from,
+            to_reserve=occurrence_from + duration,
+        )
+        occurrence_from += period
+
+
+def find_series_conflicts(
+        series: ReservationSeries,
+        reservations: Iterable,
+        other_series: Iterable[ReservationSeries],
+        limit: int = 10,
+) -> list:
+    """
+    Функция поиска бронирований и вхождений других серий, пересекающихся
+    с вхождениями серии.
+
+    Перебираются только вхождения других серий в общем с серией периоде.
+    Возвращается не больше limit пересечений.
+    """
+    conflicts = []
+    for reservation in reservations:
+        if next(iter_occurrences(
+            series, reservation.from_reserve, reservation.to_reserve
+        ), None) is not None:
+            conflicts.append(reservation)
+            if len(conflicts) >= limit:
+                return conflicts
+    for other in other_series:
+        for occurrence in iter_occurrences(
+            other,
+            max(series.from_reserve, other.from_reserve),
+            min(series.last_to_reserve, other.last_to_reserve),
+        ):
+            if next(iter_occurrences(
+                series, occurrence.from_reserve, occurrence.to_reserve
+            ), None) is not None:
+                conflicts.append(occurrence)
+                if len(conflicts) >= limit:
+                    return conflicts
+    return conflicts
@@ -0,0 +1,366 @@
+import asyncio
+import logging
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, TypeVar
+
+import aiohttp
+from aiogoogle.excs import HTTPError
+
+from app.core.config import settings
+from app.core.db import AsyncReadSessionLocal
+from app.core.google_client import google_client
+from app.core.metrics import (
+    google_api_retries, report_job_duration, report_jobs
+)
+from app.crud.reservation import reservation_crud
+from app.schemas.report import ReportJobStatus
+from app.services.google_api import (
+    get_table_values,
+    set_user_permissions,
+    spreadsheets_create,
+    spreadsheets_update_value,
+)
+from app.services.statistics import get_room_statistics
+
+
+logger = logging.getLogger(__name__)
+
+TRANSIENT_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+# Коды, с которыми сервер отклоняет запрос, не выполняя его.
+REJECTED_STATUS_CODES = frozenset({429, 503})
+
+T = TypeVar('T')
+
+
+@dataclass
+class ReportJob:
+    """
+    Задача построения отчета в Google Sheets.
+
+    Attributes:
+        from_reserve (datetime): Начало периода отчета.
+        to_reserve (datetime): Конец периода отчета.
+        id (str): Идентификатор задачи.
+        status (ReportJobStatus): Состояние задачи.
+        stage (str or None): Выполняемый или последний выполненный этап.
+        attempts (int): Количество повторов после временных ошибок.
+        spreadsheet_id (str or None): Идентификатор созданной таблицы.
+        result (list[dict[str, Any]] or None): Данные отчета.
+        error (str or None): Текст ошибки, если задача не выполнена.
+        created_at (datetime): Время создания задачи.
+        updated_at (datetime): Время последнего изменения задачи.
+    """
+    from_reserve: datetime
+    to_reserve: datetime
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: ReportJobStatus = ReportJobStatus.queued
+    stage: str | None = None
+    attempts: int = 0
+    spreadsheet_id: str | None = None
+    result: list[dict[str, Any]] | None = None
+    error: str | None = None
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (
+            ReportJobStatus.succeeded, ReportJobStatus.failed
+        )
+
+
+class JobBackend(ABC):
+    """
+    Хранилище и очередь задач построения отчетов.
+
+    Реализация в памяти подходит для одного процесса. Для нескольких
+    воркеров её можно заменить общим хранилищем с тем же интерфейсом.
+    """
+
+    @abstractmethod
+    async def enqueue(self, job: ReportJob) -> None:
+        """
+        Сохраняет задачу и ставит ее в очередь.
+
+        Args:
+            job (ReportJob): Новая задача.
+
+        Raises:
+            asyncio.QueueFull: Если очередь переполнена.
+        """
+
+    @abstractmethod
+    async def dequeue(self) -> ReportJob:
+        """
+        Ожидает и получает следующую задачу из очереди.
+
+        Returns:
+            ReportJob: Задача.
+        """
+
+    @abstractmethod
+    async def save(self, job: ReportJob) -> None:
+        """
+        Сохраняет изменения задачи.
+
+        Args:
+            job (ReportJob): Задача.
+        """
+
+    @abstractmethod
+    async def get(self, job_id: str) -> ReportJob | None:
+        """
+        Получает задачу по идентификатору.
+
+        Args:
+            job_id (str): Идентификатор задачи.
+
+        Returns:
+            ReportJob or None: Задача или None, если не найдена.
+        """
+
+
+class InMemoryJobBackend(JobBackend):
+    """
+    Хранилище задач в памяти процесса.
+
+    Завершенные задачи хранятся report_job_ttl секунд после последнего
+    изменения.
+
+    Attributes:
+        queue (asyncio.Queue[str]): Идентификаторы задач в очереди.
+        jobs (dict[str, ReportJob]): Задачи по идентификатору.
+    """
+
+    def __init__(self, maxsize: int):
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize)
+        self.jobs: dict[str, ReportJob] = {}
+
+    async def enqueue(self, job: ReportJob) -> None:
+        self._prune()
+        self.queue.put_nowait(job.id)
+        self.jobs[job.id] = job
+
+    async def dequeue(self) -> ReportJob:
+        return self.jobs[await self.queue.get()]
+
+    async def save(self, job: ReportJob) -> None:
+        job.updated_at = datetime.now()
+        self.jobs[job.id] = job
+
+    async def get(self, job_id: str) -> ReportJob | None:
+        return self.jobs.get(job_id)
+
+    def _prune(self) -> None:
+        expires = datetime.now() - timedelta(seconds=settings.report_job_ttl)
+        expired = [
+            job_id for job_id, job in self.jobs.items()
+            if job.finished and job.updated_at < expires
+        ]
+        for job_id in expired:
+            del self.jobs[job_id]
+
+
+def is_transient_error(error: Exception, idempotent: bool = True) -> bool:
+    """
+    Проверяет, имеет ли смысл повторить запрос после ошибки.
+
+    Неидемпотентный запрос мог быть выполнен, даже если ответ не получен
+    или сервер ответил ошибкой, поэтому он повторяется только после
+    ответов 429 и 503, с которыми сервер его не выполнял.
+
+    Args:
+        error (Exception): Ошибка запроса к Google API.
+        idempotent (bool, default = True): Можно ли безопасно повторить
+                                           уже выполненный запрос.
+
+    Returns:
+        bool: True для сетевых ошибок, таймаутов, 429 и 5xx, для
+              неидемпотентного запроса — только для 429 и 503.
+    """
+    if isinstance(error, HTTPError):
+        status_codes = (
+            TRANSIENT_STATUS_CODES if idempotent else REJECTED_STATUS_CODES
+        )
+        return (
+            error.res is not None and error.res.status_code in status_codes
+        )
+    return idempotent and isinstance(
+        error, (aiohttp.ClientError, asyncio.TimeoutError)
+    )
+
+
+class ReportWorkerPool:
+    """
+    Пул асинхронных воркеров, строящих отчеты в фоне.
+
+    Число воркеров ограничивает число одновременно строящихся отчетов,
+    а с ним и число занятых соединений с базой данных и Google API.
+    Сессия базы данных открывается только на время агрегации и
+    закрывается до обращений к Google API.
+
+    Attributes:
+        backend (JobBackend): Хранилище и очередь задач.
+        workers (int): Количество воркеров.
+        tasks (list[asyncio.Task]): Запущенные воркеры.
+    """
+
+    def __init__(self, workers: int):
+        self.backend: JobBackend | None = None
+        self.workers = workers
+        self.tasks: list[asyncio.Task] = []
+
+    async def start(self, backend: JobBackend | None = None) -> None:
+        """
+        Запускает воркеры. Вызывается при старте приложения.
+
+        Args:
+            backend (JobBackend or None, default = None): Хранилище задач,
+                                            по умолчанию хранилище в памяти.
+        """
+        self.backend = backend or InMemoryJobBackend(
+            settings.report_queue_size
+        )
+        self.tasks = [
+            asyncio.create_task(self._work()) for _ in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        """
+        Останавливает воркеры. Вызывается при остановке приложения.
+        """
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+
+    async def submit(
+            self,
+            from_reserve: datetime,
+            to_reserve: datetime,
+    ) -> ReportJob:
+        """
+        Ставит построение отчета в очередь.
+
+        Args:
+            from_reserve (datetime): Начало периода отчета.
+            to_reserve (datetime): Конец периода отчета.
+
+        Returns:
+            ReportJob: Созданная задача.
+
+        Raises:
+            asyncio.QueueFull: Если очередь переполнена.
+        """
+        job = ReportJob(from_reserve=from_reserve, to_reserve=to_reserve)
+        try:
+            await self.backend.enqueue(job)
+        except asyncio.QueueFull:
+            report_jobs.labels('rejected').inc()
+            raise
+        report_jobs.labels(ReportJobStatus.queued.value).inc()
+        return job
+
+    async def get(self, job_id: str) -> ReportJob | None:
+        """
+        Получает задачу по идентификатору.
+
+        Args:
+            job_id (str): Идентификатор задачи.
+
+        Returns:
+            ReportJob or None: Задача или None, если не найдена.
+        """
+        return await self.backend.get(job_id)
+
+    async def _work(self) -> None:
+        while True:
+            job = await self.backend.dequeue()
+            job.status = ReportJobStatus.running
+            await self.backend.save(job)
+            started = time.perf_counter()
+            try:
+                await self._build_report(job)
+            except asyncio.CancelledError:
+                job.status = ReportJobStatus.failed
+                job.error = 'Построение отчета прервано остановкой сервера'
+                await self.backend.save(job)
+                raise
+            except Exception as error:
+                logger.exception('Не удалось построить отчет %s', job.id)
+                job.status = ReportJobStatus.failed
+                job.error = (
+                    ' '.join(str(error).split()) or type(error).__name__
+                )
+            else:
+                job.status = ReportJobStatus.succeeded
+            report_jobs.labels(job.status.value).inc()
+            report_job_duration.observe(time.perf_counter() - started)
+            await self.backend.save(job)
+
+    async def _set_stage(self, job: ReportJob, stage: str) -> None:
+        job.stage = stage
+        await self.backend.save(job)
+
+    async def _retry(
+            self,
+            job: ReportJob,
+            call: Callable[[], Awaitable[T]],
+            idempotent: bool = True,
+    ) -> T:
+        attempt = 0
+        while True:
+            try:
+                return await call()
+            except Exception as error:
+                if (attempt >= settings.report_max_retries
+                        or not is_transient_error(error, idempotent)):
+                    raise
+                delay = settings.report_retry_backoff * 2 ** attempt
+                logger.warning(
+                    'Временная ошибка отчета %s на этапе %s, повтор через '
+                    '%s с: %r', job.id, job.stage, delay, error
+                )
+                attempt += 1
+                job.attempts += 1
+                google_api_retries.labels(job.stage).inc()
+                await self.backend.save(job)
+                await asyncio.sleep(delay)
+
+    async def _build_report(self, job: ReportJob) -> None:
+        await self._set_stage(job, 'aggregating')
+        async with AsyncReadSessionLocal() as session:
+            rows = await reservation_crud.get_period_occupancy(
+                job.from_reserve, job.to_reserve, session
+            )
+        job.result = get_room_statistics(
+            rows, job.from_reserve, job.to_reserve
+        )
+        table_values = get_table_values(job.result)
+        await self._set_stage(job, 'creating_spreadsheet')
+        job.spreadsheet_id = await self._retry(
+            job, lambda: spreadsheets_create(
+                google_client,
+                len(table_values),
+                max(len(row) for row in table_values),
+            ),
+            idempotent=False,
+        )
+        await self._set_stage(job, 'setting_permissions')
+        await self._retry(job, lambda: set_user_permissions(
+            job.spreadsheet_id, google_client
+        ))
+        await self._set_stage(job, 'writing_values')
+        await self._retry(job, lambda: spreadsheets_update_value(
+            job.spreadsheet_id, table_values, google_client
+        ))
+        await self._set_stage(job, 'done')
+
+
+report_workers = ReportWorkerPool(settings.report_workers)
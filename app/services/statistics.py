@@ -0,0 +1,53 @@
+from collections.abc import Iterable
+from datetime import datetime
+
+from sqlalchemy import Row
+
+
+HOURS_IN_DAY = 24
+SECONDS_IN_HOUR = 3600
+
+
+def get_room_statistics(
+        rows: Iterable[Row],
+        from_reserve: datetime,
+        to_reserve: datetime,
+) -> list[dict]:
+    """
+    Сводит почасовую занятость в статистику по комнатам.
+
+    Args:
+        rows (Iterable[Row]): Строки (meetingroom_id, hour, seconds, count),
+                              сгруппированные по комнате и часу суток.
+        from_reserve (datetime): Начало периода.
+        to_reserve (datetime): Конец периода.
+
+    Returns:
+        list[dict]: Для каждой комнаты с бронированиями в периоде — число
+            бронирований, забронированные часы, загрузка в процентах от
+            длительности периода и забронированные часы по часам суток.
+    """
+    window_seconds = (to_reserve - from_reserve).total_seconds()
+    rooms = {}
+    for row in rows:
+        room = rooms.get(row.meetingroom_id)
+        if room is None:
+            room = rooms[row.meetingroom_id] = {
+                'count': 0, 'seconds': 0.0, 'histogram': [0.0] * HOURS_IN_DAY
+            }
+        room['count'] += row.count
+        room['seconds'] += row.seconds
+        room['histogram'][row.hour] += row.seconds
+    return [
+        {
+            'meetingroom_id': meetingroom_id,
+            'count': room['count'],
+            'hours_booked': round(room['seconds'] / SECONDS_IN_HOUR, 2),
+            'utilization': round(room['seconds'] / window_seconds * 100, 2),
+            'hours_histogram': [
+                round(seconds / SECONDS_IN_HOUR, 2)
+                for seconds in room['histogram']
+            ],
+        }
+        for meetingroom_id, room in sorted(rooms.items())
+    ]
@@ -0,0 +1,124 @@
+import uuid
+from datetime import datetime
+
+MEETING_ROOMS = 'meeting_rooms'
+
+
+def room_reservations_key(meetingroom_id: int) -> str:
+    """
+    Функция получения ключа версии бронирований переговорной комнаты
+    """
+    return f'meeting_room:{meetingroom_id}:reservations'
+
+
+class ChangeVersions:
+    """
+    Счетчики версий данных для условных GET-запросов.
+
+    Операции записи CRUD увеличивают версию таблицы или комнаты, а
+    списки отдают ETag с версией, по которой ответ был построен. Если
+    версия не изменилась и срок ETag не истек, список отвечает 304 без
+    запросов к базе данных.
+
+    Счетчики хранятся в памяти процесса, поэтому ETag содержит метку
+    процесса, а срок его действия ограничен etag_max_age: изменения,
+    сделанные другими процессами, становятся видны не позже этого срока.
+
+    Attributes:
+        epoch (str): Метка процесса, меняется при перезапуске.
+        versions (dict[str, int]): Версии по ключам.
+        changed_at (dict[str, datetime]): Время последнего изменения по
+                                          ключам.
+    """
+
+    def __init__(self):
+        self.epoch = uuid.uuid4().hex[:8]
+        self.versions: dict[str, int] = {}
+        self.changed_at: dict[str, datetime] = {}
+
+    def get(self, key: str) -> int:
+        """
+        Получает текущую версию.
+
+        Args:
+            key (str): Ключ версии.
+
+        Returns:
+            int: Версия.
+        """
+        return self.versions.get(key, 0)
+
+    def bump(self, *keys: str) -> None:
+        """
+        Увеличивает версии после записи.
+
+        Args:
+            *keys (str): Ключи версий.
+        """
+        now = datetime.now()
+        for key in keys:
+            self.versions[key] = self.versions.get(key, 0) + 1
+            self.changed_at[key] = now
+
+    def get_changed_at(self, key: str) -> datetime | None:
+        """
+        Получает время последнего изменения.
+
+        Args:
+            key (str): Ключ версии.
+
+        Returns:
+            datetime or None: Время изменения или None, если данные не
+                              менялись после запуска процесса.
+        """
+        return self.changed_at.get(key)
+
+    def make_etag(self, version: int, expires_at: datetime) -> str:
+        """
+        Собирает ETag ответа.
+
+        Args:
+            version (int): Версия, прочитанная до построения ответа.
+            expires_at (datetime): Время, до которого ответ не меняется
+                                   без записи.
+
+        Returns:
+            str: Слабый ETag.
+        """
+        return f'W/"{self.epoch}-{version}-{int(expires_at.timestamp())}"'
+
+    def get_fresh_etag(
+            self,
+            key: str,
+            if_none_match: str | None,
+    ) -> str | None:
+        """
+        Ищет в заголовке If-None-Match ETag, который еще действителен.
+
+        Args:
+            key (str): Ключ версии.
+            if_none_match (str or None): Значение заголовка.
+
+        Returns:
+            str or None: Действительный ETag или None, если ответ нужно
+                         построить заново.
+        """
+        if not if_none_match:
+            return None
+        version = self.get(key)
+        now = datetime.now().timestamp()
+        for etag in if_none_match.split(','):
+            etag = etag.strip()
+            parts = etag.removeprefix('W/').strip('"').split('-')
+            if len(parts) != 3 or parts[0] != self.epoch:
+                continue
+            try:
+                etag_version, expires_at = int(parts[1]), int(parts[2])
+            except ValueError:
+                continue
+            if etag_version == version and now < expires_at:
+                return etag
+        return None
+
+
+change_versions = ChangeVersions()
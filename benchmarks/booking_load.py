@@ -0,0 +1,328 @@
+"""
+Нагрузочный сценарий основных операций бронирования.
+
+База SQLite заполняется заданным числом комнат, пользователей и
+бронирований, после чего приложение нагружается в том же процессе
+через httpx.ASGITransport без сети. Для каждого сценария выводятся
+пропускная способность, задержки p50/p95/p99 и коды ответов:
+
+    create_reservation  создание бронирований, часть из которых
+                        пересекается с существующими (--conflict-ratio);
+    room_listing        список переговорных комнат;
+    my_reservations     бронирования случайного пользователя;
+    report_aggregation  статистика бронирований за случайный период.
+
+Данные и последовательность запросов определяются --seed, результаты
+в формате JSON можно сохранить в файл и сравнивать между запусками.
+
+Пример:
+    python benchmarks/booking_load.py --reservations 50000 \\
+        --requests 1000 --concurrency 20 --output result.json
+
+Требует httpx.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from common import percentile
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SCENARIOS = (
+    'room_listing', 'my_reservations', 'report_aggregation',
+    'create_reservation',
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rooms', type=int, default=20)
+    parser.add_argument('--users', type=int, default=100)
+    parser.add_argument('--reservations', type=int, default=10_000)
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--warmup', type=int, default=20)
+    parser.add_argument('--concurrency', type=int, default=10)
+    parser.add_argument('--conflict-ratio', type=float, default=0.2)
+    parser.add_argument('--report-days', type=int, default=7)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument(
+        '--scenarios', nargs='+', choices=SCENARIOS, default=SCENARIOS
+    )
+    parser.add_argument('--output', type=Path)
+    return parser.parse_args()
+
+
+async def seed(
+        args: argparse.Namespace,
+        start: datetime,
+        rng: random.Random,
+) -> None:
+    """
+    Заполняет базу данных и предрассчитанную занятость комнат.
+
+    Бронирования комнаты идут по получасу в начале каждого часа подряд,
+    комнаты чередуются, поэтому пересечений в заполненных данных нет.
+    Пароли пользователей не задаются: токены выдаются без входа.
+    """
+    from sqlalchemy import insert
+
+    from app.core.db import AsyncSessionLocal
+    from app.crud.room_occupancy import room_occupancy_crud
+    from app.models import MeetingRoom, Reservation, User
+
+    async with AsyncSessionLocal() as session:
+        await session.execute(insert(User), [
+            {
+                'id': user_id,
+                'email': f'user{user_id}@example.com',
+                'hashed_password': '-',
+                'is_active': True,
+                'is_superuser': False,
+                'is_verified': False,
+            }
+            for user_id in range(2, args.users + 2)
+        ])
+        await session.execute(insert(MeetingRoom), [
+            {'id': room_id, 'name': f'Room {room_id}'}
+            for room_id in range(1, args.rooms + 1)
+        ])
+        rows = []
+        for index in range(args.reservations):
+            from_reserve = start + timedelta(hours=index // args.rooms)
+            rows.append({
+                'meetingroom_id': index % args.rooms + 1,
+                'user_id': rng.randrange(2, args.users + 2),
+                'from_reserve': from_reserve,
+                'to_reserve': from_reserve + timedelta(minutes=30),
+            })
+            if len(rows) == 10_000:
+                await session.execute(insert(Reservation), rows)
+                rows = []
+        if rows:
+            await session.execute(insert(Reservation), rows)
+        await session.commit()
+        await room_occupancy_crud.rebuild(session)
+
+
+async def get_user_tokens(users: int) -> list[str]:
+    from app.core.user import get_jwt_strategy
+    from app.models import User
+
+    strategy = get_jwt_strategy()
+    return [
+        await strategy.write_token(User(
+            id=user_id,
+            email=f'user{user_id}@example.com',
+            hashed_password='-',
+            is_active=True,
+            is_superuser=False,
+            is_verified=False,
+        ))
+        for user_id in range(2, users + 2)
+    ]
+
+
+async def measure(
+        client,
+        make_request,
+        args: argparse.Namespace,
+        expected: frozenset[int],
+) -> dict:
+    """
+    Выполняет запросы сценария с заданной параллельностью.
+
+    Args:
+        client (httpx.AsyncClient): Клиент приложения.
+        make_request (Callable): Возвращает метод, URL и параметры
+                                 следующего запроса.
+        args (argparse.Namespace): Параметры запуска.
+        expected (frozenset[int]): Ожидаемые коды ответов, остальные
+                                   считаются ошибками.
+
+    Returns:
+        dict: Пропускная способность, задержки и коды ответов.
+    """
+    async def send():
+        method, url, kwargs = make_request()
+        started = time.perf_counter()
+        response = await client.request(method, url, **kwargs)
+        return time.perf_counter() - started, response.status_code
+
+    for _ in range(args.warmup):
+        await send()
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def limited():
+        async with semaphore:
+            return await send()
+
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(limited() for _ in range(args.requests))
+    )
+    elapsed = time.perf_counter() - started
+    latencies = [latency for latency, _ in results]
+    statuses = Counter(status for _, status in results)
+    return {
+        'requests': args.requests,
+        'concurrency': args.concurrency,
+        'seconds': round(elapsed, 3),
+        'requests_per_second': round(args.requests / elapsed, 1),
+        'p50_ms': round(percentile(latencies, 50) * 1000, 2),
+        'p95_ms': round(percentile(latencies, 95) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 2),
+        'statuses': {
+            str(status): count for status, count in sorted(statuses.items())
+        },
+        'errors': sum(
+            count for status, count in statuses.items()
+            if status not in expected
+        ),
+    }
+
+
+async def run(args: argparse.Namespace) -> dict:
+    import httpx
+
+    from app.main import app, lifespan
+
+    rng = random.Random(args.seed)
+    start = datetime.combine(
+        datetime.now().date() + timedelta(days=1), datetime.min.time()
+    )
+    await seed(args, start, rng)
+    seeded_hours = -(-args.reservations // args.rooms)
+    tokens = [
+        {'Authorization': f'Bearer {token}'}
+        for token in await get_user_tokens(args.users)
+    ]
+    free_hours = {
+        room_id: seeded_hours for room_id in range(1, args.rooms + 1)
+    }
+
+    def create_reservation():
+        room_id = rng.randrange(1, args.rooms + 1)
+        if seeded_hours and rng.random() < args.conflict_ratio:
+            hour = rng.randrange(seeded_hours)
+        else:
+            hour = free_hours[room_id]
+            free_hours[room_id] += 1
+        from_reserve = start + timedelta(hours=hour, minutes=10)
+        return 'POST', '/reservations/', {
+            'json': {
+                'meetingroom_id': room_id,
+                'from_reserve': from_reserve.isoformat(),
+                'to_reserve': (
+                    from_reserve + timedelta(minutes=30)
+                ).isoformat(),
+            },
+            'headers': rng.choice(tokens),
+        }
+
+    def room_listing():
+        return 'GET', '/meeting_rooms/', {}
+
+    def my_reservations():
+        return 'GET', '/reservations/my_reservations', {
+            'headers': rng.choice(tokens),
+        }
+
+    async with lifespan(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url='http://benchmark'
+        ) as client:
+            response = await client.post('/auth/jwt/login', data={
+                'username': os.environ['FIRST_SUPERUSER_EMAIL'],
+                'password': os.environ['FIRST_SUPERUSER_PASSWORD'],
+            })
+            response.raise_for_status()
+            superuser = {
+                'Authorization': f'Bearer {response.json()["access_token"]}'
+            }
+            report_window = timedelta(days=args.report_days)
+            report_hours = max(
+                0, seeded_hours - int(report_window.total_seconds() // 3600)
+            )
+
+            def report_aggregation():
+                from_reserve = start + timedelta(
+                    hours=rng.randrange(report_hours + 1)
+                )
+                return 'GET', '/reservations/statistics', {
+                    'params': {
+                        'from_reserve': from_reserve.isoformat(),
+                        'to_reserve': (
+                            from_reserve + report_window
+                        ).isoformat(),
+                    },
+                    'headers': superuser,
+                }
+
+            scenarios = {
+                'room_listing': (room_listing, {200}),
+                'my_reservations': (my_reservations, {200}),
+                'report_aggregation': (report_aggregation, {200}),
+                'create_reservation': (create_reservation, {200, 422}),
+            }
+            results = {}
+            for name in args.scenarios:
+                make_request, expected = scenarios[name]
+                results[name] = await measure(
+                    client, make_request, args, frozenset(expected)
+                )
+    return results
+
+
+def get_commit() -> str | None:
+    result = subprocess.run(
+        ['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+        capture_output=True, text=True,
+    )
+    return result.stdout.strip() or None
+
+
+def main() -> None:
+    args = parse_args()
+    directory = tempfile.mkdtemp()
+    os.environ.update(
+        APP_DESCRIPTION='benchmark',
+        DATABASE_URL=f'sqlite+aiosqlite:///{directory}/benchmark.sqlite3',
+        FIRST_SUPERUSER_EMAIL='benchmark@example.com',
+        FIRST_SUPERUSER_PASSWORD='benchmark-password',
+    )
+    subprocess.run(
+        [sys.executable, '-m', 'alembic', 'upgrade', 'head'],
+        cwd=ROOT, check=True,
+        capture_output=True,
+    )
+    sys.path.insert(0, str(ROOT))
+    result = {
+        'started_at': datetime.now().isoformat(timespec='seconds'),
+        'commit': get_commit(),
+        'python': platform.python_version(),
+        'parameters': {
+            name: value for name, value in vars(args).items()
+            if name != 'output'
+        },
+        'scenarios': asyncio.run(run(args)),
+    }
+    output = json.dumps(result, indent=2)
+    if args.output is not None:
+        args.output.write_text(output + '\n')
+    print(output)
+
+
+if __name__ == '__main__':
+    main()
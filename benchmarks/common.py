@@ -0,0 +1,19 @@
+"""
+Общие вспомогательные функции нагрузочных сценариев.
+"""
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """
+    Возвращает перцентиль по методу ближайшего ранга.
+
+    Args:
+        values (list[float]): Измеренные значения.
+        percent (float): Перцентиль от 0 до 100.
+
+    Returns:
+        float: Значение, соответствующее перцентилю.
+    """
+    values = sorted(values)
+    index = min(len(values) - 1, round(percent / 100 * (len(values) - 1)))
+    return values[index]
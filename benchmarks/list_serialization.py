@@ -0,0 +1,135 @@
+"""
+Сравнение сериализации списка бронирований.
+
+Сравниваются два способа построить JSON списка бронирований:
+объекты модели с валидацией через response_model и jsonable_encoder,
+как FastAPI делает по умолчанию, и выборка полей строками с
+сериализацией ListSerializer. Выводится число строк в секунду для
+запроса вместе с сериализацией и для одной сериализации.
+
+Пример:
+    python benchmarks/list_serialization.py --rows 20000 --repeat 5
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=10_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    return parser.parse_args()
+
+
+async def seed(rows: int) -> None:
+    from sqlalchemy import insert
+
+    from app.core.db import AsyncSessionLocal
+    from app.models import MeetingRoom, Reservation, User
+
+    start = datetime.now() + timedelta(days=1)
+    async with AsyncSessionLocal() as session:
+        await session.execute(insert(User), [{
+            'id': 1, 'email': 'benchmark@example.com',
+            'hashed_password': '-', 'is_active': True,
+            'is_superuser': False, 'is_verified': False,
+        }])
+        await session.execute(
+            insert(MeetingRoom), [{'id': 1, 'name': 'Benchmark'}]
+        )
+        await session.execute(insert(Reservation), [
+            {
+                'meetingroom_id': 1,
+                'user_id': 1,
+                'from_reserve': start + timedelta(hours=index),
+                'to_reserve': start + timedelta(hours=index, minutes=30),
+            }
+            for index in range(rows)
+        ])
+        await session.commit()
+
+
+def best_rate(rows: int, timings: list[float]) -> float:
+    return round(rows / min(timings))
+
+
+async def run(args: argparse.Namespace) -> dict:
+    from fastapi.encoders import jsonable_encoder
+    from pydantic import TypeAdapter
+
+    from app.api.responses import reservation_list
+    from app.core.db import AsyncSessionLocal
+    from app.crud.reservation import reservation_crud
+    from app.schemas.reservation import ReservationDB
+
+    await seed(args.rows)
+    response_model = TypeAdapter(list[ReservationDB])
+
+    def encode_objects(objs) -> bytes:
+        return json.dumps(jsonable_encoder(
+            response_model.validate_python(objs, from_attributes=True)
+        )).encode()
+
+    def encode_rows(rows) -> bytes:
+        return reservation_list.dump_json(rows)
+
+    variants = {
+        'orm_response_model': (None, encode_objects),
+        'rows_list_serializer': (reservation_list.fields, encode_rows),
+    }
+    result = {'rows': args.rows}
+    payloads = {}
+    for name, (fields, encode) in variants.items():
+        total, serialization = [], []
+        for _ in range(args.repeat):
+            async with AsyncSessionLocal() as session:
+                started = time.perf_counter()
+                objs = await reservation_crud.get_multi(
+                    session, fields=fields
+                )
+                encoded = time.perf_counter()
+                payloads[name] = encode(objs)
+                finished = time.perf_counter()
+            total.append(finished - started)
+            serialization.append(finished - encoded)
+        result[name] = {
+            'rows_per_second': best_rate(args.rows, total),
+            'serialization_rows_per_second': best_rate(
+                args.rows, serialization
+            ),
+        }
+    result['same_payload'] = (
+        json.loads(payloads['orm_response_model'])
+        == json.loads(payloads['rows_list_serializer'])
+    )
+    return result
+
+
+def main() -> None:
+    args = parse_args()
+    directory = tempfile.mkdtemp()
+    os.environ.update(
+        APP_DESCRIPTION='benchmark',
+        DATABASE_URL=f'sqlite+aiosqlite:///{directory}/benchmark.sqlite3',
+    )
+    subprocess.run(
+        [sys.executable, '-m', 'alembic', 'upgrade', 'head'],
+        cwd=ROOT, check=True,
+        capture_output=True,
+    )
+    sys.path.insert(0, str(ROOT))
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == '__main__':
+    main()
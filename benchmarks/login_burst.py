@@ -0,0 +1,106 @@
+"""
+Нагрузочный сценарий: всплеск входов пользователей.
+
+Пока выполняются одновременные входы, в фоне непрерывно запрашивается
+список переговорных комнат. Выводится пропускная способность входа и
+задержки фоновых запросов во время всплеска. Для сравнения хеширования
+в цикле событий и в пуле потоков запустите сценарий с --workers 0 и
+--workers 4.
+
+Пример:
+    python benchmarks/login_burst.py --logins 200 --workers 4
+
+Требует httpx.
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from common import percentile
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--logins', type=int, default=100)
+    parser.add_argument('--concurrency', type=int, default=20)
+    parser.add_argument('--workers', type=int, default=4)
+    return parser.parse_args()
+
+
+async def run(args: argparse.Namespace) -> dict:
+    import httpx
+
+    from app.main import app, lifespan
+
+    async with lifespan(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url='http://benchmark'
+        ) as client:
+            credentials = {
+                'username': os.environ['FIRST_SUPERUSER_EMAIL'],
+                'password': os.environ['FIRST_SUPERUSER_PASSWORD'],
+            }
+            latencies = []
+            burst = asyncio.Event()
+
+            async def poll():
+                while not burst.is_set():
+                    started = time.perf_counter()
+                    await client.get('/meeting_rooms/')
+                    latencies.append(time.perf_counter() - started)
+
+            semaphore = asyncio.Semaphore(args.concurrency)
+
+            async def login():
+                async with semaphore:
+                    response = await client.post(
+                        '/auth/jwt/login', data=credentials
+                    )
+                    response.raise_for_status()
+
+            poller = asyncio.create_task(poll())
+            started = time.perf_counter()
+            await asyncio.gather(*(login() for _ in range(args.logins)))
+            elapsed = time.perf_counter() - started
+            burst.set()
+            await poller
+    return {
+        'password_hash_workers': args.workers,
+        'logins': args.logins,
+        'logins_per_second': round(args.logins / elapsed, 1),
+        'background_requests': len(latencies),
+        'background_p50_ms': round(percentile(latencies, 50) * 1000, 2),
+        'background_p99_ms': round(percentile(latencies, 99) * 1000, 2),
+    }
+
+
+def main() -> None:
+    args = parse_args()
+    directory = tempfile.mkdtemp()
+    os.environ.update(
+        APP_DESCRIPTION='benchmark',
+        DATABASE_URL=f'sqlite+aiosqlite:///{directory}/benchmark.sqlite3',
+        FIRST_SUPERUSER_EMAIL='benchmark@example.com',
+        FIRST_SUPERUSER_PASSWORD='benchmark-password',
+        PASSWORD_HASH_WORKERS=str(args.workers),
+    )
+    subprocess.run(
+        [sys.executable, '-m', 'alembic', 'upgrade', 'head'],
+        cwd=ROOT, check=True,
+        capture_output=True,
+    )
+    sys.path.insert(0, str(ROOT))
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import httpx
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+DIRECTORY = tempfile.mkdtemp()
+
+os.environ.pop('DATABASE_READ_URL', None)
+os.environ.update(
+    APP_DESCRIPTION='test',
+    DATABASE_URL=f'sqlite+aiosqlite:///{DIRECTORY}/test.sqlite3',
+    SECRET='test-secret',
+    FIRST_SUPERUSER_EMAIL='admin@example.com',
+    FIRST_SUPERUSER_PASSWORD='admin-password',
+    ARGON2_TIME_COST='1',
+    ARGON2_MEMORY_COST='1024',
+    ARGON2_PARALLELISM='1',
+)
+
+SUPERUSER_EMAIL = os.environ['FIRST_SUPERUSER_EMAIL']
+SUPERUSER_PASSWORD = os.environ['FIRST_SUPERUSER_PASSWORD']
+USER_PASSWORD = 'user-password'
+
+
+def migrate(database_url: str) -> None:
+    subprocess.run(
+        [sys.executable, '-m', 'alembic', 'upgrade', 'head'], cwd=ROOT,
+        check=True, capture_output=True,
+        env={**os.environ, 'DATABASE_URL': database_url},
+    )
+
+
+def pytest_configure(config):
+    migrate(os.environ['DATABASE_URL'])
+
+
+async def clear_database() -> None:
+    """
+    Удаляет данные, созданные тестом, и сбрасывает кеши процесса.
+    """
+    from sqlalchemy import delete
+
+    from app.core.db import AsyncSessionLocal, engine
+    from app.core.user import user_cache
+    from app.crud.meeting_room import meeting_room_crud
+    from app.models import (
+        MeetingRoom, Reservation, ReservationSeries, RoomOccupancy, User
+    )
+
+    async with AsyncSessionLocal() as session:
+        for model in (
+            Reservation, ReservationSeries, RoomOccupancy, MeetingRoom
+        ):
+            await session.execute(delete(model))
+        await session.execute(delete(User).where(User.is_superuser.is_(False)))
+        await session.commit()
+    await meeting_room_crud.cache.invalidate()
+    await user_cache.invalidate()
+    await engine.dispose()
+
+
+@pytest.fixture
+def anyio_backend():
+    return 'asyncio'
+
+
+@pytest.fixture
+def asgi_app():
+    from app.main import app
+
+    return app
+
+
+@pytest.fixture
+async def client(asgi_app):
+    from app.main import app, lifespan
+
+    async with lifespan(app):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=asgi_app),
+            base_url='http://test',
+        ) as client:
+            yield client
+    await clear_database()
+
+
+async def login(client: httpx.AsyncClient, email: str, password: str) -> dict:
+    response = await client.post('/auth/jwt/login', data={
+        'username': email, 'password': password,
+    })
+    response.raise_for_status()
+    return {'Authorization': f'Bearer {response.json()["access_token"]}'}
+
+
+@pytest.fixture
+async def superuser_headers(client):
+    return await login(client, SUPERUSER_EMAIL, SUPERUSER_PASSWORD)
+
+
+@pytest.fixture
+def make_user(client):
+    """
+    Регистрирует пользователя и возвращает заголовки с его токеном.
+    """
+    async def make_user(email: str) -> dict:
+        response = await client.post('/auth/register', json={
+            'email': email, 'password': USER_PASSWORD,
+        })
+        response.raise_for_status()
+        return await login(client, email, USER_PASSWORD)
+
+    return make_user
+
+
+@pytest.fixture
+async def room(client, superuser_headers):
+    response = await client.post(
+        '/meeting_rooms/', json={'name': 'Test room'},
+        headers=superuser_headers,
+    )
+    response.raise_for_status()
+    return response.json()
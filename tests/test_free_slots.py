@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.services.interval_index import (
+    IndexedReservation, ReservationIntervalIndex
+)
+
+pytestmark = pytest.mark.anyio
+
+DAY = datetime.combine(
+    datetime.now().date() + timedelta(days=1), datetime.min.time()
+)
+
+
+def get_interval(from_hour: int, to_hour: int) -> dict:
+    return {
+        'from_reserve': (DAY + timedelta(hours=from_hour)).isoformat(),
+        'to_reserve': (DAY + timedelta(hours=to_hour)).isoformat(),
+    }
+
+
+async def test_returned_free_slots_can_be_booked(client, room, make_user):
+    headers = await make_user('owner@example.com')
+    response = await client.post('/reservations/', json={
+        'meetingroom_id': room['id'], **get_interval(10, 11),
+    }, headers=headers)
+    response.raise_for_status()
+    response = await client.post('/reservations/series', json={
+        'meetingroom_id': room['id'], **get_interval(13, 14),
+        'frequency': 'daily', 'count': 2,
+    }, headers=headers)
+    response.raise_for_status()
+
+    response = await client.get(
+        '/meeting_rooms/free_slots', params=get_interval(9, 15)
+    )
+    response.raise_for_status()
+    [result] = response.json()
+    assert result['meetingroom_id'] == room['id']
+    assert result['slots'] == [
+        get_interval(9, 10), get_interval(11, 13), get_interval(14, 15),
+    ]
+    for slot in result['slots']:
+        response = await client.post('/reservations/', json={
+            'meetingroom_id': room['id'], **slot,
+        }, headers=headers)
+        assert response.status_code == 200, response.json()
+
+
+async def test_touching_reservation_is_not_a_conflict(
+        client, room, make_user
+):
+    headers = await make_user('owner@example.com')
+    for interval in (get_interval(10, 11), get_interval(11, 12)):
+        response = await client.post('/reservations/', json={
+            'meetingroom_id': room['id'], **interval,
+        }, headers=headers)
+        assert response.status_code == 200, response.json()
+
+    response = await client.post('/reservations/', json={
+        'meetingroom_id': room['id'], **get_interval(10, 12),
+    }, headers=headers)
+    assert response.status_code == 422
+
+
+async def test_interval_index_ignores_touching_reservations():
+    index = ReservationIntervalIndex()
+    for reservation_id, (from_hour, to_hour) in enumerate(((9, 10), (11, 12))):
+        index.add(IndexedReservation(
+            id=reservation_id,
+            meetingroom_id=1,
+            from_reserve=DAY + timedelta(hours=from_hour),
+            to_reserve=DAY + timedelta(hours=to_hour),
+        ))
+
+    assert index.get_reservations_at_the_same_time(
+        from_reserve=DAY + timedelta(hours=10),
+        to_reserve=DAY + timedelta(hours=11),
+        meetingroom_id=1,
+    ) == []
+    assert len(index.get_reservations_at_the_same_time(
+        from_reserve=DAY + timedelta(hours=9, minutes=59),
+        to_reserve=DAY + timedelta(hours=11, minutes=1),
+        meetingroom_id=1,
+    )) == 2
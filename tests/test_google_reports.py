@@ -0,0 +1,258 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from aiohttp import web
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from app.core.config import settings
+
+pytestmark = pytest.mark.anyio
+
+DISCONNECT = 'disconnect'
+
+FROM_RESERVE = datetime.combine(
+    datetime.now().date() + timedelta(days=1), datetime.min.time()
+)
+
+
+def get_discovery_document(
+        base_url: str,
+        name: str,
+        version: str,
+        service_path: str,
+        resources: dict,
+) -> dict:
+    return {
+        'kind': 'discovery#restDescription',
+        'name': name,
+        'version': version,
+        'rootUrl': f'{base_url}/',
+        'servicePath': service_path,
+        'batchPath': 'batch',
+        'parameters': {},
+        'schemas': {'Body': {'id': 'Body', 'type': 'object'}},
+        'resources': resources,
+    }
+
+
+def get_method(path: str, **parameters: str) -> dict:
+    return {
+        'path': path,
+        'httpMethod': 'POST',
+        'parameters': {
+            name: {
+                'type': 'string',
+                'location': location,
+                'required': location == 'path',
+            }
+            for name, location in parameters.items()
+        },
+        'parameterOrder': [
+            name for name, location in parameters.items()
+            if location == 'path'
+        ],
+        'request': {'$ref': 'Body'},
+    }
+
+
+class FakeGoogle:
+    """
+    Локальный HTTP-сервер с описаниями и методами Google API, которые
+    использует построение отчетов.
+
+    Attributes:
+        requests (list[tuple[str, dict | None]]): Принятые запросы: путь и
+                                                  тело JSON.
+        failures (dict[str, list]): Ответы, которые вернутся до успешного
+                    ответа, по пути запроса: код статуса или DISCONNECT
+                    для обрыва соединения после выполнения запроса.
+    """
+
+    def __init__(self):
+        self.requests: list[tuple[str, dict | None]] = []
+        self.failures: dict[str, list] = {}
+        self.base_url = ''
+        self.app = web.Application()
+        self.app.router.add_get(
+            '/discovery/{api}/{api_version}', self.discovery
+        )
+        self.app.router.add_post('/token', self.token)
+        self.app.router.add_post('/{path:.*}', self.method)
+
+    async def discovery(self, request: web.Request) -> web.Response:
+        api = request.match_info['api']
+        if api == 'sheets':
+            return web.json_response(get_discovery_document(
+                self.base_url, 'sheets', 'v4', '', {'spreadsheets': {
+                    'methods': {'create': get_method('v4/spreadsheets')},
+                    'resources': {'values': {'methods': {
+                        'batchUpdate': get_method(
+                            'v4/spreadsheets/{spreadsheetId}'
+                            '/values:batchUpdate',
+                            spreadsheetId='path',
+                        ),
+                    }}},
+                }},
+            ))
+        return web.json_response(get_discovery_document(
+            self.base_url, 'drive', 'v3', 'drive/v3/', {'permissions': {
+                'methods': {'create': get_method(
+                    'files/{fileId}/permissions',
+                    fileId='path',
+                    fields='query',
+                )},
+            }},
+        ))
+
+    async def token(self, request: web.Request) -> web.Response:
+        self.requests.append((request.path, None))
+        return web.json_response({
+            'access_token': 'token', 'expires_in': 3600,
+            'token_type': 'Bearer',
+        })
+
+    async def method(self, request: web.Request) -> web.Response:
+        self.requests.append((request.path, await request.json()))
+        failures = self.failures.get(request.path)
+        if failures:
+            failure = failures.pop(0)
+            if failure == DISCONNECT:
+                request.transport.close()
+            else:
+                return web.json_response({}, status=failure)
+        if request.path == '/v4/spreadsheets':
+            return web.json_response({'spreadsheetId': 'spreadsheet-1'})
+        return web.json_response({'id': 'result'})
+
+    def get_paths(self) -> list[str]:
+        return [path for path, _ in self.requests if path != '/token']
+
+
+def get_private_key() -> str:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+
+
+@pytest.fixture
+async def fake_google(monkeypatch):
+    server = FakeGoogle()
+    runner = web.AppRunner(server.app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    server.base_url = f'http://127.0.0.1:{port}'
+    for name, value in {
+        'type': 'service_account',
+        'project_id': 'test',
+        'private_key_id': 'test',
+        'private_key': get_private_key(),
+        'client_email': 'service@test.iam.gserviceaccount.com',
+        'client_id': '1',
+        'token_uri': f'{server.base_url}/token',
+        'email': 'owner@example.com',
+        'google_discovery_url': (
+            f'{server.base_url}/discovery/{{api}}/{{api_version}}'
+        ),
+        'report_retry_backoff': 0,
+    }.items():
+        monkeypatch.setattr(settings, name, value)
+    yield server
+    await runner.cleanup()
+
+
+@pytest.fixture
+def asgi_app(fake_google):
+    from app.main import app
+
+    return app
+
+
+async def build_report(client, headers: dict) -> dict:
+    response = await client.post('/google/', params={
+        'from_reserve': FROM_RESERVE.isoformat(),
+        'to_reserve': (FROM_RESERVE + timedelta(days=1)).isoformat(),
+    }, headers=headers)
+    assert response.status_code == 202, response.json()
+    job_id = response.json()['id']
+    for _ in range(100):
+        response = await client.get(f'/google/{job_id}', headers=headers)
+        job = response.json()
+        if job['status'] in ('succeeded', 'failed'):
+            return job
+        await asyncio.sleep(0.05)
+    raise AssertionError(f'Отчет не построен: {job}')
+
+
+async def test_report_is_written_to_spreadsheet(
+        client, fake_google, room, superuser_headers
+):
+    response = await client.post('/reservations/', json={
+        'meetingroom_id': room['id'],
+        'from_reserve': (FROM_RESERVE + timedelta(hours=10)).isoformat(),
+        'to_reserve': (FROM_RESERVE + timedelta(hours=12)).isoformat(),
+    }, headers=superuser_headers)
+    response.raise_for_status()
+
+    job = await build_report(client, superuser_headers)
+
+    assert job['status'] == 'succeeded', job
+    assert job['spreadsheet_id'] == 'spreadsheet-1'
+    assert fake_google.get_paths() == [
+        '/v4/spreadsheets',
+        '/drive/v3/files/spreadsheet-1/permissions',
+        '/v4/spreadsheets/spreadsheet-1/values:batchUpdate',
+    ]
+    bodies = dict(fake_google.requests)
+    assert bodies['/drive/v3/files/spreadsheet-1/permissions'][
+        'emailAddress'
+    ] == 'owner@example.com'
+    [value_range] = bodies[
+        '/v4/spreadsheets/spreadsheet-1/values:batchUpdate'
+    ]['data']
+    assert value_range['values'][3][:3] == [str(room['id']), '1', '2.0']
+
+
+async def test_transient_error_is_retried(
+        client, fake_google, superuser_headers
+):
+    fake_google.failures['/drive/v3/files/spreadsheet-1/permissions'] = [
+        503
+    ]
+
+    job = await build_report(client, superuser_headers)
+
+    assert job['status'] == 'succeeded', job
+    assert job['attempts'] == 1
+    assert fake_google.get_paths().count(
+        '/drive/v3/files/spreadsheet-1/permissions'
+    ) == 2
+
+
+async def test_rejected_spreadsheet_create_is_retried(
+        client, fake_google, superuser_headers
+):
+    fake_google.failures['/v4/spreadsheets'] = [429]
+
+    job = await build_report(client, superuser_headers)
+
+    assert job['status'] == 'succeeded', job
+    assert fake_google.get_paths().count('/v4/spreadsheets') == 2
+
+
+async def test_spreadsheet_create_is_not_retried_after_disconnect(
+        client, fake_google, superuser_headers
+):
+    fake_google.failures['/v4/spreadsheets'] = [DISCONNECT]
+
+    job = await build_report(client, superuser_headers)
+
+    assert job['status'] == 'failed', job
+    assert job['stage'] == 'creating_spreadsheet'
+    assert fake_google.get_paths() == ['/v4/spreadsheets']
@@ -0,0 +1,75 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core.db import AsyncSessionLocal
+from app.models import Reservation
+from app.services.interval_index import reservation_index
+
+pytestmark = pytest.mark.anyio
+
+FROM_RESERVE = datetime.combine(
+    datetime.now().date() + timedelta(days=1), datetime.min.time()
+)
+INTERVAL = {
+    'from_reserve': FROM_RESERVE.isoformat(),
+    'to_reserve': (FROM_RESERVE + timedelta(hours=1)).isoformat(),
+}
+
+
+@pytest.fixture
+async def index():
+    async with AsyncSessionLocal() as session:
+        await reservation_index.build(session)
+    yield reservation_index
+    reservation_index.rooms = {}
+    reservation_index.ready = False
+
+
+async def test_removed_room_reservations_leave_interval_index(
+        client, superuser_headers, make_user, index
+):
+    headers = await make_user('owner@example.com')
+    response = await client.post(
+        '/meeting_rooms/', json={'name': 'Removed room'},
+        headers=superuser_headers,
+    )
+    room_id = response.json()['id']
+    response = await client.post('/reservations/', json={
+        'meetingroom_id': room_id, **INTERVAL,
+    }, headers=headers)
+    response.raise_for_status()
+
+    response = await client.delete(
+        f'/meeting_rooms/{room_id}', headers=superuser_headers
+    )
+    response.raise_for_status()
+
+    assert room_id not in index.rooms
+    response = await client.post(
+        '/meeting_rooms/', json={'name': 'New room'},
+        headers=superuser_headers,
+    )
+    response = await client.post('/reservations/', json={
+        'meetingroom_id': response.json()['id'], **INTERVAL,
+    }, headers=headers)
+    assert response.status_code == 200, response.json()
+
+
+async def test_stale_index_entry_is_not_a_conflict(
+        client, room, make_user, index
+):
+    headers = await make_user('owner@example.com')
+    index.add(Reservation(
+        id=10 ** 6,
+        meetingroom_id=room['id'],
+        from_reserve=FROM_RESERVE,
+        to_reserve=FROM_RESERVE + timedelta(hours=1),
+    ))
+
+    response = await client.post('/reservations/', json={
+        'meetingroom_id': room['id'], **INTERVAL,
+    }, headers=headers)
+
+    assert response.status_code == 200, response.json()
+    assert 10 ** 6 not in index.rooms[room['id']].items
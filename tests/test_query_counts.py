@@ -0,0 +1,124 @@
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app.core.db import engine
+
+pytestmark = pytest.mark.anyio
+
+FROM_RESERVE = datetime.combine(
+    datetime.now().date() + timedelta(days=1), datetime.min.time()
+)
+
+
+def get_interval(hour: int) -> dict:
+    from_reserve = FROM_RESERVE + timedelta(hours=hour)
+    return {
+        'from_reserve': from_reserve.isoformat(),
+        'to_reserve': (from_reserve + timedelta(minutes=30)).isoformat(),
+    }
+
+
+@contextmanager
+def count_queries():
+    """
+    Собирает тексты запросов к базе данных, выполненных внутри контекста.
+    """
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(' '.join(statement.split()))
+
+    event.listen(engine.sync_engine, 'before_cursor_execute', capture)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, 'before_cursor_execute', capture)
+
+
+async def test_write_query_counts(client, room, superuser_headers, make_user):
+    headers = await make_user('owner@example.com')
+
+    with count_queries() as statements:
+        response = await client.post('/reservations/', json={
+            'meetingroom_id': room['id'], **get_interval(10),
+        }, headers=headers)
+    assert response.status_code == 200
+    # Пользователь, комната, BEGIN IMMEDIATE, пересечения с бронированиями
+    # и сериями, INSERT ... RETURNING, занятость.
+    assert len(statements) == 7, statements
+    reservation_id = response.json()['id']
+
+    with count_queries() as statements:
+        response = await client.delete(
+            f'/reservations/{reservation_id}', headers=headers
+        )
+    assert response.status_code == 200
+    # Пользователь, DELETE ... RETURNING, занятость, удаление пустых часов.
+    assert len(statements) == 4, statements
+
+    with count_queries() as statements:
+        response = await client.patch(
+            f'/meeting_rooms/{room["id"]}', json={'name': 'Renamed room'},
+            headers=superuser_headers,
+        )
+    assert response.status_code == 200
+    # Пользователь, проверка имени, UPDATE ... RETURNING.
+    assert len(statements) == 3, statements
+
+
+async def test_update_query_count(client, room, make_user):
+    """
+    Изменение бронирования выполняет шесть запросов:
+
+    1. SELECT пользователя по токену — зависимость current_user;
+    2. BEGIN IMMEDIATE — блокировка записи SQLite, без которой проверка
+       пересечений и запись не атомарны;
+    3. SELECT бронирования с условием на владельца и признаками
+       пересечения с другими бронированиями и сериями комнаты — чтение
+       прежнего интервала и все проверки одним запросом;
+    4. UPDATE бронирования;
+    5. upsert разницы прежнего и нового интервала в занятости;
+    6. DELETE часов занятости, ставших пустыми после переноса.
+
+    Прежний интервал нужен для занятости, а UPDATE ... RETURNING
+    возвращает только новые значения, поэтому чтение и запись остаются
+    отдельными запросами. Вхождения серий читаются отдельно только если
+    серия комнаты действует в новом периоде.
+    """
+    headers = await make_user('owner@example.com')
+    reservation_ids = []
+    for hour in (10, 14):
+        response = await client.post('/reservations/', json={
+            'meetingroom_id': room['id'], **get_interval(hour),
+        }, headers=headers)
+        reservation_ids.append(response.json()['id'])
+
+    with count_queries() as statements:
+        response = await client.patch(
+            f'/reservations/{reservation_ids[0]}', json=get_interval(12),
+            headers=headers,
+        )
+
+    assert response.status_code == 200
+    assert len(statements) == 6, statements
+    assert sum(
+        'FROM reservation ' in statement for statement in statements
+    ) == 1
+    response = await client.patch(
+        f'/reservations/{reservation_ids[0]}', json=get_interval(14),
+        headers=headers,
+    )
+    assert response.status_code == 422
+    response = await client.post('/reservations/series', json={
+        'meetingroom_id': room['id'], **get_interval(16),
+        'frequency': 'daily', 'count': 2,
+    }, headers=headers)
+    response.raise_for_status()
+    response = await client.patch(
+        f'/reservations/{reservation_ids[0]}', json=get_interval(16),
+        headers=headers,
+    )
+    assert response.status_code == 422
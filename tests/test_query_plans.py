@@ -0,0 +1,122 @@
+import re
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app.core.db import AsyncSessionLocal, engine
+from app.crud.reservation import reservation_crud
+from app.crud.reservation_series import reservation_series_crud
+from app.crud.room_occupancy import room_occupancy_crud
+from app.models import User
+
+pytestmark = pytest.mark.anyio
+
+FROM_RESERVE = datetime(2030, 1, 1, 10)
+TO_RESERVE = FROM_RESERVE + timedelta(hours=1)
+
+
+@pytest.fixture
+async def get_query_plans():
+    """
+    Выполняет запросы функции и возвращает планы SQLite для тех из них,
+    которые читают указанную таблицу.
+    """
+    async def get_query_plans(call, table: str) -> list[str]:
+        statements = []
+
+        def capture(
+                conn, cursor, statement, parameters, context, executemany
+        ):
+            if (statement.lstrip().startswith(('SELECT', 'WITH'))
+                    and re.search(rf'\bFROM {table}\b', statement)):
+                statements.append((statement, parameters))
+
+        event.listen(engine.sync_engine, 'before_cursor_execute', capture)
+        try:
+            async with AsyncSessionLocal() as session:
+                await call(session)
+        finally:
+            event.remove(engine.sync_engine, 'before_cursor_execute', capture)
+        plans = []
+        async with engine.connect() as connection:
+            for statement, parameters in statements:
+                rows = await connection.exec_driver_sql(
+                    f'EXPLAIN QUERY PLAN {statement}', parameters
+                )
+                plans.append([row[3] for row in rows])
+        return plans
+
+    yield get_query_plans
+    await engine.dispose()
+
+
+@pytest.mark.parametrize('call, table, index', [
+    (
+        lambda session: reservation_crud.get_reservations_at_the_same_time(
+            from_reserve=FROM_RESERVE,
+            to_reserve=TO_RESERVE,
+            meetingroom_id=1,
+            session=session,
+        ),
+        'reservation',
+        'ix_reservation_meetingroom_id_',
+    ),
+    (
+        lambda session: reservation_crud.get_future_reservations_for_room(
+            1, session
+        ),
+        'reservation',
+        'ix_reservation_meetingroom_id_',
+    ),
+    (
+        lambda session: reservation_crud.get_intervals_for_rooms(
+            [1, 2], FROM_RESERVE, TO_RESERVE, session
+        ),
+        'reservation',
+        'ix_reservation_meetingroom_id_',
+    ),
+    (
+        lambda session: reservation_crud.get_intervals_in_window(
+            FROM_RESERVE, TO_RESERVE, session
+        ),
+        'reservation',
+        # Покрывающий индекс отдает строки в порядке сортировки ответа.
+        'ix_reservation_meetingroom_id_from_reserve_to_reserve',
+    ),
+    (
+        lambda session: reservation_crud.get_by_user(
+            session, User(id=1)
+        ),
+        'reservation',
+        'ix_reservation_user_id',
+    ),
+    (
+        lambda session: reservation_series_crud.get_series_in_window(
+            from_reserve=FROM_RESERVE,
+            to_reserve=TO_RESERVE,
+            meetingroom_ids=[1],
+            session=session,
+        ),
+        'reservationseries',
+        'ix_reservationseries_room_interval',
+    ),
+    (
+        lambda session: room_occupancy_crud.get_hourly_occupancy(
+            FROM_RESERVE.date(), TO_RESERVE.date(), session
+        ),
+        'roomoccupancy',
+        'ix_roomoccupancy_day',
+    ),
+])
+async def test_queries_use_indexes(get_query_plans, call, table, index):
+    plans = await get_query_plans(call, table)
+
+    assert plans
+    for plan in plans:
+        details = [
+            detail for detail in plan
+            if re.search(rf'\b{table}\b', detail)
+        ]
+        assert details, plan
+        assert all(index in detail for detail in details), plan
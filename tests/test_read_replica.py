@@ -0,0 +1,92 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core import db
+from app.core.config import settings
+from app.core.db import ReadYourWritesMiddleware, make_engine, read_routing
+from app.models import MeetingRoom
+from tests.conftest import DIRECTORY, migrate
+
+pytestmark = pytest.mark.anyio
+
+REPLICA_URL = f'sqlite+aiosqlite:///{DIRECTORY}/replica.sqlite3'
+
+FROM_RESERVE = datetime.combine(
+    datetime.now().date() + timedelta(days=1), datetime.min.time()
+)
+
+
+@pytest.fixture(scope='module')
+def replica_url():
+    migrate(REPLICA_URL)
+    return REPLICA_URL
+
+
+@pytest.fixture
+async def replica(replica_url, monkeypatch):
+    """
+    Направляет маршруты чтения в отдельный файл SQLite, в который
+    изменения основной базы не реплицируются.
+    """
+    read_engine = make_engine(replica_url)
+    monkeypatch.setattr(settings, 'database_read_url', replica_url)
+    monkeypatch.setattr(
+        db, 'AsyncReadSessionLocal',
+        async_sessionmaker(read_engine, expire_on_commit=False),
+    )
+    yield read_engine
+    reset_routing()
+    await read_engine.dispose()
+
+
+@pytest.fixture
+def asgi_app(replica):
+    from app.main import app
+
+    return ReadYourWritesMiddleware(app)
+
+
+def reset_routing() -> None:
+    read_routing.pinned_until.clear()
+    read_routing.all_pinned_until = 0.0
+
+
+async def get_room_reservations(client, room_id: int, headers: dict) -> list:
+    response = await client.get(
+        f'/meeting_rooms/{room_id}/reservations', headers=headers
+    )
+    assert response.status_code == 200, response.json()
+    return response.json()
+
+
+async def test_reads_follow_pinning(
+        client, replica, room, superuser_headers, make_user
+):
+    async with replica.begin() as connection:
+        await connection.execute(insert(MeetingRoom), [room])
+    writer = await make_user('writer@example.com')
+    reader = await make_user('reader@example.com')
+    reset_routing()
+
+    response = await client.post('/reservations/', json={
+        'meetingroom_id': room['id'],
+        'from_reserve': FROM_RESERVE.isoformat(),
+        'to_reserve': (FROM_RESERVE + timedelta(hours=1)).isoformat(),
+    }, headers=writer)
+    response.raise_for_status()
+
+    assert len(await get_room_reservations(client, room['id'], writer)) == 1
+    assert await get_room_reservations(client, room['id'], reader) == []
+
+    reset_routing()
+    assert await get_room_reservations(client, room['id'], writer) == []
+
+    response = await client.patch(
+        f'/meeting_rooms/{room["id"]}', json={'name': 'Renamed room'},
+        headers=superuser_headers,
+    )
+    response.raise_for_status()
+    assert len(await get_room_reservations(client, room['id'], reader)) == 1
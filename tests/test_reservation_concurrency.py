@@ -0,0 +1,84 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from app.core.db import AsyncSessionLocal
+from app.models import Reservation
+
+pytestmark = pytest.mark.anyio
+
+START = datetime.combine(
+    datetime.now().date() + timedelta(days=1), datetime.min.time()
+)
+
+
+def get_interval(minutes: int, duration: int = 30) -> dict:
+    from_reserve = START + timedelta(minutes=minutes)
+    return {
+        'from_reserve': from_reserve.isoformat(),
+        'to_reserve': (from_reserve + timedelta(minutes=duration)).isoformat(),
+    }
+
+
+async def get_reservations(room_id: int) -> list[Reservation]:
+    async with AsyncSessionLocal() as session:
+        return list(await session.scalars(
+            select(Reservation).where(Reservation.meetingroom_id == room_id)
+            .order_by(Reservation.from_reserve)
+        ))
+
+
+async def test_concurrent_overlapping_creates_do_not_double_book(
+        client, room, make_user
+):
+    headers = [
+        await make_user(f'user{index}@example.com') for index in range(4)
+    ]
+
+    responses = await asyncio.gather(*(
+        client.post('/reservations/', json={
+            'meetingroom_id': room['id'], **get_interval(index % 50 * 5),
+        }, headers=headers[index % len(headers)])
+        for index in range(200)
+    ))
+
+    statuses = {response.status_code for response in responses}
+    assert statuses <= {200, 422}
+    reservations = await get_reservations(room['id'])
+    assert reservations
+    assert sum(
+        response.status_code == 200 for response in responses
+    ) == len(reservations)
+    for previous, current in zip(reservations, reservations[1:]):
+        assert previous.to_reserve <= current.from_reserve
+
+
+async def test_concurrent_update_and_delete_do_not_fail(
+        client, room, make_user
+):
+    headers = await make_user('owner@example.com')
+    ids = []
+    for index in range(20):
+        response = await client.post('/reservations/', json={
+            'meetingroom_id': room['id'], **get_interval(index * 60),
+        }, headers=headers)
+        response.raise_for_status()
+        ids.append(response.json()['id'])
+
+    responses = await asyncio.gather(*(
+        request
+        for index, reservation_id in enumerate(ids)
+        for request in (
+            client.patch(
+                f'/reservations/{reservation_id}',
+                json=get_interval(index * 60 + 10),
+                headers=headers,
+            ),
+            client.delete(f'/reservations/{reservation_id}', headers=headers),
+        )
+    ))
+
+    assert {response.status_code for response in responses} <= {200, 404}
+    assert await get_reservations(room['id']) == []
@@ -0,0 +1,30 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+FROM_RESERVE = datetime.combine(
+    datetime.now().date() + timedelta(days=1), datetime.min.time()
+)
+
+
+@pytest.mark.parametrize('bounds', [
+    {'count': 10 ** 7},
+    {'count': 10, 'interval': 10 ** 9},
+    {'count': 2, 'interval': 10 ** 6},
+])
+async def test_series_beyond_date_range_is_rejected(
+        client, room, make_user, bounds
+):
+    headers = await make_user('owner@example.com')
+
+    response = await client.post('/reservations/series', json={
+        'meetingroom_id': room['id'],
+        'from_reserve': FROM_RESERVE.isoformat(),
+        'to_reserve': (FROM_RESERVE + timedelta(hours=1)).isoformat(),
+        'frequency': 'weekly',
+        **bounds,
+    }, headers=headers)
+
+    assert response.status_code == 422
@@ -0,0 +1,129 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from starlette.testclient import TestClient
+
+from app.core.config import settings
+from app.schemas.event import RoomEvent, RoomEventType
+from app.services.events import InMemoryEventBroker, RoomEventFeed
+from tests.conftest import (
+    SUPERUSER_EMAIL, SUPERUSER_PASSWORD, clear_database
+)
+
+START = datetime.combine(
+    datetime.now().date() + timedelta(days=1), datetime.min.time()
+)
+
+
+async def read_all(subscription) -> list[str]:
+    return [message async for message in subscription]
+
+
+@pytest.fixture
+def sync_client():
+    """
+    Синхронный клиент приложения с поддержкой WebSocket.
+    """
+    from app.main import app
+
+    with TestClient(app) as client:
+        yield client
+        client.portal.call(clear_database)
+
+
+@pytest.mark.anyio
+async def test_overflow_closes_subscription():
+    broker = InMemoryEventBroker(queue_size=2)
+    subscription = broker.subscribe('room')
+    for message in ('first', 'second', 'third', 'fourth'):
+        await broker.publish('room', message)
+
+    assert subscription.overflowed
+    assert subscription.closed
+    assert await read_all(subscription) == ['first', 'second']
+
+
+@pytest.mark.anyio
+async def test_unsubscribe_removes_subscription():
+    broker = InMemoryEventBroker(queue_size=2)
+    first = broker.subscribe('room')
+    second = broker.subscribe('room')
+
+    broker.unsubscribe(first)
+    await broker.publish('room', 'message')
+    assert broker.subscriptions == {'room': {second}}
+    assert await read_all(first) == []
+
+    broker.unsubscribe(second)
+    assert broker.subscriptions == {}
+    assert await read_all(second) == ['message']
+
+
+@pytest.mark.anyio
+async def test_feed_overflows_at_queue_size(monkeypatch):
+    monkeypatch.setattr(settings, 'room_event_queue_size', 3)
+    feed = RoomEventFeed()
+    await feed.start()
+    event = RoomEvent(
+        type=RoomEventType.reservation_created, meetingroom_id=1, data={}
+    )
+    other_room = event.model_copy(update={'meetingroom_id': 2})
+
+    async with feed.subscribe(1) as subscription:
+        for _ in range(settings.room_event_queue_size):
+            await feed.publish(event)
+            await feed.publish(other_room)
+        assert not subscription.overflowed
+        await feed.publish(event)
+        assert subscription.overflowed
+    assert feed.broker.subscriptions == {}
+    assert len(await read_all(subscription)) == 3
+
+    await feed.stop()
+    assert feed.broker is None
+
+
+def test_websocket_receives_reservation_events(sync_client):
+    response = sync_client.post('/auth/jwt/login', data={
+        'username': SUPERUSER_EMAIL, 'password': SUPERUSER_PASSWORD,
+    })
+    response.raise_for_status()
+    headers = {
+        'Authorization': f'Bearer {response.json()["access_token"]}'
+    }
+    response = sync_client.post(
+        '/meeting_rooms/', json={'name': 'Test room'}, headers=headers,
+    )
+    response.raise_for_status()
+    room_id = response.json()['id']
+
+    with sync_client.websocket_connect(
+        f'/meeting_rooms/{room_id}/reservations/ws'
+    ) as websocket:
+        response = sync_client.post('/reservations/', json={
+            'meetingroom_id': room_id,
+            'from_reserve': START.isoformat(),
+            'to_reserve': (START + timedelta(hours=1)).isoformat(),
+        }, headers=headers)
+        response.raise_for_status()
+        reservation_id = response.json()['id']
+        event = json.loads(websocket.receive_text())
+        assert event['type'] == RoomEventType.reservation_created
+        assert event['meetingroom_id'] == room_id
+        assert event['data']['id'] == reservation_id
+
+        to_reserve = (START + timedelta(hours=2)).isoformat()
+        sync_client.patch(f'/reservations/{reservation_id}', json={
+            'from_reserve': START.isoformat(), 'to_reserve': to_reserve,
+        }, headers=headers).raise_for_status()
+        event = json.loads(websocket.receive_text())
+        assert event['type'] == RoomEventType.reservation_updated
+        assert event['data']['to_reserve'] == to_reserve
+
+        sync_client.delete(
+            f'/reservations/{reservation_id}', headers=headers,
+        ).raise_for_status()
+        event = json.loads(websocket.receive_text())
+        assert event['type'] == RoomEventType.reservation_deleted
+        assert event['data']['id'] == reservation_id
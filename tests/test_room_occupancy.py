@@ -0,0 +1,74 @@
+import asyncio
+import random
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from app.core.db import AsyncSessionLocal
+from app.crud.room_occupancy import room_occupancy_crud
+from app.models import RoomOccupancy
+
+pytestmark = pytest.mark.anyio
+
+START = datetime.combine(
+    datetime.now().date() + timedelta(days=1), datetime.min.time()
+)
+
+
+def get_interval(minutes: int, duration: int) -> dict:
+    from_reserve = START + timedelta(minutes=minutes)
+    return {
+        'from_reserve': from_reserve.isoformat(),
+        'to_reserve': (from_reserve + timedelta(minutes=duration)).isoformat(),
+    }
+
+
+async def get_occupancy() -> list[tuple]:
+    async with AsyncSessionLocal() as session:
+        rows = await session.execute(
+            select(
+                RoomOccupancy.meetingroom_id,
+                RoomOccupancy.day,
+                RoomOccupancy.hour,
+                RoomOccupancy.seconds,
+                RoomOccupancy.count,
+            ).order_by(
+                RoomOccupancy.meetingroom_id,
+                RoomOccupancy.day,
+                RoomOccupancy.hour,
+            )
+        )
+        return [tuple(row) for row in rows]
+
+
+async def test_occupancy_matches_rebuild_after_concurrent_updates(
+        client, room, make_user
+):
+    rng = random.Random(0)
+    headers = await make_user('owner@example.com')
+    ids = []
+    for index in range(10):
+        response = await client.post('/reservations/', json={
+            'meetingroom_id': room['id'], **get_interval(index * 180, 90),
+        }, headers=headers)
+        response.raise_for_status()
+        ids.append(response.json()['id'])
+
+    responses = await asyncio.gather(*(
+        client.patch(
+            f'/reservations/{rng.choice(ids)}',
+            json=get_interval(
+                rng.randrange(0, 30 * 60, 15), rng.randrange(15, 150, 15)
+            ),
+            headers=headers,
+        )
+        for _ in range(100)
+    ))
+
+    assert {response.status_code for response in responses} <= {200, 422}
+    assert any(response.status_code == 200 for response in responses)
+    occupancy = await get_occupancy()
+    async with AsyncSessionLocal() as session:
+        await room_occupancy_crud.rebuild(session)
+    assert occupancy == await get_occupancy()